@@ -0,0 +1,18 @@
+from typing import Any
+
+from bazario.asyncio import HandleNext, PipelineBehavior
+
+from reports.application.common.markers import Query, StreamingQuery
+from reports.application.ports.identity_provider import IdentityProvider
+
+
+class AuthenticationBehavior[Q: Query[Any] | StreamingQuery[Any], R](
+    PipelineBehavior[Q, R]
+):
+    def __init__(self, identity_provider: IdentityProvider) -> None:
+        self._identity_provider = identity_provider
+
+    async def handle(self, request: Q, handle_next: HandleNext[Q, R]) -> R:
+        self._identity_provider.current_user_id()
+
+        return await handle_next(request)
@@ -0,0 +1,9 @@
+from typing import Final
+
+from reports.domain.types import ReportId
+
+REPORT_LIST_TAG: Final[str] = "reports"
+
+
+def report_tag(report_id: ReportId) -> str:
+    return f"report:{report_id}"
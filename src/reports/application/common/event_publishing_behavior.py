@@ -16,7 +16,9 @@ class EventPublishingBehavior[C: Command, R](PipelineBehavior[C, R]):
     async def handle(self, request: C, handle_next: HandleNext[C, R]) -> R:
         response = await handle_next(request)
 
-        for event in self._events_raiser.raise_events():
-            await self._publisher.publish(event)
+        # Handlers may raise follow-up events, so drain until nothing is left.
+        while events := list(self._events_raiser.raise_events()):
+            for event in events:
+                await self._publisher.publish(event)
 
         return response
@@ -9,3 +9,15 @@ class Command[TRes](Request[TRes]): ...
 
 @dataclass(frozen=True)
 class Query[TRes](Request[TRes]): ...
+
+
+@dataclass(frozen=True)
+class CachedQuery[TRes](Query[TRes]):
+    def cache_tags(self) -> frozenset[str]:
+        return frozenset()
+
+
+# Returns an iterator consumed after the handler exits, so it is never cached
+# or shared between callers.
+@dataclass(frozen=True)
+class StreamingQuery[TRes](Request[TRes]): ...
@@ -1,4 +1,5 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Any
 
 from reports.domain.types import DeviceId
 
@@ -9,3 +10,4 @@ class DeviceReadModel:
     device_name: str | None
     device_inventory_number: str
     device_serial_number: str
+    payload: dict[str, Any] = field(default_factory=dict)
@@ -15,7 +15,7 @@ class MediaReadModel:
     report_id: ReportId
     metadata: MediaMetadata
     uploaded_at: datetime
-    presigned_url: PresignedUrl
+    presigned_url: PresignedUrl | None
     uploaded_by: UserId
 
 
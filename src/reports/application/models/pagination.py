@@ -1,7 +1,31 @@
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from binascii import Error as DecodeError
 from dataclasses import dataclass, field
+from typing import NewType
+from uuid import UUID
+
+from reports.application.common.application_error import ApplicationError, ErrorType
+from reports.domain.types import ReportId
+
+Cursor = NewType("Cursor", str)
 
 
 @dataclass(frozen=True)
 class Pagination:
     limit: int = field(default=20)
     offset: int = field(default=0)
+    cursor: Cursor | None = field(default=None)
+
+
+def encode_cursor(report_id: ReportId) -> Cursor:
+    return Cursor(urlsafe_b64encode(report_id.bytes).rstrip(b"=").decode())
+
+
+def decode_cursor(cursor: Cursor) -> ReportId:
+    try:
+        return ReportId(UUID(bytes=urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))))
+    except (DecodeError, ValueError) as error:
+        raise ApplicationError(
+            error_type=ErrorType.VALIDATION_ERROR,
+            message=f"Invalid pagination cursor {cursor}",
+        ) from error
@@ -1,7 +1,8 @@
-from dataclasses import dataclass
-from datetime import datetime
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
 
 from reports.application.models.media import MediaReadModel
+from reports.application.models.pagination import Cursor
 from reports.domain.types import DeviceId, DeviceType, ReportId, UserId
 
 
@@ -15,3 +16,31 @@ class ReportReadModel:
     device_id: DeviceId
     device_type: DeviceType
     media: MediaReadModel | None
+
+
+@dataclass(frozen=True)
+class ReportFilters:
+    device_id: DeviceId | None = field(default=None)
+    device_type: DeviceType | None = field(default=None)
+    creator_id: UserId | None = field(default=None)
+    created_from: datetime | None = field(default=None)
+    created_to: datetime | None = field(default=None)
+
+    def __post_init__(self) -> None:
+        # Bounds are compared in UTC, so naive values are taken to be UTC already.
+        for name in ("created_from", "created_to"):
+            if (moment := getattr(self, name)) is not None:
+                object.__setattr__(self, name, _as_utc(moment))
+
+
+def _as_utc(moment: datetime) -> datetime:
+    if moment.tzinfo is None:
+        return moment.replace(tzinfo=UTC)
+
+    return moment.astimezone(UTC)
+
+
+@dataclass(frozen=True)
+class ReportsPage:
+    reports: list[ReportReadModel]
+    next_cursor: Cursor | None
@@ -0,0 +1,24 @@
+from dataclasses import dataclass, field
+from typing import Any
+
+from reports.domain.types import DeviceId, DeviceType, EventId, ReportId, UserId
+
+
+# Changes cross process boundaries, so the event is kept in its JSON form.
+@dataclass(frozen=True)
+class ReportChange:
+    report_id: ReportId
+    event_id: EventId | None
+    event_type: str
+    data: dict[str, Any]
+    device_id: DeviceId | None
+    device_type: DeviceType | None
+    creator_id: UserId | None
+
+
+@dataclass(frozen=True)
+class ReportChangeFilters:
+    report_id: ReportId | None = field(default=None)
+    device_id: DeviceId | None = field(default=None)
+    device_type: DeviceType | None = field(default=None)
+    creator_id: UserId | None = field(default=None)
@@ -34,7 +34,11 @@ class DeleteMediaOnReportDeletionHandler(NotificationHandler[ReportDeleted]):
 
         self._event_adder.add(
             event=ReportMediaDeleted(
-                media_id=report_media.entity_id, report_id=report_media.report_id
+                media_id=report_media.entity_id,
+                metadata=report_media.metadata,
+                report_id=report_media.report_id,
             )
         )
+        # The row references the report, which is deleted in the same commit.
+        await self._media_repository.delete(report_media)
         await self._media_gateway.delete(file_name=filename)
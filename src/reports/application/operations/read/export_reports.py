@@ -0,0 +1,31 @@
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
+from typing import Final
+
+from bazario.asyncio import RequestHandler
+
+from reports.application.common.markers import StreamingQuery
+from reports.application.models.report import ReportFilters, ReportReadModel
+from reports.application.ports.report_gateway import ReportGateway
+
+_EXPORT_BATCH_SIZE: Final[int] = 500
+
+type ReportBatches = AsyncIterator[list[ReportReadModel]]
+
+
+@dataclass(frozen=True)
+class ExportReports(StreamingQuery[ReportBatches]):
+    filters: ReportFilters = field(default_factory=ReportFilters)
+    with_media_urls: bool = field(default=False)
+
+
+class ExportReportsHandler(RequestHandler[ExportReports, ReportBatches]):
+    def __init__(self, report_gateway: ReportGateway) -> None:
+        self._report_gateway = report_gateway
+
+    async def handle(self, request: ExportReports) -> ReportBatches:
+        return self._report_gateway.stream(
+            filters=request.filters,
+            batch_size=_EXPORT_BATCH_SIZE,
+            with_media_urls=request.with_media_urls,
+        )
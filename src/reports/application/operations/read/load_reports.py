@@ -1,29 +1,34 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from bazario.asyncio import RequestHandler
 
-from reports.application.common.markers import Query
-from reports.application.models.pagination import Pagination
-from reports.application.models.report import ReportReadModel
-from reports.application.ports.identity_provider import IdentityProvider
+from reports.application.common.cache_tags import REPORT_LIST_TAG
+from reports.application.common.markers import CachedQuery
+from reports.application.models.pagination import Pagination, encode_cursor
+from reports.application.models.report import ReportFilters, ReportsPage
 from reports.application.ports.report_gateway import ReportGateway
 
 
 @dataclass(frozen=True)
-class LoadReports(Query[list[ReportReadModel]]):
+class LoadReports(CachedQuery[ReportsPage]):
     pagination: Pagination
+    filters: ReportFilters = field(default_factory=ReportFilters)
 
+    def cache_tags(self) -> frozenset[str]:
+        return frozenset({REPORT_LIST_TAG})
 
-class LoadReportsHandler(RequestHandler[LoadReports, list[ReportReadModel]]):
-    def __init__(
-        self, identity_provider: IdentityProvider, report_gateway: ReportGateway
-    ) -> None:
-        self._identity_provider = identity_provider
+
+class LoadReportsHandler(RequestHandler[LoadReports, ReportsPage]):
+    def __init__(self, report_gateway: ReportGateway) -> None:
         self._report_gateway = report_gateway
 
-    async def handle(self, request: LoadReports) -> list[ReportReadModel]:
-        self._identity_provider.current_user_id()
+    async def handle(self, request: LoadReports) -> ReportsPage:
+        reports = await self._report_gateway.load_many(
+            pagination=request.pagination, filters=request.filters
+        )
+        next_cursor = None
 
-        reports = await self._report_gateway.load_many(pagination=request.pagination)
+        if reports and len(reports) == request.pagination.limit:
+            next_cursor = encode_cursor(reports[-1].report_id)
 
-        return reports
+        return ReportsPage(reports=reports, next_cursor=next_cursor)
@@ -0,0 +1,25 @@
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
+
+from bazario.asyncio import RequestHandler
+
+from reports.application.common.markers import StreamingQuery
+from reports.application.models.report_change import ReportChange, ReportChangeFilters
+from reports.application.ports.report_changes import ReportChanges
+
+type ReportChangeStream = AsyncIterator[ReportChange]
+
+
+@dataclass(frozen=True)
+class SubscribeReportChanges(StreamingQuery[ReportChangeStream]):
+    filters: ReportChangeFilters = field(default_factory=ReportChangeFilters)
+
+
+class SubscribeReportChangesHandler(
+    RequestHandler[SubscribeReportChanges, ReportChangeStream]
+):
+    def __init__(self, report_changes: ReportChanges) -> None:
+        self._report_changes = report_changes
+
+    async def handle(self, request: SubscribeReportChanges) -> ReportChangeStream:
+        return self._report_changes.subscribe(request.filters)
@@ -0,0 +1,115 @@
+import asyncio
+from dataclasses import dataclass, field
+from typing import Final
+
+from bazario.asyncio import RequestHandler
+
+from reports.application.common.application_error import ApplicationError, ErrorType
+from reports.application.common.markers import Command
+from reports.application.ports.identity_provider import IdentityProvider
+from reports.domain.report.factory import ReportFactory
+from reports.domain.report.report import DeviceReport
+from reports.domain.report.repository import ReportRepository
+from reports.domain.types import DeviceId, DeviceType, ReportId, UserId
+
+
+@dataclass(frozen=True)
+class DeviceReportSpec:
+    report_name: str
+    comment: str
+    device_id: DeviceId
+    device_type: DeviceType
+
+
+@dataclass(frozen=True)
+class AddDeviceReportResult:
+    device_id: DeviceId
+    device_type: DeviceType
+    report_id: ReportId | None = field(default=None)
+    error: str | None = field(default=None)
+
+
+@dataclass(frozen=True)
+class AddDeviceReports(Command[list[AddDeviceReportResult]]):
+    reports: list[DeviceReportSpec]
+
+
+class AddDeviceReportsHandler(
+    RequestHandler[AddDeviceReports, list[AddDeviceReportResult]]
+):
+    _MAX_BATCH_SIZE: Final[int] = 1000
+    _DEVICE_LOOKUP_CONCURRENCY: Final[int] = 10
+
+    def __init__(
+        self,
+        report_repository: ReportRepository,
+        report_factory: ReportFactory,
+        identity_provider: IdentityProvider,
+    ) -> None:
+        self._report_repository = report_repository
+        self._report_factory = report_factory
+        self._identity_provider = identity_provider
+
+    async def handle(self, request: AddDeviceReports) -> list[AddDeviceReportResult]:
+        creator_id = self._identity_provider.current_user_id()
+
+        if len(request.reports) > self._MAX_BATCH_SIZE:
+            raise ApplicationError(
+                error_type=ErrorType.VALIDATION_ERROR,
+                message=f"Batch can contain at most {self._MAX_BATCH_SIZE} reports",
+            )
+
+        semaphore = asyncio.Semaphore(self._DEVICE_LOOKUP_CONCURRENCY)
+        tasks = [
+            asyncio.create_task(self._create_report(spec, creator_id, semaphore))
+            for spec in request.reports
+        ]
+
+        try:
+            outcomes = await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+        self._report_repository.add_many(
+            [outcome for outcome in outcomes if not isinstance(outcome, ApplicationError)]
+        )
+
+        return [
+            self._load(spec, outcome)
+            for spec, outcome in zip(request.reports, outcomes, strict=True)
+        ]
+
+    async def _create_report(
+        self, spec: DeviceReportSpec, creator_id: UserId, semaphore: asyncio.Semaphore
+    ) -> DeviceReport | ApplicationError:
+        async with semaphore:
+            try:
+                return await self._report_factory.create_device_report(
+                    report_name=spec.report_name,
+                    comment=spec.comment,
+                    device_id=spec.device_id,
+                    device_type=spec.device_type,
+                    creator_id=creator_id,
+                )
+            except ApplicationError as error:
+                return error
+
+    def _load(
+        self, spec: DeviceReportSpec, outcome: DeviceReport | ApplicationError
+    ) -> AddDeviceReportResult:
+        if isinstance(outcome, ApplicationError):
+            return AddDeviceReportResult(
+                device_id=spec.device_id,
+                device_type=spec.device_type,
+                error=outcome.message,
+            )
+
+        return AddDeviceReportResult(
+            device_id=spec.device_id,
+            device_type=spec.device_type,
+            report_id=outcome.entity_id,
+        )
@@ -4,22 +4,24 @@ from bazario.asyncio import RequestHandler
 
 from reports.application.common.application_error import ApplicationError, ErrorType
 from reports.application.common.markers import Command
-from reports.application.models.media import FileName, build_file_name
+from reports.application.models.media import MediaReadModel, build_file_name
 from reports.application.ports.device_gateway import DeviceGateway
+from reports.application.ports.device_snapshot_gateway import DeviceSnapshotGateway
 from reports.application.ports.media_gateway import ObjectMediaGateway
 from reports.application.ports.report_pdf_generator import PdfReportGenerator
 from reports.domain.media.factory import MediaFactory
+from reports.domain.media.media import ReportMedia
 from reports.domain.media.repository import MediaRepository
 from reports.domain.report.repository import ReportRepository
 from reports.domain.types import ReportId
 
 
 @dataclass(frozen=True)
-class GeneratePdfReport(Command[FileName]):
+class GeneratePdfReport(Command[MediaReadModel]):
     device_report_id: ReportId
 
 
-class GeneratePdfReportHandler(RequestHandler[GeneratePdfReport, FileName]):
+class GeneratePdfReportHandler(RequestHandler[GeneratePdfReport, MediaReadModel]):
     def __init__(
         self,
         media_factory: MediaFactory,
@@ -28,6 +30,7 @@ class GeneratePdfReportHandler(RequestHandler[GeneratePdfReport, FileName]):
         media_gateway: ObjectMediaGateway,
         report_repository: ReportRepository,
         device_gateway: DeviceGateway,
+        device_snapshot_gateway: DeviceSnapshotGateway,
     ) -> None:
         self._media_factory = media_factory
         self._media_repository = media_repository
@@ -35,15 +38,14 @@ class GeneratePdfReportHandler(RequestHandler[GeneratePdfReport, FileName]):
         self._media_gateway = media_gateway
         self._report_repository = report_repository
         self._device_gateway = device_gateway
+        self._device_snapshot_gateway = device_snapshot_gateway
 
-    async def handle(self, request: GeneratePdfReport) -> FileName:
-        if await self._media_repository.with_report_id(
+    async def handle(self, request: GeneratePdfReport) -> MediaReadModel:
+        # A repeated run for the same report returns the media it already has.
+        if media := await self._media_repository.with_report_id(
             report_id=request.device_report_id
         ):
-            raise ApplicationError(
-                error_type=ErrorType.CONFLICT,
-                message=f"Report with id {request.device_report_id} already exists",
-            )
+            return await self._read_model(media)
 
         report = await self._report_repository.device_report_with_id(
             report_id=request.device_report_id
@@ -55,18 +57,25 @@ class GeneratePdfReportHandler(RequestHandler[GeneratePdfReport, FileName]):
                 message=f"Report with id {request.device_report_id} not found",
             )
 
-        device = await self._device_gateway.load(
-            device_id=report.device_id, device_type=report.device_type
+        device = await self._device_snapshot_gateway.with_report_id(
+            report_id=report.entity_id
         )
 
         if not device:
-            raise ApplicationError(
-                error_type=ErrorType.NOT_FOUND,
-                message=f"Device with id {report.device_id} \
-                    and type {report.device_type} not found",
+            device = await self._device_gateway.load(
+                device_id=report.device_id, device_type=report.device_type
             )
 
-        pdf_report = self._pdf_report_generator.generate(device=device)
+            if not device:
+                raise ApplicationError(
+                    error_type=ErrorType.NOT_FOUND,
+                    message=f"Device with id {report.device_id} \
+                        and type {report.device_type} not found",
+                )
+
+            self._device_snapshot_gateway.add(report_id=report.entity_id, device=device)
+
+        pdf_report = await self._pdf_report_generator.generate(device=device)
         media = await self._media_factory.create_report_media(
             request.device_report_id, pdf_report.metadata, report.creator_id
         )
@@ -77,4 +86,18 @@ class GeneratePdfReportHandler(RequestHandler[GeneratePdfReport, FileName]):
         self._media_repository.add(media=media)
         await self._media_gateway.save(file_name=filename, file=pdf_report.file)
 
-        return filename
+        return await self._read_model(media)
+
+    async def _read_model(self, media: ReportMedia) -> MediaReadModel:
+        filename = build_file_name(
+            content_type=media.metadata.content_type, media_id=media.entity_id
+        )
+
+        return MediaReadModel(
+            media_id=media.entity_id,
+            report_id=media.report_id,
+            metadata=media.metadata,
+            uploaded_at=media.uploaded_at,
+            presigned_url=await self._media_gateway.get(file_name=filename),
+            uploaded_by=media.uploaded_by,
+        )
@@ -0,0 +1,101 @@
+from dataclasses import dataclass
+
+from bazario.asyncio import RequestHandler
+
+from reports.application.common.application_error import ApplicationError, ErrorType
+from reports.application.common.markers import Command
+from reports.application.models.media import build_file_name
+from reports.application.ports.device_gateway import DeviceGateway
+from reports.application.ports.device_snapshot_gateway import DeviceSnapshotGateway
+from reports.application.ports.events import EventAdder
+from reports.application.ports.identity_provider import IdentityProvider
+from reports.application.ports.media_gateway import ObjectMediaGateway
+from reports.application.ports.pdf_render_scheduler import PdfRenderScheduler
+from reports.domain.media.events import ReportMediaDeleted
+from reports.domain.media.media import ReportMedia
+from reports.domain.media.repository import MediaRepository
+from reports.domain.report.repository import ReportRepository
+from reports.domain.types import ReportId
+
+
+@dataclass(frozen=True)
+class RefreshReportDevice(Command[None]):
+    report_id: ReportId
+
+
+class RefreshReportDeviceHandler(RequestHandler[RefreshReportDevice, None]):
+    def __init__(
+        self,
+        report_repository: ReportRepository,
+        device_gateway: DeviceGateway,
+        device_snapshot_gateway: DeviceSnapshotGateway,
+        identity_provider: IdentityProvider,
+        media_repository: MediaRepository,
+        media_gateway: ObjectMediaGateway,
+        pdf_render_scheduler: PdfRenderScheduler,
+        event_adder: EventAdder,
+    ) -> None:
+        self._report_repository = report_repository
+        self._device_gateway = device_gateway
+        self._device_snapshot_gateway = device_snapshot_gateway
+        self._identity_provider = identity_provider
+        self._media_repository = media_repository
+        self._media_gateway = media_gateway
+        self._pdf_render_scheduler = pdf_render_scheduler
+        self._event_adder = event_adder
+
+    async def handle(self, request: RefreshReportDevice) -> None:
+        current_user_id = self._identity_provider.current_user_id()
+        report = await self._report_repository.device_report_with_id(
+            report_id=request.report_id
+        )
+
+        if not report:
+            raise ApplicationError(
+                error_type=ErrorType.NOT_FOUND,
+                message=f"Report with id {request.report_id} not found",
+            )
+
+        if report.creator_id != current_user_id:
+            raise ApplicationError(
+                error_type=ErrorType.FORBIDDEN,
+                message=f"User {current_user_id} is not the creator of the report",
+            )
+
+        device = await self._device_gateway.reload(
+            device_id=report.device_id, device_type=report.device_type
+        )
+
+        if not device:
+            raise ApplicationError(
+                error_type=ErrorType.NOT_FOUND,
+                message=f"Device with id {report.device_id} \
+                    and type {report.device_type} not found",
+            )
+
+        await self._device_snapshot_gateway.replace(
+            report_id=report.entity_id, device=device
+        )
+
+        # The PDF was rendered from the old snapshot, so it is replaced as well.
+        if media := await self._media_repository.with_report_id(
+            report_id=report.entity_id
+        ):
+            await self._delete_media(media)
+
+        await self._pdf_render_scheduler.schedule([report.entity_id])
+
+    async def _delete_media(self, media: ReportMedia) -> None:
+        filename = build_file_name(
+            content_type=media.metadata.content_type, media_id=media.entity_id
+        )
+
+        self._event_adder.add(
+            event=ReportMediaDeleted(
+                media_id=media.entity_id,
+                metadata=media.metadata,
+                report_id=media.report_id,
+            )
+        )
+        await self._media_repository.delete(media)
+        await self._media_gateway.delete(file_name=filename)
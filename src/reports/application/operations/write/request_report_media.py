@@ -0,0 +1,51 @@
+from dataclasses import dataclass
+
+from bazario.asyncio import RequestHandler
+
+from reports.application.common.application_error import ApplicationError, ErrorType
+from reports.application.common.markers import Command
+from reports.application.models.media import MediaReadModel
+from reports.application.ports.identity_provider import IdentityProvider
+from reports.application.ports.media_gateway import MediaGateway
+from reports.application.ports.pdf_render_scheduler import PdfRenderScheduler
+from reports.domain.report.repository import ReportRepository
+from reports.domain.types import ReportId
+
+
+@dataclass(frozen=True)
+class RequestReportMedia(Command[MediaReadModel | None]):
+    report_id: ReportId
+
+
+class RequestReportMediaHandler(
+    RequestHandler[RequestReportMedia, MediaReadModel | None]
+):
+    def __init__(
+        self,
+        media_gateway: MediaGateway,
+        report_repository: ReportRepository,
+        pdf_render_scheduler: PdfRenderScheduler,
+        identity_provider: IdentityProvider,
+    ) -> None:
+        self._media_gateway = media_gateway
+        self._report_repository = report_repository
+        self._pdf_render_scheduler = pdf_render_scheduler
+        self._identity_provider = identity_provider
+
+    async def handle(self, request: RequestReportMedia) -> MediaReadModel | None:
+        self._identity_provider.current_user_id()
+
+        if media := await self._media_gateway.with_report_id(report_id=request.report_id):
+            return media
+
+        if not await self._report_repository.device_report_with_id(
+            report_id=request.report_id
+        ):
+            raise ApplicationError(
+                error_type=ErrorType.NOT_FOUND,
+                message=f"Report with id {request.report_id} not found",
+            )
+
+        await self._pdf_render_scheduler.schedule([request.report_id])
+
+        return None
@@ -9,3 +9,9 @@ class DeviceGateway(ABC):
     async def load(
         self, device_id: DeviceId, device_type: DeviceType
     ) -> DeviceReadModel | None: ...
+
+    # Bypasses any cache so the result reflects the current GLPI state.
+    @abstractmethod
+    async def reload(
+        self, device_id: DeviceId, device_type: DeviceType
+    ) -> DeviceReadModel | None: ...
@@ -0,0 +1,13 @@
+from abc import ABC, abstractmethod
+
+from reports.application.models.device import DeviceReadModel
+from reports.domain.types import ReportId
+
+
+class DeviceSnapshotGateway(ABC):
+    @abstractmethod
+    def add(self, report_id: ReportId, device: DeviceReadModel) -> None: ...
+    @abstractmethod
+    async def replace(self, report_id: ReportId, device: DeviceReadModel) -> None: ...
+    @abstractmethod
+    async def with_report_id(self, report_id: ReportId) -> DeviceReadModel | None: ...
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from collections.abc import Iterable
 
 from reports.application.models.media import FileName, MediaReadModel, PresignedUrl
 from reports.domain.types import ReportId
@@ -10,6 +11,10 @@ class ObjectMediaGateway(ABC):
     @abstractmethod
     async def get(self, file_name: FileName) -> PresignedUrl: ...
     @abstractmethod
+    async def get_many(
+        self, file_names: Iterable[FileName]
+    ) -> dict[FileName, PresignedUrl]: ...
+    @abstractmethod
     async def delete(self, file_name: FileName) -> None: ...
 
 
@@ -0,0 +1,14 @@
+from abc import ABC, abstractmethod
+from contextlib import AbstractContextManager
+
+from reports.domain.types import ReportId
+
+
+class MediaWatch(ABC):
+    @abstractmethod
+    async def wait(self) -> None: ...
+
+
+class MediaWaiters(ABC):
+    @abstractmethod
+    def watch(self, report_id: ReportId) -> AbstractContextManager[MediaWatch]: ...
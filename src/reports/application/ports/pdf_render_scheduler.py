@@ -0,0 +1,9 @@
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+
+from reports.domain.types import ReportId
+
+
+class PdfRenderScheduler(ABC):
+    @abstractmethod
+    async def schedule(self, report_ids: Sequence[ReportId]) -> None: ...
@@ -0,0 +1,10 @@
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
+
+from reports.application.models.report_change import ReportChange, ReportChangeFilters
+
+
+class ReportChanges(ABC):
+    # The stream ends when the subscriber falls too far behind or the source closes.
+    @abstractmethod
+    def subscribe(self, filters: ReportChangeFilters) -> AsyncIterator[ReportChange]: ...
@@ -1,12 +1,19 @@
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 
 from reports.application.models.pagination import Pagination
-from reports.application.models.report import ReportReadModel
+from reports.application.models.report import ReportFilters, ReportReadModel
 from reports.domain.types import ReportId
 
 
 class ReportGateway(ABC):
     @abstractmethod
-    async def load_many(self, pagination: Pagination) -> list[ReportReadModel]: ...
+    async def load_many(
+        self, pagination: Pagination, filters: ReportFilters
+    ) -> list[ReportReadModel]: ...
+    @abstractmethod
+    def stream(
+        self, filters: ReportFilters, batch_size: int, with_media_urls: bool
+    ) -> AsyncIterator[list[ReportReadModel]]: ...
     @abstractmethod
     async def with_id(self, report_id: ReportId) -> ReportReadModel | None: ...
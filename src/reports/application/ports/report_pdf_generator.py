@@ -13,4 +13,4 @@ class PdfReport:
 
 class PdfReportGenerator(ABC):
     @abstractmethod
-    def generate(self, device: DeviceReadModel) -> PdfReport: ...
+    async def generate(self, device: DeviceReadModel) -> PdfReport: ...
@@ -13,9 +13,18 @@ from uvicorn import Config as UvicornConfig
 from uvicorn import Server as UvicornServer
 
 from reports.bootstrap.config import (
+    BroadcastConfig,
     DatabaseConfig,
+    DeviceCacheConfig,
     GlpiApiConfig,
+    MediaReadyConfig,
+    OutboxConfig,
+    PdfRenderConfig,
+    PdfWorkflowConfig,
+    QueryCacheConfig,
+    ReportChangesConfig,
     S3MinioConfig,
+    TemplatesConfig,
 )
 from reports.bootstrap.providers import (
     ApiApplicationHandlersProvider,
@@ -24,9 +33,15 @@ from reports.bootstrap.providers import (
     ApplicationAdaptersProvider,
     AuthProvider,
     BazarioProvider,
+    BroadcastProvider,
     CliConfigProvider,
     InfrastructureAdaptersProvider,
+    MediaReadyProvider,
+    OutboxProvider,
+    PdfRenderProvider,
     PersistenceProvider,
+    QueryCacheProvider,
+    ReportChangesProvider,
     SioConfigProvider,
     WorkerApplicationHandlersProvider,
     WorkerDomainAdaptersProvider,
@@ -37,6 +52,13 @@ def bootstrap_api_container(
     database_config: DatabaseConfig,
     s3_minio_config: S3MinioConfig,
     glpi_api_config: GlpiApiConfig,
+    device_cache_config: DeviceCacheConfig,
+    outbox_config: OutboxConfig,
+    pdf_workflow_config: PdfWorkflowConfig,
+    query_cache_config: QueryCacheConfig,
+    media_ready_config: MediaReadyConfig,
+    report_changes_config: ReportChangesConfig,
+    broadcast_config: BroadcastConfig,
     logger: Logger,
 ) -> AsyncContainer:
     return make_async_container(
@@ -48,11 +70,23 @@ def bootstrap_api_container(
         ApplicationAdaptersProvider(),
         ApiApplicationHandlersProvider(),
         InfrastructureAdaptersProvider(),
+        OutboxProvider(),
+        QueryCacheProvider(),
+        MediaReadyProvider(),
+        ReportChangesProvider(),
+        BroadcastProvider(),
         AuthProvider(),
         context={
             DatabaseConfig: database_config,
             S3MinioConfig: s3_minio_config,
             GlpiApiConfig: glpi_api_config,
+            DeviceCacheConfig: device_cache_config,
+            OutboxConfig: outbox_config,
+            PdfWorkflowConfig: pdf_workflow_config,
+            QueryCacheConfig: query_cache_config,
+            MediaReadyConfig: media_ready_config,
+            ReportChangesConfig: report_changes_config,
+            BroadcastConfig: broadcast_config,
             Logger: logger,
         },
     )
@@ -63,6 +97,7 @@ def bootstrap_cli_container(
     uvicorn_config: UvicornConfig,
     uvicorn_server: UvicornServer,
     hatchet_worker: Worker,
+    database_config: DatabaseConfig,
 ) -> Container:
     return make_container(
         CliConfigProvider(),
@@ -71,6 +106,7 @@ def bootstrap_cli_container(
             UvicornConfig: uvicorn_config,
             UvicornServer: uvicorn_server,
             Worker: hatchet_worker,
+            DatabaseConfig: database_config,
         },
     )
 
@@ -80,6 +116,15 @@ def bootstrap_tasks_container(
     sio_server: AsyncServer,
     glpi_api_config: GlpiApiConfig,
     minio_config: S3MinioConfig,
+    device_cache_config: DeviceCacheConfig,
+    pdf_render_config: PdfRenderConfig,
+    templates_config: TemplatesConfig,
+    outbox_config: OutboxConfig,
+    pdf_workflow_config: PdfWorkflowConfig,
+    query_cache_config: QueryCacheConfig,
+    media_ready_config: MediaReadyConfig,
+    report_changes_config: ReportChangesConfig,
+    broadcast_config: BroadcastConfig,
     logger: Logger,
 ) -> AsyncContainer:
     return make_async_container(
@@ -90,12 +135,27 @@ def bootstrap_tasks_container(
         ApplicationAdaptersProvider(),
         WorkerApplicationHandlersProvider(),
         InfrastructureAdaptersProvider(),
+        PdfRenderProvider(),
+        OutboxProvider(),
+        QueryCacheProvider(),
+        MediaReadyProvider(),
+        ReportChangesProvider(),
+        BroadcastProvider(),
         BazarioProvider(),
         context={
             DatabaseConfig: database_config,
             AsyncServer: sio_server,
             GlpiApiConfig: glpi_api_config,
             S3MinioConfig: minio_config,
+            DeviceCacheConfig: device_cache_config,
+            PdfRenderConfig: pdf_render_config,
+            TemplatesConfig: templates_config,
+            OutboxConfig: outbox_config,
+            PdfWorkflowConfig: pdf_workflow_config,
+            QueryCacheConfig: query_cache_config,
+            MediaReadyConfig: media_ready_config,
+            ReportChangesConfig: report_changes_config,
+            BroadcastConfig: broadcast_config,
             Logger: logger,
         },
     )
@@ -11,19 +11,38 @@ from fastapi.middleware.cors import CORSMiddleware
 from reports.application.common.application_error import ApplicationError
 from reports.bootstrap.config import (
     build_logger,
+    get_broadcast_config,
     get_database_config,
+    get_device_cache_config,
     get_glpi_api_config,
+    get_media_ready_config,
+    get_outbox_config,
+    get_pdf_workflow_config,
+    get_query_cache_config,
+    get_report_changes_config,
     get_s3_minio_config,
+    get_sio_config,
 )
 from reports.bootstrap.containers import bootstrap_api_container
-from reports.bootstrap.entrypoints.sio import socket_io_app, socketio_server
+from reports.bootstrap.entrypoints.sio import (
+    bind_socketio_server,
+    close_socketio_server,
+    socket_io_app,
+    socketio_server,
+)
+from reports.infrastructure.broadcast.broadcast import Broadcast
+from reports.infrastructure.media_ready.bus import MediaReadyBus
+from reports.infrastructure.outbox.relay import OutboxRelay
 from reports.infrastructure.persistence.mappings import map_tables
+from reports.infrastructure.query_cache.cache import QueryCache
+from reports.infrastructure.report_changes.hub import ReportChangeHub
 from reports.presentation.api.exception_handlers import (
     application_error_handler,
     internal_error_handler,
 )
 from reports.presentation.api.routers.healthcheck import HEALTHCHECK_ROUTER
 from reports.presentation.api.routers.reports import REPORTS_ROUTER
+from reports.presentation.socketio.report_rooms import add_report_rooms
 
 if TYPE_CHECKING:
     from dishka import AsyncContainer
@@ -34,7 +53,17 @@ if TYPE_CHECKING:
 async def lifespan(application: FastAPI) -> AsyncIterator[None]:
     map_tables()
     container = cast("AsyncContainer", application.state.dishka_container)
+    await container.get(OutboxRelay)
+    # Consumers subscribe when they are built, so before the broadcast starts.
+    await container.get(MediaReadyBus)
+    await container.get(QueryCache)
+    await container.get(ReportChangeHub)
+    broadcast = await container.get(Broadcast)
+    bind_socketio_server(application.state.sio_server, broadcast)
+    broadcast.start()
     yield
+    # Pending emits are flushed while the broadcast is still open.
+    await close_socketio_server(application.state.sio_server)
     await container.close()
 
 
@@ -66,14 +95,23 @@ def add_exception_handlers(application: FastAPI) -> None:
 
 def bootstrap_application() -> FastAPI:
     application = FastAPI(lifespan=lifespan)
-    sio_server = socketio_server()
+    sio_server = socketio_server(get_sio_config())
+    application.state.sio_server = sio_server
     dishka_container = bootstrap_api_container(
         database_config=get_database_config(),
         s3_minio_config=get_s3_minio_config(),
         glpi_api_config=get_glpi_api_config(),
+        device_cache_config=get_device_cache_config(),
+        outbox_config=get_outbox_config(),
+        pdf_workflow_config=get_pdf_workflow_config(),
+        query_cache_config=get_query_cache_config(),
+        media_ready_config=get_media_ready_config(),
+        report_changes_config=get_report_changes_config(),
+        broadcast_config=get_broadcast_config(),
         logger=build_logger(),
     )
     socket_io_app(application, sio_server)
+    add_report_rooms(sio_server, dishka_container)
 
     add_middlewares(application)
     add_api_routers(application)
@@ -4,16 +4,20 @@ from uvicorn import Server as UvicornServer
 
 from reports.bootstrap.config import (
     get_alembic_config,
+    get_database_config,
     get_hatchet_worker,
     get_uvicorn_config,
 )
 from reports.bootstrap.containers import bootstrap_cli_container
+from reports.presentation.cli.engine_benchmark import benchmark_engine
 from reports.presentation.cli.migrations import (
     downgrade_migration,
     make_migrations,
     show_current_migration,
     upgrade_migration,
 )
+from reports.presentation.cli.query_plans import check_query_plans
+from reports.presentation.cli.report_view import rebuild_report_view
 from reports.presentation.cli.server_starting import start_uvicorn
 from reports.presentation.cli.worker import start_worker
 
@@ -26,7 +30,11 @@ def main(context: Context) -> None:
     uvicorn_server = UvicornServer(uvicorn_config)
     hatchet_worker = get_hatchet_worker()
     dishka_container = bootstrap_cli_container(
-        alembic_config, uvicorn_config, uvicorn_server, hatchet_worker
+        alembic_config,
+        uvicorn_config,
+        uvicorn_server,
+        hatchet_worker,
+        get_database_config(),
     )
     setup_dishka(dishka_container, context, finalize_container=True)
 
@@ -37,3 +45,6 @@ main.command(upgrade_migration)
 main.command(downgrade_migration)
 main.command(show_current_migration)
 main.command(start_worker)
+main.command(check_query_plans)
+main.command(benchmark_engine)
+main.command(rebuild_report_view)
@@ -1,12 +1,49 @@
 from fastapi import FastAPI
-from socketio import ASGIApp, AsyncServer
+from socketio import ASGIApp, AsyncManager, AsyncServer
 
+from reports.bootstrap.config import SioConfig
+from reports.infrastructure.broadcast.broadcast import Broadcast
+from reports.infrastructure.redis.connection import RespConnection
+from reports.infrastructure.socketio.broadcast_manager import BroadcastPubSubManager
+from reports.infrastructure.socketio.resp_manager import RespPubSubManager
 
-def socketio_server() -> AsyncServer:
-    sio_server = AsyncServer(async_mode="asgi", cors_allowed_origins="*")
+
+def socketio_server(config: SioConfig, *, write_only: bool = False) -> AsyncServer:
+    client_manager: AsyncManager | None = None
+
+    if config.manager == "broadcast":
+        client_manager = BroadcastPubSubManager(
+            channel=config.channel, write_only=write_only
+        )
+    elif config.manager == "redis":
+        client_manager = RespPubSubManager(
+            publisher=RespConnection(uri=config.redis_uri, timeout=config.redis_timeout),
+            subscriber=RespConnection(uri=config.redis_uri, timeout=config.redis_timeout),
+            channel=config.channel,
+            write_only=write_only,
+        )
+    elif config.manager != "memory":
+        raise ValueError(f"Unknown Socket.IO manager {config.manager!r}")
+    elif write_only:
+        # Its emits could only reach clients connected to this very process.
+        raise ValueError("A write-only Socket.IO server needs a shared manager")
+
+    sio_server = AsyncServer(
+        async_mode="asgi", cors_allowed_origins="*", client_manager=client_manager
+    )
     return sio_server
 
 
+def bind_socketio_server(server: AsyncServer, broadcast: Broadcast) -> None:
+    if isinstance(server.manager, BroadcastPubSubManager):
+        server.manager.bind(broadcast)
+
+
+async def close_socketio_server(server: AsyncServer) -> None:
+    if isinstance(server.manager, BroadcastPubSubManager | RespPubSubManager):
+        await server.manager.close()
+
+
 def socket_io_app(fastapi_app: FastAPI, server: AsyncServer) -> ASGIApp:
     sio_application = ASGIApp(socketio_server=server, other_asgi_app=fastapi_app)
 
@@ -1,19 +1,38 @@
 from collections.abc import AsyncGenerator
 
-from dishka import AsyncContainer, Scope
+from dishka import AsyncContainer
 from hatchet_sdk.worker.worker import Worker
 from pydantic import BaseModel, ConfigDict
 
 from reports.bootstrap.config import (
     build_logger,
+    get_broadcast_config,
     get_database_config,
+    get_device_cache_config,
     get_glpi_api_config,
+    get_media_ready_config,
+    get_outbox_config,
+    get_pdf_render_config,
+    get_pdf_workflow_config,
+    get_query_cache_config,
+    get_report_changes_config,
     get_s3_minio_config,
+    get_sio_config,
+    get_templates_config,
+    get_worker_config,
 )
 from reports.bootstrap.containers import bootstrap_tasks_container
-from reports.bootstrap.entrypoints.sio import socketio_server
+from reports.bootstrap.entrypoints.sio import (
+    bind_socketio_server,
+    close_socketio_server,
+    socketio_server,
+)
+from reports.infrastructure.broadcast.broadcast import Broadcast
 from reports.infrastructure.hatchet_client import build_hacthcet_client_config
-from reports.infrastructure.pdf_reports.generate_pdf_report import REPORTS_WORKFLOW
+from reports.infrastructure.outbox.relay import OutboxRelay
+from reports.infrastructure.pdf_reports.generate_pdf_report import PDF_REPORT_WORKFLOWS
+from reports.infrastructure.pdf_reports.render_pool import PdfRenderPool
+from reports.infrastructure.pdf_reports.templates_loader import TemplatesLoader
 from reports.infrastructure.persistence.mappings import map_tables
 
 
@@ -25,26 +44,47 @@ class Lifespan(BaseModel):
 
 async def lifespan() -> AsyncGenerator[Lifespan, None]:
     map_tables()
+    # The worker has no clients of its own and only publishes to the API replicas.
+    sio_server = socketio_server(get_sio_config(), write_only=True)
     dishka_container = bootstrap_tasks_container(
-        database_config=get_database_config(),
-        sio_server=socketio_server(),
+        # Every worker slot runs its task in its own request scope and session.
+        database_config=get_database_config(pool_size=get_worker_config().slots),
+        sio_server=sio_server,
         glpi_api_config=get_glpi_api_config(),
         minio_config=get_s3_minio_config(),
+        device_cache_config=get_device_cache_config(),
+        outbox_config=get_outbox_config(),
+        pdf_workflow_config=get_pdf_workflow_config(),
+        query_cache_config=get_query_cache_config(),
+        media_ready_config=get_media_ready_config(),
+        report_changes_config=get_report_changes_config(),
+        broadcast_config=get_broadcast_config(),
+        pdf_render_config=get_pdf_render_config(),
+        templates_config=get_templates_config(),
         logger=build_logger(),
     )
 
-    async with dishka_container(scope=Scope.REQUEST) as req_container:
-        yield Lifespan(dishka_container=req_container)
+    try:
+        (await dishka_container.get(TemplatesLoader)).precompile()
+        await dishka_container.get(PdfRenderPool)
+        await dishka_container.get(OutboxRelay)
+        bind_socketio_server(sio_server, await dishka_container.get(Broadcast))
+
+        yield Lifespan(dishka_container=dishka_container)
+    finally:
+        await close_socketio_server(sio_server)
+        await dishka_container.close()
 
 
 def bootstrap_worker() -> Worker:
+    worker_config = get_worker_config()
     worker = Worker(
         name="Worker",
         config=build_hacthcet_client_config(),
-        slots=20,
-        durable_slots=5,
+        slots=worker_config.slots,
+        durable_slots=worker_config.durable_slots,
         lifespan=lifespan,
-        workflows=[REPORTS_WORKFLOW],
+        workflows=[*PDF_REPORT_WORKFLOWS],
     )
 
     return worker
@@ -1,6 +1,8 @@
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Iterator
+from datetime import timedelta
 
 from aioboto3 import Session
+from aiobotocore.config import AioConfig
 from alembic.config import Config as AlembicConfig
 from bazario.asyncio import Dispatcher, Registry
 from bazario.asyncio.resolvers.dishka import DishkaResolver
@@ -14,19 +16,22 @@ from dishka import (
     provide_all,
 )
 from hatchet_sdk import Worker
+from hatchet_sdk.runnables.workflow import Workflow
 from httpx import AsyncClient
 from socketio import AsyncServer
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
     async_sessionmaker,
-    create_async_engine,
 )
 from structlog.stdlib import BoundLogger as Logger
 from types_aiobotocore_s3.client import S3Client
 from uvicorn import Config as UvicornConfig
 from uvicorn import Server as UvicornServer
 
+from reports.application.common.authentication_behavior import (
+    AuthenticationBehavior,
+)
 from reports.application.common.commition_behavior import (
     CommitionBehavior,
 )
@@ -35,10 +40,19 @@ from reports.application.common.event_id_generation_behavior import (
     EventIdGenerationBehavior,
 )
 from reports.application.common.event_publishing_behavior import EventPublishingBehavior
-from reports.application.common.markers import Command
+from reports.application.common.markers import (
+    CachedQuery,
+    Command,
+    Query,
+    StreamingQuery,
+)
 from reports.application.operations.events.delete_media_on_report_deletion import (
     DeleteMediaOnReportDeletionHandler,
 )
+from reports.application.operations.read.export_reports import (
+    ExportReports,
+    ExportReportsHandler,
+)
 from reports.application.operations.read.load_media_by_report_id import (
     LoadMediaByReportId,
     LoadMediaByReportIdHandler,
@@ -51,10 +65,18 @@ from reports.application.operations.read.load_reports import (
     LoadReports,
     LoadReportsHandler,
 )
+from reports.application.operations.read.subscribe_report_changes import (
+    SubscribeReportChanges,
+    SubscribeReportChangesHandler,
+)
 from reports.application.operations.write.add_report import (
     AddDeviceReport,
     AddDeviceReportHandler,
 )
+from reports.application.operations.write.add_reports import (
+    AddDeviceReports,
+    AddDeviceReportsHandler,
+)
 from reports.application.operations.write.change_report import (
     ChangeDeviceReport,
     ChangeDeviceReportHandler,
@@ -67,8 +89,35 @@ from reports.application.operations.write.generate_pdf_report import (
     GeneratePdfReport,
     GeneratePdfReportHandler,
 )
+from reports.application.operations.write.refresh_report_device import (
+    RefreshReportDevice,
+    RefreshReportDeviceHandler,
+)
+from reports.application.operations.write.request_report_media import (
+    RequestReportMedia,
+    RequestReportMediaHandler,
+)
+from reports.application.ports.device_gateway import DeviceGateway
+from reports.application.ports.media_gateway import ObjectMediaGateway
+from reports.application.ports.pdf_render_scheduler import PdfRenderScheduler
+from reports.application.ports.report_changes import ReportChanges
+from reports.application.ports.time_provider import TimeProvider
 from reports.application.ports.transaction import Transaction
-from reports.bootstrap.config import DatabaseConfig, GlpiApiConfig, S3MinioConfig
+from reports.bootstrap.config import (
+    BroadcastConfig,
+    DatabaseConfig,
+    DeviceCacheConfig,
+    GlpiApiConfig,
+    MediaReadyConfig,
+    OutboxConfig,
+    PdfRenderConfig,
+    PdfWorkflowConfig,
+    QueryCacheConfig,
+    ReportChangesConfig,
+    S3MinioConfig,
+    TemplatesConfig,
+    build_database_engine,
+)
 from reports.domain.media.events import (
     ReportMediaDeleted,
     ReportMediaGenerated,
@@ -80,20 +129,55 @@ from reports.domain.report.events import (
     ReportNameChanged,
 )
 from reports.domain.shared.events import DomainEvent
+from reports.domain.types import DeviceType
+from reports.infrastructure.broadcast.broadcast import Broadcast, MemoryBroadcast
+from reports.infrastructure.broadcast.redis_broadcast import RedisBroadcast
+from reports.infrastructure.broadcast.sql_broadcast import SqlBroadcast
 from reports.infrastructure.events import DomainEvents
+from reports.infrastructure.hatchet_client import HATCHET
+from reports.infrastructure.http.cached_device_gateway import CachedDeviceGateway
+from reports.infrastructure.http.glpi_session_manager import GlpiSessionManager
 from reports.infrastructure.http.http_device_gateway import HttpDeviceGateway
 from reports.infrastructure.http.http_glpi_auth_client import GlpiAuthClient, UserToken
 from reports.infrastructure.media_factory import MediaFactoryImpl
+from reports.infrastructure.media_ready.bus import MEDIA_READY_TOPIC, MediaReadyBus
+from reports.infrastructure.media_ready.notifier import (
+    MediaReadyNotifier,
+    MediaReadyPublishingBehavior,
+    NotifyMediaReadyHandler,
+)
+from reports.infrastructure.media_ready.waiters import InProcessMediaWaiters
+from reports.infrastructure.outbox.events import AddEventToOutboxHandler
+from reports.infrastructure.outbox.outbox import Outbox
+from reports.infrastructure.outbox.relay import OutboxRelay
 from reports.infrastructure.pdf_reports.adapters.pdf_report_generator import (
     PdfReportGeneratorImpl,
 )
+from reports.infrastructure.pdf_reports.generate_pdf_report import (
+    PDF_REPORT_WORKFLOWS,
+    pdf_report_workflow,
+)
 from reports.infrastructure.pdf_reports.pdf_report_behavior import (
     GeneratePdfReportBehavior,
+    GeneratePdfReportsBehavior,
+    PdfPrewarmPolicy,
+)
+from reports.infrastructure.pdf_reports.render_pool import PdfRenderPool
+from reports.infrastructure.pdf_reports.render_scheduler import (
+    OutboxPdfRenderScheduler,
 )
 from reports.infrastructure.pdf_reports.templates_loader import TemplatesLoader
 from reports.infrastructure.persistence.adapters.blob_media_gateway import (
     BlobMediaGateway,
 )
+from reports.infrastructure.persistence.adapters.cached_media_gateway import (
+    CachedObjectMediaGateway,
+    EvictPresignedUrlOnMediaDeletionHandler,
+    PresignedUrlCache,
+)
+from reports.infrastructure.persistence.adapters.sql_device_snapshot_gateway import (
+    SqlDeviceSnapshotGateway,
+)
 from reports.infrastructure.persistence.adapters.sql_media_gateway import SqlMediaGateway
 from reports.infrastructure.persistence.adapters.sql_media_repository import (
     SqlMediaRepository,
@@ -104,10 +188,40 @@ from reports.infrastructure.persistence.adapters.sql_report_gateway import (
 from reports.infrastructure.persistence.adapters.sql_report_repository import (
     SqlReportRepository,
 )
+from reports.infrastructure.persistence.report_view import ProjectReportViewHandler
+from reports.infrastructure.query_cache.behavior import (
+    QueryCacheMetrics,
+    QueryCachePolicy,
+    QueryCachingBehavior,
+)
+from reports.infrastructure.query_cache.cache import MemoryQueryCache, QueryCache
+from reports.infrastructure.query_cache.coalescing import (
+    QueryCoalescer,
+    QueryCoalescingBehavior,
+)
+from reports.infrastructure.query_cache.invalidation import (
+    QUERY_CACHE_INVALIDATION_TOPIC,
+    InvalidateReportQueriesHandler,
+    QueryCacheInvalidationBehavior,
+    QueryCacheInvalidator,
+)
+from reports.infrastructure.query_cache.redis_cache import RedisQueryCache
+from reports.infrastructure.redis.connection import RespConnection
+from reports.infrastructure.report_changes.hub import (
+    REPORT_CHANGES_TOPIC,
+    ReportChangeHub,
+)
+from reports.infrastructure.report_changes.recorder import (
+    RecordReportChangeHandler,
+    ReportChangePublishingBehavior,
+    ReportChangeRecorder,
+)
 from reports.infrastructure.report_factory import ReportFactoryImlp
 from reports.infrastructure.utc_time_provider import UtcTimeProvider
 from reports.infrastructure.uuid7_id_generator import UUID7IdGenerator
 from reports.presentation.api.htpp_identity_provider import HttpIdentityProvider
+from reports.presentation.api.media_wait import MediaWaitConfig
+from reports.presentation.api.report_events import ReportEventsConfig
 from reports.presentation.logging.media import (
     LogReportMediaCreatedNotHandler,
     LogReportMediaDeletedNotHandler,
@@ -126,15 +240,30 @@ class ApiConfigProvider(Provider):
     database_config = from_context(DatabaseConfig)
     s3_minio_config = from_context(S3MinioConfig)
     glpi_api_config = from_context(GlpiApiConfig)
+    device_cache_config = from_context(DeviceCacheConfig)
     logger = from_context(Logger)
 
+    @provide
+    def media_wait_config(
+        self, config: PdfWorkflowConfig, media_ready_config: MediaReadyConfig
+    ) -> MediaWaitConfig:
+        return MediaWaitConfig(
+            timeout=config.media_wait_timeout,
+            max_wait=media_ready_config.max_wait,
+            retry_after=config.media_retry_after,
+        )
+
+    @provide
+    def report_events_config(self, config: ReportChangesConfig) -> ReportEventsConfig:
+        return ReportEventsConfig(keepalive=config.keepalive)
+
 
 class PersistenceProvider(Provider):
     scope = Scope.REQUEST
 
     @provide(scope=Scope.APP)
-    async def engine(self, postgres_config: DatabaseConfig) -> AsyncIterator[AsyncEngine]:
-        engine = create_async_engine(postgres_config.uri)
+    async def engine(self, database_config: DatabaseConfig) -> AsyncIterator[AsyncEngine]:
+        engine = build_database_engine(database_config)
         yield engine
         await engine.dispose()
 
@@ -156,15 +285,40 @@ class PersistenceProvider(Provider):
             aws_secret_access_key=config.secret_key,
         )
 
-    @provide(scope=Scope.REQUEST)
+    @provide(scope=Scope.APP)
     async def s3_client(
         self, session: Session, config: S3MinioConfig
     ) -> AsyncIterator[S3Client]:
         async with session.client(
-            service_name="s3", endpoint_url=config.base_uri
+            service_name="s3",
+            endpoint_url=config.base_uri,
+            config=AioConfig(
+                max_pool_connections=config.max_pool_connections,
+                tcp_keepalive=True,
+                connector_args={"keepalive_timeout": config.keepalive_timeout},
+            ),
         ) as client:
             yield client
 
+    @provide(scope=Scope.APP)
+    def presigned_url_cache(self, config: S3MinioConfig) -> PresignedUrlCache:
+        return PresignedUrlCache(
+            max_size=config.presigned_url_cache_size,
+            ttl=config.presigned_url_ttl,
+            refresh_margin=config.presigned_url_refresh_margin,
+        )
+
+    @provide
+    def object_media_gateway(
+        self, client: S3Client, cache: PresignedUrlCache, config: S3MinioConfig
+    ) -> ObjectMediaGateway:
+        return CachedObjectMediaGateway(
+            object_media_gateway=BlobMediaGateway(
+                client=client, expires_in=config.presigned_url_ttl
+            ),
+            cache=cache,
+        )
+
 
 class ApiDomainAdaptersProvider(Provider):
     scope = Scope.REQUEST
@@ -192,9 +346,8 @@ class ApplicationAdaptersProvider(Provider):
 
     gateways = provide_all(
         WithParents[SqlMediaGateway],  # type: ignore[misc]
-        WithParents[BlobMediaGateway],  # type: ignore[misc]
-        WithParents[HttpDeviceGateway],  # type: ignore[misc]
         WithParents[SqlReportGateway],  # type: ignore[misc]
+        WithParents[SqlDeviceSnapshotGateway],  # type: ignore[misc]
     )
     id_generator = provide(
         WithParents[UUID7IdGenerator],  # type: ignore[misc]
@@ -205,7 +358,6 @@ class ApplicationAdaptersProvider(Provider):
         scope=Scope.APP,
     )
     transaction = alias(AsyncSession, provides=Transaction)
-    report_generator = provide(WithParents[PdfReportGeneratorImpl])  # type: ignore[misc]
     domain_events = provide(WithParents[DomainEvents])  # type: ignore[misc]
 
 
@@ -221,19 +373,52 @@ class InfrastructureAdaptersProvider(Provider):
     scope = Scope.REQUEST
 
     transaction = alias(AsyncSession, provides=Transaction)
-    templates_loader = provide(WithParents[TemplatesLoader])  # type: ignore[misc]
 
     @provide(scope=Scope.APP)
     async def http_client(self, config: GlpiApiConfig) -> AsyncIterator[AsyncClient]:
         async with AsyncClient(base_url=config.glpi_uri) as client:
             yield client
 
-    @provide
-    async def glpi_auth_client(
+    @provide(scope=Scope.APP)
+    def glpi_auth_client(
         self, http_client: AsyncClient, config: GlpiApiConfig
     ) -> GlpiAuthClient:
         return GlpiAuthClient(client=http_client, user_token=UserToken(config.user_token))
 
+    @provide(scope=Scope.APP)
+    async def glpi_session_manager(
+        self, auth_client: GlpiAuthClient, config: GlpiApiConfig
+    ) -> AsyncIterator[GlpiSessionManager]:
+        session_manager = GlpiSessionManager(
+            auth_client=auth_client,
+            pool_size=config.session_pool_size,
+            ttl=config.session_ttl,
+            refresh_margin=config.session_refresh_margin,
+        )
+        yield session_manager
+        await session_manager.close()
+
+    @provide(scope=Scope.APP)
+    async def cached_device_gateway(
+        self,
+        http_client: AsyncClient,
+        session_manager: GlpiSessionManager,
+        config: DeviceCacheConfig,
+    ) -> AsyncIterator[CachedDeviceGateway]:
+        device_gateway = CachedDeviceGateway(
+            device_gateway=HttpDeviceGateway(
+                client=http_client, session_manager=session_manager
+            ),
+            max_size=config.max_size,
+            ttl=config.ttl,
+            stale_ttl=config.stale_ttl,
+            negative_ttl=config.negative_ttl,
+        )
+        yield device_gateway
+        await device_gateway.close()
+
+    device_gateway = alias(CachedDeviceGateway, provides=DeviceGateway)
+
 
 class ApiApplicationHandlersProvider(Provider):
     scope = Scope.REQUEST
@@ -241,23 +426,41 @@ class ApiApplicationHandlersProvider(Provider):
     handlers = provide_all(
         LoadMediaByReportIdHandler,
         AddDeviceReportHandler,
+        AddDeviceReportsHandler,
         LogReportCommentChangedNotHandler,
         LogReportCreatedNotHandler,
         LogReportNameChangedNotHandler,
         LogReportDeletedNotHandler,
         LogReportMediaDeletedNotHandler,
+        EvictPresignedUrlOnMediaDeletionHandler,
+        AddEventToOutboxHandler,
+        InvalidateReportQueriesHandler,
+        RecordReportChangeHandler,
+        ProjectReportViewHandler,
+        NotifyMediaReadyHandler,
         DeleteMediaOnReportDeletionHandler,
         DeleteDeviceReportHandler,
         ChangeDeviceReportHandler,
+        RefreshReportDeviceHandler,
+        RequestReportMediaHandler,
         LoadReportsHandler,
         LoadReportByIdHandler,
+        ExportReportsHandler,
+        SubscribeReportChangesHandler,
     )
     behaviors = provide_all(
         CommitionBehavior,
         GeneratePdfReportBehavior,
+        GeneratePdfReportsBehavior,
         EventDateSetterBehavior,
         EventIdGenerationBehavior,
         EventPublishingBehavior,
+        QueryCoalescingBehavior,
+        QueryCachingBehavior,
+        QueryCacheInvalidationBehavior,
+        MediaReadyPublishingBehavior,
+        ReportChangePublishingBehavior,
+        AuthenticationBehavior,
     )
 
 
@@ -269,12 +472,22 @@ class WorkerApplicationHandlersProvider(Provider):
         GeneratePdfReportHandler,
         LogReportMediaCreatedNotHandler,
         LogReportMediaDeletedNotHandler,
+        EvictPresignedUrlOnMediaDeletionHandler,
+        AddEventToOutboxHandler,
+        InvalidateReportQueriesHandler,
+        RecordReportChangeHandler,
+        ProjectReportViewHandler,
+        NotifyMediaReadyHandler,
     )
     behaviors = provide_all(
         CommitionBehavior,
         EventDateSetterBehavior,
         EventIdGenerationBehavior,
         EventPublishingBehavior,
+        QueryCoalescingBehavior,
+        QueryCacheInvalidationBehavior,
+        MediaReadyPublishingBehavior,
+        ReportChangePublishingBehavior,
     )
 
 
@@ -287,11 +500,18 @@ class BazarioProvider(Provider):
 
         registry.add_request_handler(LoadReportById, LoadReportByIdHandler)
         registry.add_request_handler(LoadReports, LoadReportsHandler)
+        registry.add_request_handler(ExportReports, ExportReportsHandler)
+        registry.add_request_handler(
+            SubscribeReportChanges, SubscribeReportChangesHandler
+        )
         registry.add_request_handler(LoadMediaByReportId, LoadMediaByReportIdHandler)
         registry.add_request_handler(GeneratePdfReport, GeneratePdfReportHandler)
         registry.add_request_handler(AddDeviceReport, AddDeviceReportHandler)
+        registry.add_request_handler(AddDeviceReports, AddDeviceReportsHandler)
         registry.add_request_handler(ChangeDeviceReport, ChangeDeviceReportHandler)
         registry.add_request_handler(DeleteDeviceReport, DeleteDeviceReportHandler)
+        registry.add_request_handler(RefreshReportDevice, RefreshReportDeviceHandler)
+        registry.add_request_handler(RequestReportMedia, RequestReportMediaHandler)
         registry.add_notification_handlers(
             ReportDeleted, DeleteMediaOnReportDeletionHandler
         )
@@ -309,9 +529,35 @@ class BazarioProvider(Provider):
         )
         registry.add_notification_handlers(ReportDeleted, LogReportDeletedNotHandler)
         registry.add_notification_handlers(
-            ReportMediaDeleted, LogReportMediaDeletedNotHandler
+            ReportMediaDeleted,
+            LogReportMediaDeletedNotHandler,
+            EvictPresignedUrlOnMediaDeletionHandler,
         )
+        registry.add_notification_handlers(DomainEvent, AddEventToOutboxHandler)
+        registry.add_notification_handlers(ReportMediaGenerated, NotifyMediaReadyHandler)
+        for event in (
+            DeviceReportCreated,
+            ReportNameChanged,
+            ReportCommentChanged,
+            ReportDeleted,
+            ReportMediaGenerated,
+            ReportMediaDeleted,
+        ):
+            registry.add_notification_handlers(event, InvalidateReportQueriesHandler)
+        for projected_event in (
+            DeviceReportCreated,
+            ReportNameChanged,
+            ReportCommentChanged,
+            ReportDeleted,
+            ReportMediaGenerated,
+            ReportMediaDeleted,
+        ):
+            # Changes are recorded first, while deleted reports are still in the view.
+            registry.add_notification_handlers(
+                projected_event, RecordReportChangeHandler, ProjectReportViewHandler
+            )
         registry.add_pipeline_behaviors(AddDeviceReport, GeneratePdfReportBehavior)
+        registry.add_pipeline_behaviors(AddDeviceReports, GeneratePdfReportsBehavior)
         registry.add_pipeline_behaviors(
             DomainEvent, EventDateSetterBehavior, EventIdGenerationBehavior
         )
@@ -319,7 +565,15 @@ class BazarioProvider(Provider):
             Command,
             EventPublishingBehavior,
             CommitionBehavior,
+            QueryCacheInvalidationBehavior,
+            MediaReadyPublishingBehavior,
+            ReportChangePublishingBehavior,
         )
+        registry.add_pipeline_behaviors(Query, QueryCoalescingBehavior)
+        registry.add_pipeline_behaviors(
+            CachedQuery, QueryCachingBehavior, AuthenticationBehavior
+        )
+        registry.add_pipeline_behaviors(StreamingQuery, AuthenticationBehavior)
         return registry
 
     resolver = provide(WithParents[DishkaResolver])  # type: ignore[misc]
@@ -333,6 +587,204 @@ class CliConfigProvider(Provider):
     uvicorn_config = from_context(UvicornConfig)
     uvicorn_server = from_context(UvicornServer)
     hatchet_worker = from_context(Worker)
+    database_config = from_context(DatabaseConfig)
+
+
+class PdfRenderProvider(Provider):
+    scope = Scope.REQUEST
+
+    pdf_render_config = from_context(PdfRenderConfig, scope=Scope.APP)
+    templates_config = from_context(TemplatesConfig, scope=Scope.APP)
+    report_generator = provide(WithParents[PdfReportGeneratorImpl])  # type: ignore[misc]
+
+    @provide(scope=Scope.APP)
+    def templates_loader(self, config: TemplatesConfig) -> TemplatesLoader:
+        return TemplatesLoader(
+            auto_reload=config.auto_reload,
+            bytecode_cache_dir=config.bytecode_cache_dir,
+        )
+
+    @provide(scope=Scope.APP)
+    async def render_pool(self, config: PdfRenderConfig) -> AsyncIterator[PdfRenderPool]:
+        render_pool = PdfRenderPool(
+            workers=config.workers,
+            max_tasks_per_child=config.max_tasks_per_child,
+            timeout=config.timeout,
+        )
+        await render_pool.start()
+        yield render_pool
+        await render_pool.close()
+
+
+class OutboxProvider(Provider):
+    scope = Scope.REQUEST
+
+    outbox_config = from_context(OutboxConfig, scope=Scope.APP)
+    pdf_workflow_config = from_context(PdfWorkflowConfig, scope=Scope.APP)
+    outbox = provide(Outbox)
+
+    @provide(scope=Scope.APP)
+    def pdf_workflow(self, config: PdfWorkflowConfig) -> Workflow:
+        return pdf_report_workflow(fused=config.fused)
+
+    @provide(scope=Scope.APP)
+    def pdf_prewarm_policy(self, config: PdfWorkflowConfig) -> PdfPrewarmPolicy:
+        return PdfPrewarmPolicy(
+            lazy=config.lazy,
+            device_types=frozenset(
+                DeviceType(device_type) for device_type in config.prewarm_device_types
+            ),
+        )
+
+    @provide
+    def pdf_render_scheduler(
+        self,
+        session: AsyncSession,
+        outbox: Outbox,
+        workflow: Workflow,
+        time_provider: TimeProvider,
+        config: PdfWorkflowConfig,
+    ) -> PdfRenderScheduler:
+        return OutboxPdfRenderScheduler(
+            session=session,
+            outbox=outbox,
+            workflow=workflow,
+            time_provider=time_provider,
+            stale_after=timedelta(seconds=config.render_stale_after),
+        )
+
+    @provide(scope=Scope.APP)
+    async def outbox_relay(
+        self,
+        session_maker: async_sessionmaker[AsyncSession],
+        config: OutboxConfig,
+        time_provider: TimeProvider,
+        logger: Logger,
+    ) -> AsyncIterator[OutboxRelay]:
+        relay = OutboxRelay(
+            session_maker=session_maker,
+            hatchet=HATCHET,
+            workflows=PDF_REPORT_WORKFLOWS,
+            logger=logger,
+            batch_size=config.batch_size,
+            poll_interval=config.poll_interval,
+            claim_timeout=timedelta(seconds=config.claim_timeout),
+            time_provider=time_provider,
+        )
+
+        if config.relay_enabled:
+            relay.start()
+
+        yield relay
+        await relay.stop()
+
+
+class QueryCacheProvider(Provider):
+    scope = Scope.REQUEST
+
+    query_cache_config = from_context(QueryCacheConfig, scope=Scope.APP)
+    query_cache_metrics = provide(QueryCacheMetrics, scope=Scope.APP)
+    query_cache_invalidator = provide(QueryCacheInvalidator)
+    query_coalescer = provide(QueryCoalescer, scope=Scope.APP)
+
+    @provide(scope=Scope.APP)
+    async def query_cache(
+        self, config: QueryCacheConfig, broadcast: Broadcast
+    ) -> AsyncIterator[QueryCache]:
+        cache: QueryCache
+
+        if config.backend == "redis":
+            cache = RedisQueryCache(
+                RespConnection(uri=config.redis_uri, timeout=config.redis_timeout)
+            )
+        else:
+            cache = MemoryQueryCache(max_size=config.max_size)
+            broadcast.subscribe(QUERY_CACHE_INVALIDATION_TOPIC, cache.invalidate)
+
+        yield cache
+        await cache.close()
+
+    @provide(scope=Scope.APP)
+    def query_cache_policy(self, config: QueryCacheConfig) -> QueryCachePolicy:
+        return QueryCachePolicy(default_ttl=config.default_ttl, ttls=config.ttls)
+
+
+class MediaReadyProvider(Provider):
+    scope = Scope.REQUEST
+
+    media_ready_config = from_context(MediaReadyConfig, scope=Scope.APP)
+    media_waiters = provide(
+        WithParents[InProcessMediaWaiters],  # type: ignore[misc]
+        scope=Scope.APP,
+    )
+    media_ready_notifier = provide(MediaReadyNotifier)
+
+    @provide(scope=Scope.APP)
+    def media_ready_bus(
+        self, broadcast: Broadcast, waiters: InProcessMediaWaiters
+    ) -> MediaReadyBus:
+        bus = MediaReadyBus(broadcast=broadcast, waiters=waiters)
+        broadcast.subscribe(MEDIA_READY_TOPIC, bus.receive)
+
+        return bus
+
+
+class BroadcastProvider(Provider):
+    scope = Scope.APP
+
+    broadcast_config = from_context(BroadcastConfig)
+
+    @provide
+    async def broadcast(
+        self,
+        config: BroadcastConfig,
+        session_maker: async_sessionmaker[AsyncSession],
+        time_provider: TimeProvider,
+        logger: Logger,
+    ) -> AsyncIterator[Broadcast]:
+        broadcast: Broadcast
+
+        if config.backend == "redis":
+            broadcast = RedisBroadcast(
+                publisher=RespConnection(
+                    uri=config.redis_uri, timeout=config.redis_timeout
+                ),
+                subscriber=RespConnection(
+                    uri=config.redis_uri, timeout=config.redis_timeout
+                ),
+                logger=logger,
+            )
+        elif config.backend == "memory":
+            broadcast = MemoryBroadcast(logger)
+        else:
+            broadcast = SqlBroadcast(
+                session_maker=session_maker,
+                time_provider=time_provider,
+                logger=logger,
+                poll_interval=config.poll_interval,
+                retention=timedelta(seconds=config.retention),
+            )
+
+        yield broadcast
+        await broadcast.close()
+
+
+class ReportChangesProvider(Provider):
+    scope = Scope.REQUEST
+
+    report_changes_config = from_context(ReportChangesConfig, scope=Scope.APP)
+    report_change_recorder = provide(ReportChangeRecorder)
+
+    @provide(scope=Scope.APP)
+    def report_change_hub(
+        self, config: ReportChangesConfig, broadcast: Broadcast, logger: Logger
+    ) -> Iterator[ReportChangeHub]:
+        hub = ReportChangeHub(queue_size=config.queue_size, logger=logger)
+        broadcast.subscribe(REPORT_CHANGES_TOPIC, hub.receive)
+        yield hub
+        hub.close()
+
+    report_changes = alias(ReportChangeHub, provides=ReportChanges)
 
 
 class SioConfigProvider(Provider):
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from datetime import datetime
 
 from reports.domain.media.value_objects import MediaMetadata
 from reports.domain.shared.events import DomainEvent
@@ -11,9 +12,11 @@ class ReportMediaGenerated(DomainEvent):
     uploaded_by: UserId
     metadata: MediaMetadata
     report_id: ReportId
+    uploaded_at: datetime
 
 
 @dataclass(frozen=True)
 class ReportMediaDeleted(DomainEvent):
     media_id: MediaId
+    metadata: MediaMetadata
     report_id: ReportId
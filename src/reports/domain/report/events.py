@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from datetime import datetime
 
 from reports.domain.shared.events import DomainEvent
 from reports.domain.types import DeviceId, DeviceType, ReportId, UserId
@@ -12,6 +13,7 @@ class DeviceReportCreated(DomainEvent):
     report_name: str
     device_id: DeviceId
     device_type: DeviceType
+    created_at: datetime
 
 
 @dataclass(frozen=True)
@@ -1,15 +1,18 @@
 from abc import ABC, abstractmethod
+from collections.abc import Iterable
 
 from reports.domain.report.report import DeviceReport
-from reports.domain.types import ReportId
+from reports.domain.types import DeviceId, ReportId
 
 
 class ReportRepository(ABC):
     @abstractmethod
     def add(self, report: DeviceReport) -> None: ...
     @abstractmethod
+    def add_many(self, reports: Iterable[DeviceReport]) -> None: ...
+    @abstractmethod
     async def delete(self, report: DeviceReport) -> None: ...
     @abstractmethod
-    async def with_device_id(self, device_id: ReportId) -> list[DeviceReport]: ...
+    async def with_device_id(self, device_id: DeviceId) -> list[DeviceReport]: ...
     @abstractmethod
     async def device_report_with_id(self, report_id: ReportId) -> DeviceReport | None: ...
@@ -0,0 +1,53 @@
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from collections.abc import Awaitable, Callable
+from typing import Any
+from uuid import uuid4
+
+from structlog.stdlib import BoundLogger as Logger
+
+# Messages must be JSON compatible, handlers in this process receive them as is.
+type BroadcastHandler = Callable[[list[Any]], Awaitable[None]]
+
+
+class BroadcastUnavailableError(Exception): ...
+
+
+class Broadcast(ABC):
+    def __init__(self, logger: Logger) -> None:
+        self._logger = logger
+        self._origin = uuid4().hex
+        self._handlers: defaultdict[str, list[BroadcastHandler]] = defaultdict(list)
+
+    def subscribe(self, topic: str, handler: BroadcastHandler) -> None:
+        self._handlers[topic].append(handler)
+
+    async def publish(self, topic: str, messages: list[Any]) -> None:
+        if not messages:
+            return
+
+        # Handlers in this process do not have to wait for the round trip.
+        await self._deliver(topic, messages)
+        await self._send(topic, messages)
+
+    @abstractmethod
+    def start(self) -> None: ...
+    @abstractmethod
+    async def close(self) -> None: ...
+    @abstractmethod
+    async def _send(self, topic: str, messages: list[Any]) -> None: ...
+
+    async def _deliver(self, topic: str, messages: list[Any]) -> None:
+        for handler in self._handlers.get(topic, ()):
+            try:
+                await handler(messages)
+            except Exception:
+                self._logger.exception(event="broadcast_handler_failed", topic=topic)
+
+
+class MemoryBroadcast(Broadcast):
+    def start(self) -> None: ...
+
+    async def close(self) -> None: ...
+
+    async def _send(self, topic: str, messages: list[Any]) -> None: ...
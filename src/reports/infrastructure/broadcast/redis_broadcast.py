@@ -0,0 +1,78 @@
+import asyncio
+from contextlib import suppress
+from typing import Any, Final
+
+from pydantic_core import from_json, to_json
+from structlog.stdlib import BoundLogger as Logger
+
+from reports.infrastructure.broadcast.broadcast import (
+    Broadcast,
+    BroadcastUnavailableError,
+)
+from reports.infrastructure.redis.connection import (
+    RedisUnavailableError,
+    RespConnection,
+)
+
+
+class RedisBroadcast(Broadcast):
+    _CHANNEL: Final[str] = "reports:broadcast"
+    _RECONNECT_DELAY: Final[float] = 1.0
+
+    def __init__(
+        self, publisher: RespConnection, subscriber: RespConnection, logger: Logger
+    ) -> None:
+        super().__init__(logger)
+        self._publisher = publisher
+        self._subscriber = subscriber
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        if not self._task:
+            self._task = asyncio.create_task(self._listen())
+
+    async def close(self) -> None:
+        if self._task:
+            self._task.cancel()
+
+            with suppress(asyncio.CancelledError):
+                await self._task
+
+            self._task = None
+
+        await self._publisher.close()
+
+    async def _send(self, topic: str, messages: list[Any]) -> None:
+        payload = to_json({"origin": self._origin, "topic": topic, "messages": messages})
+
+        try:
+            await self._publisher.execute(("PUBLISH", self._CHANNEL, payload))
+        except RedisUnavailableError as error:
+            raise BroadcastUnavailableError from error
+
+    async def _listen(self) -> None:
+        while True:
+            try:
+                async for payload in self._subscriber.subscribe(self._CHANNEL):
+                    await self._receive(payload)
+            except RedisUnavailableError:
+                self._logger.warning(event="broadcast_subscription_lost")
+            except Exception:
+                self._logger.exception(event="broadcast_subscription_failed")
+
+            await asyncio.sleep(self._RECONNECT_DELAY)
+
+    async def _receive(self, payload: bytes) -> None:
+        try:
+            envelope = from_json(payload)
+            origin, topic, messages = (
+                envelope["origin"],
+                envelope["topic"],
+                envelope["messages"],
+            )
+        except (ValueError, KeyError, TypeError):
+            self._logger.warning(event="broadcast_message_invalid")
+            return
+
+        if origin != self._origin:
+            await self._deliver(topic, messages)
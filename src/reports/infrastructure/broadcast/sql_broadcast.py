@@ -0,0 +1,142 @@
+import asyncio
+from collections.abc import Sequence
+from contextlib import suppress
+from datetime import datetime, timedelta
+from typing import Any, Final
+
+from sqlalchemy import Row, delete, func, insert, or_, select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from structlog.stdlib import BoundLogger as Logger
+
+from reports.application.ports.time_provider import TimeProvider
+from reports.infrastructure.broadcast.broadcast import (
+    Broadcast,
+    BroadcastUnavailableError,
+)
+from reports.infrastructure.persistence.sql_tables import BROADCAST_MESSAGE_TABLE
+
+
+class SqlBroadcast(Broadcast):
+    # Ids are taken before the commit, so a skipped id may still show up for a
+    # while when a slower transaction commits after a faster one.
+    _GAP_TIMEOUT: Final[timedelta] = timedelta(seconds=5)
+
+    def __init__(
+        self,
+        session_maker: async_sessionmaker[AsyncSession],
+        time_provider: TimeProvider,
+        logger: Logger,
+        poll_interval: float,
+        retention: timedelta,
+    ) -> None:
+        super().__init__(logger)
+        self._session_maker = session_maker
+        self._time_provider = time_provider
+        self._poll_interval = poll_interval
+        self._retention = retention
+        self._last_id: int | None = None
+        self._gaps: dict[int, datetime] = {}
+        self._pruned_at: datetime | None = None
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        if not self._task:
+            self._task = asyncio.create_task(self._run())
+
+    async def close(self) -> None:
+        if not self._task:
+            return
+
+        self._task.cancel()
+
+        with suppress(asyncio.CancelledError):
+            await self._task
+
+        self._task = None
+
+    async def _send(self, topic: str, messages: list[Any]) -> None:
+        try:
+            async with self._session_maker() as session:
+                await session.execute(
+                    insert(BROADCAST_MESSAGE_TABLE).values(
+                        origin=self._origin,
+                        topic=topic,
+                        payload=messages,
+                        created_at=self._time_provider.current(),
+                    )
+                )
+                await session.commit()
+        except (SQLAlchemyError, OSError) as error:
+            raise BroadcastUnavailableError from error
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self._receive()
+            except Exception:
+                self._logger.exception(event="broadcast_receive_failed")
+
+            await asyncio.sleep(self._poll_interval)
+
+    async def _receive(self) -> None:
+        now = self._time_provider.current()
+
+        async with self._session_maker() as session:
+            if self._last_id is None:
+                # Only messages published after the start are delivered.
+                self._last_id = await self._newest_id(session)
+                return
+
+            messages = await self._fetch(session, self._last_id)
+
+            if self._pruned_at is None or now - self._pruned_at >= self._retention:
+                await session.execute(
+                    delete(BROADCAST_MESSAGE_TABLE).where(
+                        BROADCAST_MESSAGE_TABLE.c.created_at < now - self._retention
+                    )
+                )
+                await session.commit()
+                self._pruned_at = now
+
+        self._track(messages, now)
+
+        for message in messages:
+            if message.origin != self._origin:
+                await self._deliver(message.topic, message.payload)
+
+    async def _newest_id(self, session: AsyncSession) -> int:
+        stmt = select(func.max(BROADCAST_MESSAGE_TABLE.c.message_id))
+
+        return (await session.scalar(stmt)) or 0
+
+    async def _fetch(self, session: AsyncSession, last_id: int) -> Sequence[Row]:
+        message_id = BROADCAST_MESSAGE_TABLE.c.message_id
+        stmt = (
+            select(BROADCAST_MESSAGE_TABLE)
+            .where(or_(message_id > last_id, message_id.in_(self._gaps)))
+            .order_by(message_id)
+        )
+
+        return (await session.execute(stmt)).all()
+
+    def _track(self, messages: Sequence[Row], now: datetime) -> None:
+        expires_at = now + self._GAP_TIMEOUT
+        last_id = self._last_id or 0
+
+        for message in messages:
+            self._gaps.pop(message.message_id, None)
+
+            if message.message_id > last_id:
+                self._gaps.update(
+                    dict.fromkeys(range(last_id + 1, message.message_id), expires_at)
+                )
+                last_id = message.message_id
+
+        self._last_id = last_id
+
+        self._gaps = {
+            message_id: gap_expires_at
+            for message_id, gap_expires_at in self._gaps.items()
+            if gap_expires_at > now
+        }
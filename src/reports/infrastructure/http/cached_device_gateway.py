@@ -0,0 +1,145 @@
+import asyncio
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import partial
+from time import monotonic
+
+from reports.application.models.device import DeviceReadModel
+from reports.application.ports.device_gateway import DeviceGateway
+from reports.domain.types import DeviceId, DeviceType
+
+type _DeviceKey = tuple[DeviceType, DeviceId]
+
+
+@dataclass(frozen=True, slots=True)
+class _CachedDevice:
+    device: DeviceReadModel | None
+    fresh_until: float
+    stale_until: float
+
+
+@dataclass(frozen=True)
+class DeviceCacheStatistics:
+    hits: int
+    stale_hits: int
+    misses: int
+    size: int
+
+
+class CachedDeviceGateway(DeviceGateway):
+    def __init__(
+        self,
+        device_gateway: DeviceGateway,
+        max_size: int,
+        ttl: float,
+        stale_ttl: float,
+        negative_ttl: float,
+    ) -> None:
+        self._device_gateway = device_gateway
+        self._max_size = max_size
+        self._ttl = ttl
+        self._stale_ttl = stale_ttl
+        self._negative_ttl = negative_ttl
+        self._entries: OrderedDict[_DeviceKey, _CachedDevice] = OrderedDict()
+        self._loading: dict[_DeviceKey, asyncio.Task[DeviceReadModel | None]] = {}
+        self._hits = 0
+        self._stale_hits = 0
+        self._misses = 0
+
+    async def load(
+        self, device_id: DeviceId, device_type: DeviceType
+    ) -> DeviceReadModel | None:
+        key = (device_type, device_id)
+        entry = self._entries.get(key)
+        now = monotonic()
+
+        if entry and now < entry.fresh_until:
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry.device
+
+        if entry and now < entry.stale_until:
+            self._entries.move_to_end(key)
+            self._stale_hits += 1
+            self._start_loading(key)
+            return entry.device
+
+        self._misses += 1
+        return await asyncio.shield(self._start_loading(key))
+
+    async def reload(
+        self, device_id: DeviceId, device_type: DeviceType
+    ) -> DeviceReadModel | None:
+        key = (device_type, device_id)
+
+        # A lookup already in flight may have started before the device changed.
+        if task := self._loading.get(key):
+            await asyncio.gather(task, return_exceptions=True)
+
+        return await asyncio.shield(self._start_loading(key))
+
+    def statistics(self) -> DeviceCacheStatistics:
+        return DeviceCacheStatistics(
+            hits=self._hits,
+            stale_hits=self._stale_hits,
+            misses=self._misses,
+            size=len(self._entries),
+        )
+
+    async def close(self) -> None:
+        tasks = list(self._loading.values())
+
+        for task in tasks:
+            task.cancel()
+
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _start_loading(self, key: _DeviceKey) -> asyncio.Task[DeviceReadModel | None]:
+        if task := self._loading.get(key):
+            return task
+
+        task = asyncio.create_task(self._load(key))
+        self._loading[key] = task
+        task.add_done_callback(partial(self._finish_loading, key))
+
+        return task
+
+    def _finish_loading(
+        self, key: _DeviceKey, task: asyncio.Task[DeviceReadModel | None]
+    ) -> None:
+        self._loading.pop(key, None)
+
+        # A failed background refresh keeps serving the stale entry.
+        if not task.cancelled():
+            task.exception()
+
+    async def _load(self, key: _DeviceKey) -> DeviceReadModel | None:
+        device_type, device_id = key
+        device = await self._device_gateway.load(
+            device_id=device_id, device_type=device_type
+        )
+        self._store(key, device)
+
+        return device
+
+    def _store(self, key: _DeviceKey, device: DeviceReadModel | None) -> None:
+        now = monotonic()
+
+        if device is None:
+            entry = _CachedDevice(
+                device=None,
+                fresh_until=now + self._negative_ttl,
+                stale_until=now + self._negative_ttl,
+            )
+        else:
+            entry = _CachedDevice(
+                device=device,
+                fresh_until=now + self._ttl,
+                stale_until=now + self._ttl + self._stale_ttl,
+            )
+
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
@@ -0,0 +1,61 @@
+import asyncio
+from contextlib import suppress
+from dataclasses import dataclass, field
+from itertools import cycle
+from time import monotonic
+
+from reports.infrastructure.http.http_glpi_auth_client import (
+    GlpiAuthClient,
+    SessionToken,
+)
+
+
+@dataclass
+class _GlpiSession:
+    token: SessionToken | None = field(default=None)
+    expires_at: float = field(default=0.0)
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+
+class GlpiSessionManager:
+    def __init__(
+        self,
+        auth_client: GlpiAuthClient,
+        pool_size: int,
+        ttl: float,
+        refresh_margin: float,
+    ) -> None:
+        self._auth_client = auth_client
+        self._ttl = ttl
+        self._refresh_margin = refresh_margin
+        self._sessions = [_GlpiSession() for _ in range(max(pool_size, 1))]
+        self._next_session = cycle(self._sessions)
+
+    async def session_token(self) -> SessionToken:
+        session = next(self._next_session)
+
+        if session.token is not None and monotonic() < session.expires_at:
+            return session.token
+
+        async with session.lock:
+            if session.token is None or monotonic() >= session.expires_at:
+                # The superseded session is left to expire on the GLPI side.
+                session.token = await self._auth_client.init_session()
+                session.expires_at = monotonic() + self._ttl - self._refresh_margin
+
+            return session.token
+
+    def expire(self, session_token: SessionToken) -> None:
+        for session in self._sessions:
+            if session.token == session_token:
+                session.token = None
+
+    async def close(self) -> None:
+        for session in self._sessions:
+            if session.token is None:
+                continue
+
+            with suppress(Exception):
+                await self._auth_client.kill_session(session.token)
+
+            session.token = None
@@ -1,50 +1,84 @@
 from datetime import timedelta
+from json import JSONDecodeError
 from typing import Any
 
-from httpx import AsyncClient, HTTPStatusError, RequestError
+from httpx import AsyncClient, HTTPStatusError, RequestError, Response, codes
 from tenacity import (
+    RetryError,
     retry,
     retry_if_exception_type,
     stop_after_attempt,
     wait_exponential,
 )
 
+from reports.application.common.application_error import ApplicationError
 from reports.application.models.device import DeviceReadModel
 from reports.application.ports.device_gateway import DeviceGateway
 from reports.domain.types import DeviceId, DeviceType
-from reports.infrastructure.http.http_glpi_auth_client import GlpiAuthClient
+from reports.infrastructure.http.glpi_session_manager import GlpiSessionManager
 
 
 class HttpDeviceGateway(DeviceGateway):
-    def __init__(self, client: AsyncClient, auth_client: GlpiAuthClient) -> None:
+    def __init__(self, client: AsyncClient, session_manager: GlpiSessionManager) -> None:
         self._client = client
-        self._glpi_auth_client = auth_client
+        self._session_manager = session_manager
+
+    async def load(
+        self, device_id: DeviceId, device_type: DeviceType
+    ) -> DeviceReadModel | None:
+        try:
+            return await self._load_device(device_id, device_type)
+        except (
+            RetryError,
+            RequestError,
+            HTTPStatusError,
+            JSONDecodeError,
+            TimeoutError,
+        ) as error:
+            raise ApplicationError(
+                message=f"Failed to load device {device_id} of type {device_type}"
+                " from GLPI API"
+            ) from error
+
+    async def reload(
+        self, device_id: DeviceId, device_type: DeviceType
+    ) -> DeviceReadModel | None:
+        return await self.load(device_id=device_id, device_type=device_type)
 
     @retry(
         retry=retry_if_exception_type((RequestError, HTTPStatusError)),
         wait=wait_exponential(multiplier=1, min=timedelta(seconds=3), max=10),
         stop=stop_after_attempt(5),
     )
-    async def load(
+    async def _load_device(
         self, device_id: DeviceId, device_type: DeviceType
     ) -> DeviceReadModel | None:
-        async with self._glpi_auth_client as session:
-            _header = {"Session-Token": session}
+        response = await self._get(url=f"/{device_type}/{device_id}")
 
-            response = await self._client.get(
-                url=f"/{device_type}/{device_id}",
-                headers=_header,
-            )
+        data: dict[str, Any] = response.json()
 
-            data: dict[str, Any] = response.json()
+        if response.status_code != 200 or not data:
+            return None
 
-            if response.status_code != 200 or not data:
-                return None
+        try:
+            return self._load(data)
+        except (KeyError, AttributeError):
+            return None
+
+    async def _get(self, url: str) -> Response:
+        session_token = await self._session_manager.session_token()
+        response = await self._client.get(
+            url=url, headers={"Session-Token": session_token}
+        )
+
+        if response.status_code == codes.UNAUTHORIZED:
+            self._session_manager.expire(session_token)
+            session_token = await self._session_manager.session_token()
+            response = await self._client.get(
+                url=url, headers={"Session-Token": session_token}
+            )
 
-            try:
-                return self._load(data)
-            except (KeyError, AttributeError):
-                return None
+        return response
 
     def _load(self, data: dict[str, Any]) -> DeviceReadModel:
         return DeviceReadModel(
@@ -52,4 +86,5 @@ class HttpDeviceGateway(DeviceGateway):
             device_inventory_number=data["otherserial"],
             device_serial_number=data["serial"],
             device_name=data.get("name"),
+            payload=data,
         )
@@ -46,6 +46,7 @@ class MediaFactoryImpl(MediaFactory):
                 uploaded_by=report_media.uploaded_by,
                 metadata=report_media.metadata,
                 report_id=report_media.report_id,
+                uploaded_at=report_media.uploaded_at,
             )
         )
 
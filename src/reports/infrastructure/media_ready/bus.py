@@ -0,0 +1,23 @@
+from collections.abc import Iterable
+from typing import Any, Final
+from uuid import UUID
+
+from reports.domain.types import ReportId
+from reports.infrastructure.broadcast.broadcast import Broadcast
+from reports.infrastructure.media_ready.waiters import InProcessMediaWaiters
+
+MEDIA_READY_TOPIC: Final[str] = "media-ready"
+
+
+class MediaReadyBus:
+    def __init__(self, broadcast: Broadcast, waiters: InProcessMediaWaiters) -> None:
+        self._broadcast = broadcast
+        self._waiters = waiters
+
+    async def publish(self, report_ids: Iterable[ReportId]) -> None:
+        await self._broadcast.publish(
+            MEDIA_READY_TOPIC, [str(report_id) for report_id in report_ids]
+        )
+
+    async def receive(self, messages: list[Any]) -> None:
+        self._waiters.notify(ReportId(UUID(message)) for message in messages)
@@ -0,0 +1,52 @@
+from bazario.asyncio import HandleNext, NotificationHandler, PipelineBehavior
+from structlog.stdlib import BoundLogger as Logger
+
+from reports.application.common.markers import Command
+from reports.domain.media.events import ReportMediaGenerated
+from reports.domain.types import ReportId
+from reports.infrastructure.broadcast.broadcast import BroadcastUnavailableError
+from reports.infrastructure.media_ready.bus import MediaReadyBus
+
+
+class MediaReadyNotifier:
+    def __init__(self, bus: MediaReadyBus, logger: Logger) -> None:
+        self._bus = bus
+        self._logger = logger
+        self._report_ids: list[ReportId] = []
+
+    def add(self, report_id: ReportId) -> None:
+        self._report_ids.append(report_id)
+
+    async def publish(self) -> None:
+        report_ids, self._report_ids = self._report_ids, []
+
+        if not report_ids:
+            return
+
+        try:
+            await self._bus.publish(report_ids)
+        except BroadcastUnavailableError:
+            self._logger.warning(
+                event="media_ready_publish_failed", report_ids=report_ids
+            )
+
+
+class MediaReadyPublishingBehavior[C: Command, R](PipelineBehavior[C, R]):
+    def __init__(self, notifier: MediaReadyNotifier) -> None:
+        self._notifier = notifier
+
+    async def handle(self, request: C, handle_next: HandleNext[C, R]) -> R:
+        response = await handle_next(request)
+
+        # Waiters re-read the media, so they are only woken after the commit.
+        await self._notifier.publish()
+
+        return response
+
+
+class NotifyMediaReadyHandler(NotificationHandler[ReportMediaGenerated]):
+    def __init__(self, notifier: MediaReadyNotifier) -> None:
+        self._notifier = notifier
+
+    async def handle(self, notification: ReportMediaGenerated) -> None:
+        self._notifier.add(notification.report_id)
@@ -0,0 +1,39 @@
+import asyncio
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+
+from reports.application.ports.media_waiters import MediaWaiters, MediaWatch
+from reports.domain.types import ReportId
+
+
+class _EventWatch(MediaWatch):
+    def __init__(self) -> None:
+        self.ready = asyncio.Event()
+
+    async def wait(self) -> None:
+        await self.ready.wait()
+
+
+class InProcessMediaWaiters(MediaWaiters):
+    def __init__(self) -> None:
+        self._watches: defaultdict[ReportId, set[_EventWatch]] = defaultdict(set)
+
+    @contextmanager
+    def watch(self, report_id: ReportId) -> Iterator[MediaWatch]:
+        watch = _EventWatch()
+        self._watches[report_id].add(watch)
+
+        try:
+            yield watch
+        finally:
+            watches = self._watches[report_id]
+            watches.discard(watch)
+
+            if not watches:
+                del self._watches[report_id]
+
+    def notify(self, report_ids: Iterable[ReportId]) -> None:
+        for report_id in report_ids:
+            for watch in self._watches.get(report_id, ()):
+                watch.ready.set()
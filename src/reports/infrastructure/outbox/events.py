@@ -0,0 +1,12 @@
+from bazario.asyncio import NotificationHandler
+
+from reports.domain.shared.events import DomainEvent
+from reports.infrastructure.outbox.outbox import Outbox
+
+
+class AddEventToOutboxHandler(NotificationHandler[DomainEvent]):
+    def __init__(self, outbox: Outbox) -> None:
+        self._outbox = outbox
+
+    async def handle(self, notification: DomainEvent) -> None:
+        await self._outbox.add_event(notification)
@@ -0,0 +1,76 @@
+from collections.abc import Iterable
+from dataclasses import asdict
+from enum import StrEnum
+from typing import Any
+
+from hatchet_sdk.runnables.workflow import Workflow
+from pydantic import BaseModel
+from pydantic_core import to_jsonable_python
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from uuid_extensions import uuid7
+
+from reports.application.ports.time_provider import TimeProvider
+from reports.domain.shared.events import DomainEvent
+from reports.infrastructure.persistence.sql_tables import OUTBOX_MESSAGE_TABLE
+
+
+class OutboxMessageKind(StrEnum):
+    WORKFLOW_RUN = "workflow_run"
+    DOMAIN_EVENT = "domain_event"
+
+
+class Outbox:
+    def __init__(self, session: AsyncSession, time_provider: TimeProvider) -> None:
+        self._session = session
+        self._time_provider = time_provider
+
+    async def add_workflow_run(
+        self, workflow: Workflow, workflow_input: BaseModel
+    ) -> None:
+        await self.add_workflow_runs(workflow, [workflow_input])
+
+    async def add_workflow_runs(
+        self, workflow: Workflow, workflow_inputs: Iterable[BaseModel]
+    ) -> None:
+        await self._add_many(
+            message_kind=OutboxMessageKind.WORKFLOW_RUN,
+            message_name=workflow.name,
+            payloads=[
+                workflow_input.model_dump(mode="json")
+                for workflow_input in workflow_inputs
+            ],
+        )
+
+    async def add_event(self, event: DomainEvent) -> None:
+        await self._add_many(
+            message_kind=OutboxMessageKind.DOMAIN_EVENT,
+            message_name=event.event_type,
+            payloads=[to_jsonable_python(asdict(event))],
+        )
+
+    async def _add_many(
+        self,
+        message_kind: OutboxMessageKind,
+        message_name: str,
+        payloads: list[dict[str, Any]],
+    ) -> None:
+        if not payloads:
+            return
+
+        created_at = self._time_provider.current()
+
+        await self._session.execute(
+            insert(OUTBOX_MESSAGE_TABLE).values(
+                [
+                    {
+                        "message_id": uuid7(),
+                        "message_kind": message_kind,
+                        "message_name": message_name,
+                        "payload": payload,
+                        "created_at": created_at,
+                    }
+                    for payload in payloads
+                ]
+            )
+        )
@@ -0,0 +1,202 @@
+import asyncio
+from collections import defaultdict
+from collections.abc import Iterable, Sequence
+from contextlib import suppress
+from datetime import timedelta
+from uuid import UUID, uuid4
+
+from hatchet_sdk import Hatchet
+from hatchet_sdk.clients.events import BulkPushEventWithMetadata
+from hatchet_sdk.runnables.workflow import Workflow
+from pydantic import BaseModel, ValidationError
+from pydantic_core import to_json
+from sqlalchemy import Row, delete, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from structlog.stdlib import BoundLogger as Logger
+
+from reports.application.ports.time_provider import TimeProvider
+from reports.infrastructure.outbox.outbox import OutboxMessageKind
+from reports.infrastructure.persistence.sql_tables import OUTBOX_MESSAGE_TABLE
+
+
+class OutboxRelay:
+    _EVENT_KEY_PREFIX = "reports:"
+
+    def __init__(
+        self,
+        session_maker: async_sessionmaker[AsyncSession],
+        hatchet: Hatchet,
+        workflows: Iterable[Workflow],
+        logger: Logger,
+        batch_size: int,
+        poll_interval: float,
+        claim_timeout: timedelta,
+        time_provider: TimeProvider,
+    ) -> None:
+        self._session_maker = session_maker
+        self._hatchet = hatchet
+        self._workflows = {workflow.name: workflow for workflow in workflows}
+        self._logger = logger
+        self._batch_size = batch_size
+        self._poll_interval = poll_interval
+        self._claim_timeout = claim_timeout
+        self._time_provider = time_provider
+        self._relay_id = uuid4().hex
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        if not self._task:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if not self._task:
+            return
+
+        self._task.cancel()
+
+        with suppress(asyncio.CancelledError):
+            await self._task
+
+        self._task = None
+
+    async def relay_batch(self) -> int:
+        async with self._session_maker() as session:
+            messages = await self._claim(session)
+
+            if not messages:
+                return 0
+
+            message_ids = [message.message_id for message in messages]
+
+            try:
+                failures = await self._dispatch(messages)
+            except Exception:
+                # Released right away so another attempt does not wait for expiry.
+                await self._release(session, message_ids)
+                raise
+
+            if failures:
+                await self._fail(session, failures)
+
+            await session.execute(
+                delete(OUTBOX_MESSAGE_TABLE).where(
+                    OUTBOX_MESSAGE_TABLE.c.message_id.in_(message_ids),
+                    OUTBOX_MESSAGE_TABLE.c.claimed_by == self._relay_id,
+                    OUTBOX_MESSAGE_TABLE.c.failed_at.is_(None),
+                )
+            )
+            await session.commit()
+
+            return len(messages)
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                relayed = await self.relay_batch()
+            except Exception:
+                self._logger.exception(event="outbox_relay_failed")
+                relayed = 0
+
+            if relayed < self._batch_size:
+                await asyncio.sleep(self._poll_interval)
+
+    async def _claim(self, session: AsyncSession) -> Sequence[Row]:
+        # Every relay may run this at once; the claim condition is repeated in
+        # the UPDATE so a row is only ever claimed by one of them.
+        outbox = OUTBOX_MESSAGE_TABLE
+        now = self._time_provider.current()
+        claimable = (
+            outbox.c.failed_at.is_(None),
+            or_(
+                outbox.c.claimed_at.is_(None),
+                outbox.c.claimed_at < now - self._claim_timeout,
+            ),
+        )
+        message_ids = (
+            select(outbox.c.message_id)
+            .where(*claimable)
+            .order_by(outbox.c.message_id)
+            .limit(self._batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        stmt = (
+            update(outbox)
+            .where(outbox.c.message_id.in_(message_ids.scalar_subquery()), *claimable)
+            .values(claimed_by=self._relay_id, claimed_at=now)
+            .returning(*outbox.c)
+        )
+        messages = (await session.execute(stmt)).all()
+        await session.commit()
+
+        return sorted(messages, key=lambda message: message.message_id)
+
+    async def _release(self, session: AsyncSession, message_ids: list[UUID]) -> None:
+        await session.rollback()
+        await session.execute(
+            update(OUTBOX_MESSAGE_TABLE)
+            .where(
+                OUTBOX_MESSAGE_TABLE.c.message_id.in_(message_ids),
+                OUTBOX_MESSAGE_TABLE.c.claimed_by == self._relay_id,
+            )
+            .values(claimed_by=None, claimed_at=None)
+        )
+        await session.commit()
+
+    async def _fail(self, session: AsyncSession, failures: dict[UUID, str]) -> None:
+        failed_at = self._time_provider.current()
+
+        for message_id, error in failures.items():
+            await session.execute(
+                update(OUTBOX_MESSAGE_TABLE)
+                .where(OUTBOX_MESSAGE_TABLE.c.message_id == message_id)
+                .values(failed_at=failed_at, error=error)
+            )
+
+        self._logger.error(
+            event="outbox_messages_failed", message_ids=list(failures.keys())
+        )
+
+    async def _dispatch(self, messages: Sequence[Row]) -> dict[UUID, str]:
+        failures: dict[UUID, str] = {}
+        workflow_inputs: defaultdict[str, dict[bytes, BaseModel]] = defaultdict(dict)
+        events: list[BulkPushEventWithMetadata] = []
+
+        for message in messages:
+            if message.message_kind != OutboxMessageKind.WORKFLOW_RUN:
+                events.append(
+                    BulkPushEventWithMetadata(
+                        key=self._EVENT_KEY_PREFIX + message.message_name,
+                        payload=message.payload,
+                    )
+                )
+                continue
+
+            try:
+                workflow_input = self._workflow_input(message)
+            except (KeyError, ValidationError) as error:
+                failures[message.message_id] = repr(error)
+                continue
+
+            # Runs with the same input, e.g. the same report id, are sent once.
+            workflow_inputs[message.message_name].setdefault(
+                to_json(message.payload), workflow_input
+            )
+
+        for workflow_name, inputs in workflow_inputs.items():
+            workflow = self._workflows[workflow_name]
+            await workflow.aio_run_many_no_wait(
+                [
+                    workflow.create_bulk_run_item(input=workflow_input)
+                    for workflow_input in inputs.values()
+                ]
+            )
+
+        if events:
+            await self._hatchet.event.aio_bulk_push(events)
+
+        return failures
+
+    def _workflow_input(self, message: Row) -> BaseModel:
+        workflow = self._workflows[message.message_name]
+
+        return workflow.config.input_validator.model_validate(message.payload)
@@ -1,27 +1,24 @@
-from io import BytesIO
 from typing import Final
 
-from weasyprint import HTML  # type: ignore
-
 from reports.application.models.device import DeviceReadModel
 from reports.application.ports.report_pdf_generator import PdfReport, PdfReportGenerator
 from reports.domain.media.value_objects import MediaMetadata
+from reports.infrastructure.pdf_reports.render_pool import PdfRenderPool
 from reports.infrastructure.pdf_reports.templates_loader import TemplatesLoader
 
 
 class PdfReportGeneratorImpl(PdfReportGenerator):
     _PDF_CONTENT_TYPE: Final[str] = "pdf"
 
-    def __init__(self, loader: TemplatesLoader) -> None:
+    def __init__(self, loader: TemplatesLoader, render_pool: PdfRenderPool) -> None:
         self._loader = loader
+        self._render_pool = render_pool
 
-    def generate(self, device: DeviceReadModel) -> PdfReport:
+    async def generate(self, device: DeviceReadModel) -> PdfReport:
         report_template = self._loader.get_report_template()
         html_content = report_template.render(device=device)
 
-        with BytesIO() as buffer:
-            HTML(string=html_content).write_pdf(buffer)
-            pdf_bytes = buffer.getvalue()
+        pdf_bytes = await self._render_pool.render(html_content)
 
         return self._load(
             media_metadata=MediaMetadata(
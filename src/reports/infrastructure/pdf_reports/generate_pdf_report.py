@@ -1,10 +1,13 @@
-from collections.abc import Awaitable
+from collections.abc import AsyncIterator, Awaitable
+from contextlib import asynccontextmanager
 from dataclasses import asdict
 from typing import TYPE_CHECKING, Any, Final, cast
 
 from bazario.asyncio import Sender
+from dishka import AsyncContainer, Scope
 from hatchet_sdk import Context
 from hatchet_sdk.runnables.workflow import Workflow
+from pydantic_core import to_jsonable_python
 from socketio import AsyncServer
 
 from reports.application.operations.read.load_media_by_report_id import (
@@ -15,20 +18,38 @@ from reports.infrastructure.hatchet_client import HATCHET
 from reports.infrastructure.pdf_reports.shemas import CreatePdfReportRequest
 
 if TYPE_CHECKING:
-    from dishka import AsyncContainer
     from hatchet_sdk.runnables.task import Task
 
 REPORTS_WORKFLOW: Final[Workflow] = HATCHET.workflow(
     name="reports", input_validator=CreatePdfReportRequest
 )
+FUSED_REPORTS_WORKFLOW: Final[Workflow] = HATCHET.workflow(
+    name="reports_fused", input_validator=CreatePdfReportRequest
+)
+# Both are registered so that runs queued before a mode switch still complete.
+PDF_REPORT_WORKFLOWS: Final[tuple[Workflow, ...]] = (
+    REPORTS_WORKFLOW,
+    FUSED_REPORTS_WORKFLOW,
+)
 
 
-@REPORTS_WORKFLOW.task(retries=3, name="generate_pdf_report")
-async def generate_pdf_report_task(req: CreatePdfReportRequest, ctx: Context) -> None:
+def pdf_report_workflow(*, fused: bool) -> Workflow:
+    return FUSED_REPORTS_WORKFLOW if fused else REPORTS_WORKFLOW
+
+
+@asynccontextmanager
+async def _task_container(ctx: Context) -> AsyncIterator[AsyncContainer]:
     container = cast("AsyncContainer", ctx.lifespan.dishka_container)
-    sender = await container.get(Sender)
 
-    await sender.send(request=GeneratePdfReport(device_report_id=req.report_id))
+    async with container(scope=Scope.REQUEST) as task_container:
+        yield task_container
+
+
+@REPORTS_WORKFLOW.task(retries=3, name="generate_pdf_report")
+async def generate_pdf_report_task(req: CreatePdfReportRequest, ctx: Context) -> None:
+    async with _task_container(ctx) as container:
+        sender = await container.get(Sender)
+        await sender.send(request=GeneratePdfReport(device_report_id=req.report_id))
 
 
 @REPORTS_WORKFLOW.task(
@@ -37,10 +58,12 @@ async def generate_pdf_report_task(req: CreatePdfReportRequest, ctx: Context) ->
 async def load_media_by_report_id_task(
     req: CreatePdfReportRequest, ctx: Context
 ) -> dict[str, dict[str, Any]]:
-    container = cast("AsyncContainer", ctx.lifespan.dishka_container)
-    sender = await container.get(Sender)
+    async with _task_container(ctx) as container:
+        sender = await container.get(Sender)
+        media = await sender.send(
+            request=LoadMediaByReportId(device_report_id=req.report_id)
+        )
 
-    media = await sender.send(request=LoadMediaByReportId(device_report_id=req.report_id))
     return {"media": asdict(media)}
 
 
@@ -60,4 +83,22 @@ async def emitting_media_task(
         ),
     )
 
-    await sio.emit(event="Pdf Report", data={"report": media}, room=req.report_id)
+    await sio.emit(event="Pdf Report", data={"report": media}, room=str(req.report_id))
+
+
+@FUSED_REPORTS_WORKFLOW.task(retries=3, name="generate_and_emit_pdf_report")
+async def generate_and_emit_pdf_report_task(
+    req: CreatePdfReportRequest, ctx: Context
+) -> None:
+    async with _task_container(ctx) as container:
+        sender = await container.get(Sender)
+        media = await sender.send(
+            request=GeneratePdfReport(device_report_id=req.report_id)
+        )
+
+    sio = await cast("AsyncContainer", ctx.lifespan.dishka_container).get(AsyncServer)
+    await sio.emit(
+        event="Pdf Report",
+        data={"report": {"media": to_jsonable_python(asdict(media))}},
+        room=str(req.report_id),
+    )
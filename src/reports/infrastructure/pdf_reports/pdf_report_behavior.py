@@ -1,19 +1,65 @@
+from dataclasses import dataclass, field
+
 from bazario.asyncio import HandleNext, PipelineBehavior
 
 from reports.application.operations.write.add_report import AddDeviceReport
-from reports.domain.types import ReportId
-from reports.infrastructure.pdf_reports.generate_pdf_report import REPORTS_WORKFLOW
-from reports.infrastructure.pdf_reports.shemas import CreatePdfReportRequest
+from reports.application.operations.write.add_reports import (
+    AddDeviceReportResult,
+    AddDeviceReports,
+)
+from reports.application.ports.pdf_render_scheduler import PdfRenderScheduler
+from reports.domain.types import DeviceType, ReportId
+
+
+@dataclass(frozen=True)
+class PdfPrewarmPolicy:
+    lazy: bool = field(default=False)
+    device_types: frozenset[DeviceType] = field(default_factory=frozenset)
+
+    def prewarms(self, device_type: DeviceType) -> bool:
+        return not self.lazy or device_type in self.device_types
 
 
 class GeneratePdfReportBehavior(PipelineBehavior[AddDeviceReport, ReportId]):
+    def __init__(
+        self, pdf_render_scheduler: PdfRenderScheduler, policy: PdfPrewarmPolicy
+    ) -> None:
+        self._pdf_render_scheduler = pdf_render_scheduler
+        self._policy = policy
+
     async def handle(
         self, request: AddDeviceReport, handle_next: HandleNext[AddDeviceReport, ReportId]
     ) -> ReportId:
         report_id = await handle_next(request)
 
-        await REPORTS_WORKFLOW.aio_run_no_wait(
-            input=CreatePdfReportRequest(report_id=report_id)
-        )
+        if self._policy.prewarms(request.device_type):
+            await self._pdf_render_scheduler.schedule([report_id])
 
         return report_id
+
+
+class GeneratePdfReportsBehavior(
+    PipelineBehavior[AddDeviceReports, list[AddDeviceReportResult]]
+):
+    def __init__(
+        self, pdf_render_scheduler: PdfRenderScheduler, policy: PdfPrewarmPolicy
+    ) -> None:
+        self._pdf_render_scheduler = pdf_render_scheduler
+        self._policy = policy
+
+    async def handle(
+        self,
+        request: AddDeviceReports,
+        handle_next: HandleNext[AddDeviceReports, list[AddDeviceReportResult]],
+    ) -> list[AddDeviceReportResult]:
+        results = await handle_next(request)
+
+        await self._pdf_render_scheduler.schedule(
+            [
+                result.report_id
+                for result in results
+                if result.report_id and self._policy.prewarms(result.device_type)
+            ]
+        )
+
+        return results
@@ -0,0 +1,185 @@
+import asyncio
+import threading
+from collections import deque
+from contextlib import suppress
+from importlib import import_module
+from io import BytesIO
+from multiprocessing import get_context
+from multiprocessing.connection import Connection
+from multiprocessing.process import BaseProcess
+from pickle import PicklingError
+from typing import Final, cast
+
+from reports.application.common.application_error import ApplicationError, ErrorType
+
+
+def render_pdf(html_content: str) -> bytes:
+    # Imported here so that only the render processes load WeasyPrint.
+    from weasyprint import HTML  # type: ignore
+
+    with BytesIO() as buffer:
+        HTML(string=html_content).write_pdf(buffer)
+        return buffer.getvalue()
+
+
+def _serve(connection: Connection) -> None:
+    import_module("weasyprint")
+    connection.send(None)
+
+    while True:
+        try:
+            html_content = connection.recv()
+        except EOFError:
+            return
+
+        try:
+            result: bytes | Exception = render_pdf(html_content)
+        except Exception as error:  # noqa: BLE001
+            result = error
+
+        try:
+            connection.send(result)
+        except PicklingError:
+            connection.send(RuntimeError(repr(result)))
+
+
+class _RenderProcess:
+    def __init__(self, max_tasks: int) -> None:
+        self._max_tasks = max_tasks
+        self._process: BaseProcess | None = None
+        self._connection: Connection | None = None
+        self._tasks = 0
+        self._lock = threading.Lock()
+
+    def ensure_started(self) -> None:
+        with self._lock:
+            if (
+                self._process
+                and self._process.is_alive()
+                and self._tasks < self._max_tasks
+            ):
+                return
+
+            self._stop()
+            self._start()
+
+    def _start(self) -> None:
+        context = get_context("spawn")
+        connection, child_connection = context.Pipe()
+        process = context.Process(target=_serve, args=(child_connection,), daemon=True)
+        process.start()
+        child_connection.close()
+        # Blocks until WeasyPrint is loaded, so renders never pay for it.
+        connection.recv()
+
+        self._process, self._connection, self._tasks = process, connection, 0
+
+    def render(self, html_content: str) -> bytes:
+        if not self._connection:
+            raise EOFError
+
+        self._tasks += 1
+        self._connection.send(html_content)
+        result = self._connection.recv()
+
+        if isinstance(result, BaseException):
+            raise result
+
+        return cast("bytes", result)
+
+    def kill(self) -> None:
+        # The pending recv() in render() fails with EOFError once it is gone.
+        if self._process:
+            self._process.kill()
+
+    def stop(self) -> None:
+        with self._lock:
+            self._stop()
+
+    def _stop(self) -> None:
+        if self._process:
+            self._process.kill()
+            self._process.join()
+            self._process = None
+
+        if self._connection:
+            self._connection.close()
+            self._connection = None
+
+
+class PdfRenderPool:
+    # A render process that dies on its own is replaced and the render retried.
+    _ATTEMPTS: Final[int] = 2
+
+    def __init__(self, workers: int, max_tasks_per_child: int, timeout: float) -> None:
+        self._workers = workers
+        self._timeout = timeout
+        self._processes = [_RenderProcess(max_tasks_per_child) for _ in range(workers)]
+        self._idle = deque(self._processes)
+        # Renders wait here, so the timeout only covers the render itself.
+        self._slots = asyncio.Semaphore(workers)
+
+    async def start(self) -> None:
+        await asyncio.gather(
+            *(asyncio.to_thread(process.ensure_started) for process in self._processes)
+        )
+
+    async def render(self, html_content: str) -> bytes:
+        if not self._workers:
+            return render_pdf(html_content)
+
+        async with self._slots:
+            process = self._idle.popleft()
+
+            try:
+                return await self._render(process, html_content)
+            finally:
+                self._idle.append(process)
+
+    async def close(self) -> None:
+        await asyncio.gather(
+            *(asyncio.to_thread(process.stop) for process in self._processes)
+        )
+
+    async def _render(self, process: _RenderProcess, html_content: str) -> bytes:
+        for _ in range(self._ATTEMPTS - 1):
+            with suppress(EOFError, ConnectionError):
+                return await self._render_once(process, html_content)
+
+        try:
+            return await self._render_once(process, html_content)
+        except (EOFError, ConnectionError) as error:
+            raise ApplicationError(
+                error_type=ErrorType.APPLICATION_ERROR,
+                message="PDF render process exited during rendering",
+            ) from error
+
+    async def _render_once(self, process: _RenderProcess, html_content: str) -> bytes:
+        # Replacing a recycled or dead process is not part of the timeout.
+        await asyncio.to_thread(process.ensure_started)
+
+        render = asyncio.ensure_future(asyncio.to_thread(process.render, html_content))
+
+        try:
+            return await asyncio.wait_for(asyncio.shield(render), timeout=self._timeout)
+        except TimeoutError as error:
+            await self._abort(process, render)
+            raise ApplicationError(
+                error_type=ErrorType.APPLICATION_ERROR,
+                message=f"PDF rendering took longer than {self._timeout} seconds",
+            ) from error
+        except asyncio.CancelledError:
+            await self._abort(process, render)
+            raise
+
+    async def _abort(
+        self, process: _RenderProcess, render: asyncio.Future[bytes]
+    ) -> None:
+        # Only this render's process is killed, the other renders keep running.
+        process.kill()
+
+        # The process is handed out again only after its pipe is no longer read.
+        await asyncio.wait({render})
+
+        if not render.cancelled():
+            render.exception()
@@ -0,0 +1,63 @@
+from collections.abc import Sequence
+from datetime import timedelta
+
+from hatchet_sdk.runnables.workflow import Workflow
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from reports.application.ports.pdf_render_scheduler import PdfRenderScheduler
+from reports.application.ports.time_provider import TimeProvider
+from reports.domain.types import ReportId
+from reports.infrastructure.outbox.outbox import Outbox
+from reports.infrastructure.pdf_reports.shemas import CreatePdfReportRequest
+from reports.infrastructure.persistence.sql_tables import PDF_RENDER_REQUEST_TABLE
+
+
+class OutboxPdfRenderScheduler(PdfRenderScheduler):
+    def __init__(
+        self,
+        session: AsyncSession,
+        outbox: Outbox,
+        workflow: Workflow,
+        time_provider: TimeProvider,
+        stale_after: timedelta,
+    ) -> None:
+        self._session = session
+        self._outbox = outbox
+        self._workflow = workflow
+        self._time_provider = time_provider
+        self._stale_after = stale_after
+
+    async def schedule(self, report_ids: Sequence[ReportId]) -> None:
+        if not report_ids:
+            return
+
+        # Reports added in this unit of work must exist before the request rows
+        # that reference them.
+        await self._session.flush()
+        claimed = await self._claim(report_ids)
+
+        await self._outbox.add_workflow_runs(
+            workflow=self._workflow,
+            workflow_inputs=[
+                CreatePdfReportRequest(report_id=report_id) for report_id in claimed
+            ],
+        )
+
+    async def _claim(self, report_ids: Sequence[ReportId]) -> list[ReportId]:
+        # A request that is still fresh means a render is already on its way;
+        # a stale one is taken over so that a failed render gets retried.
+        now = self._time_provider.current()
+        table = PDF_RENDER_REQUEST_TABLE
+        dialect = self._session.get_bind().dialect.name
+        insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+        values = insert(table).values(
+            [{"report_id": report_id, "requested_at": now} for report_id in report_ids]
+        )
+        stmt = values.on_conflict_do_update(
+            index_elements=[table.c.report_id],
+            set_={"requested_at": values.excluded.requested_at},
+            where=table.c.requested_at < now - self._stale_after,
+        ).returning(table.c.report_id)
+
+        return list((await self._session.scalars(stmt)).all())
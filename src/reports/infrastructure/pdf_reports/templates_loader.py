@@ -1,14 +1,40 @@
+from pathlib import Path
 from typing import Final
 
-from jinja2 import Environment, FileSystemLoader, Template
+from jinja2 import (
+    BytecodeCache,
+    Environment,
+    FileSystemBytecodeCache,
+    PackageLoader,
+    Template,
+)
 
-REPORTS_TEMPLATE_DIR: Final[str] = "src/reports/infrastructure/pdf_reports/templates"
+REPORTS_TEMPLATES_PACKAGE: Final[str] = "reports.infrastructure.pdf_reports"
+REPORTS_TEMPLATES_DIR: Final[str] = "templates"
+REPORT_TEMPLATE_NAME: Final[str] = "report_template.html"
 
 
 class TemplatesLoader:
-    def __init__(self) -> None:
-        self._loader = FileSystemLoader(REPORTS_TEMPLATE_DIR)
-        self._env = Environment(loader=self._loader, autoescape=True)
+    def __init__(
+        self, auto_reload: bool = False, bytecode_cache_dir: str | None = None
+    ) -> None:
+        bytecode_cache: BytecodeCache | None = None
+
+        if bytecode_cache_dir:
+            Path(bytecode_cache_dir).mkdir(parents=True, exist_ok=True)
+            bytecode_cache = FileSystemBytecodeCache(bytecode_cache_dir)
+
+        self._loader = PackageLoader(REPORTS_TEMPLATES_PACKAGE, REPORTS_TEMPLATES_DIR)
+        self._env = Environment(
+            loader=self._loader,
+            autoescape=True,
+            auto_reload=auto_reload,
+            bytecode_cache=bytecode_cache,
+        )
+
+    def precompile(self) -> None:
+        for template_name in self._env.list_templates():
+            self._env.get_template(template_name)
 
     def get_report_template(self) -> Template:
-        return self._env.get_template("report_template.html")
+        return self._env.get_template(REPORT_TEMPLATE_NAME)
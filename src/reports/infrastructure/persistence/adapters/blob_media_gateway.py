@@ -1,3 +1,5 @@
+import asyncio
+from collections.abc import Iterable
 from datetime import timedelta
 from typing import Final
 
@@ -11,8 +13,9 @@ from reports.application.ports.media_gateway import ObjectMediaGateway
 class BlobMediaGateway(ObjectMediaGateway):
     _BUCKET_NAME: Final[str] = "media"
 
-    def __init__(self, client: S3Client) -> None:
+    def __init__(self, client: S3Client, expires_in: int) -> None:
         self._client = client
+        self._expires_in = expires_in
 
     @retry(
         stop=stop_after_attempt(3),
@@ -23,19 +26,25 @@ class BlobMediaGateway(ObjectMediaGateway):
             Bucket=self._BUCKET_NAME, Key=str(file_name), Body=file
         )
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=timedelta(seconds=3), max=10),
-    )
     async def get(self, file_name: FileName) -> PresignedUrl:
         presigned_url = await self._client.generate_presigned_url(
             ClientMethod="get_object",
             Params={"Bucket": self._BUCKET_NAME, "Key": file_name},
-            ExpiresIn=3600,
+            ExpiresIn=self._expires_in,
         )
 
         return PresignedUrl(presigned_url)
 
+    async def get_many(
+        self, file_names: Iterable[FileName]
+    ) -> dict[FileName, PresignedUrl]:
+        unique_file_names = list(dict.fromkeys(file_names))
+        presigned_urls = await asyncio.gather(
+            *(self.get(file_name) for file_name in unique_file_names)
+        )
+
+        return dict(zip(unique_file_names, presigned_urls, strict=True))
+
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=timedelta(seconds=3), max=10),
@@ -0,0 +1,101 @@
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass
+from time import monotonic
+
+from bazario.asyncio import NotificationHandler
+
+from reports.application.models.media import FileName, PresignedUrl, build_file_name
+from reports.application.ports.media_gateway import ObjectMediaGateway
+from reports.domain.media.events import ReportMediaDeleted
+
+
+@dataclass(frozen=True, slots=True)
+class _CachedUrl:
+    presigned_url: PresignedUrl
+    reuse_until: float
+
+
+class PresignedUrlCache:
+    def __init__(self, max_size: int, ttl: float, refresh_margin: float) -> None:
+        self._max_size = max_size
+        self._reuse_for = ttl - refresh_margin
+        self._entries: OrderedDict[FileName, _CachedUrl] = OrderedDict()
+
+    def get(self, file_name: FileName) -> PresignedUrl | None:
+        entry = self._entries.get(file_name)
+
+        if not entry:
+            return None
+
+        if monotonic() >= entry.reuse_until:
+            del self._entries[file_name]
+            return None
+
+        self._entries.move_to_end(file_name)
+        return entry.presigned_url
+
+    def add(self, file_name: FileName, presigned_url: PresignedUrl) -> None:
+        self._entries[file_name] = _CachedUrl(
+            presigned_url=presigned_url, reuse_until=monotonic() + self._reuse_for
+        )
+        self._entries.move_to_end(file_name)
+
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def evict(self, file_name: FileName) -> None:
+        self._entries.pop(file_name, None)
+
+
+class CachedObjectMediaGateway(ObjectMediaGateway):
+    def __init__(
+        self, object_media_gateway: ObjectMediaGateway, cache: PresignedUrlCache
+    ) -> None:
+        self._object_media_gateway = object_media_gateway
+        self._cache = cache
+
+    async def save(self, file_name: FileName, file: bytes) -> None:
+        await self._object_media_gateway.save(file_name=file_name, file=file)
+
+    async def get(self, file_name: FileName) -> PresignedUrl:
+        presigned_urls = await self.get_many([file_name])
+        return presigned_urls[file_name]
+
+    async def get_many(
+        self, file_names: Iterable[FileName]
+    ) -> dict[FileName, PresignedUrl]:
+        presigned_urls: dict[FileName, PresignedUrl] = {}
+        missing: list[FileName] = []
+
+        for file_name in file_names:
+            if presigned_url := self._cache.get(file_name):
+                presigned_urls[file_name] = presigned_url
+            else:
+                missing.append(file_name)
+
+        if missing:
+            signed = await self._object_media_gateway.get_many(missing)
+
+            for file_name, presigned_url in signed.items():
+                self._cache.add(file_name, presigned_url)
+
+            presigned_urls.update(signed)
+
+        return presigned_urls
+
+    async def delete(self, file_name: FileName) -> None:
+        await self._object_media_gateway.delete(file_name=file_name)
+
+
+class EvictPresignedUrlOnMediaDeletionHandler(NotificationHandler[ReportMediaDeleted]):
+    def __init__(self, cache: PresignedUrlCache) -> None:
+        self._cache = cache
+
+    async def handle(self, notification: ReportMediaDeleted) -> None:
+        self._cache.evict(
+            build_file_name(
+                content_type=notification.metadata.content_type,
+                media_id=notification.media_id,
+            )
+        )
@@ -0,0 +1,67 @@
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from reports.application.models.device import DeviceReadModel
+from reports.application.ports.device_snapshot_gateway import DeviceSnapshotGateway
+from reports.application.ports.time_provider import TimeProvider
+from reports.domain.types import DeviceId, ReportId
+
+
+class DeviceSnapshot:
+    def __init__(
+        self,
+        report_id: ReportId,
+        *,
+        device_id: DeviceId,
+        device_name: str | None,
+        device_inventory_number: str,
+        device_serial_number: str,
+        payload: dict[str, Any],
+        captured_at: datetime,
+    ) -> None:
+        self.report_id = report_id
+        self.device_id = device_id
+        self.device_name = device_name
+        self.device_inventory_number = device_inventory_number
+        self.device_serial_number = device_serial_number
+        self.payload = payload
+        self.captured_at = captured_at
+
+
+class SqlDeviceSnapshotGateway(DeviceSnapshotGateway):
+    def __init__(self, session: AsyncSession, time_provider: TimeProvider) -> None:
+        self._session = session
+        self._time_provider = time_provider
+
+    def add(self, report_id: ReportId, device: DeviceReadModel) -> None:
+        self._session.add(self._snapshot(report_id, device))
+
+    async def replace(self, report_id: ReportId, device: DeviceReadModel) -> None:
+        await self._session.merge(self._snapshot(report_id, device))
+
+    async def with_report_id(self, report_id: ReportId) -> DeviceReadModel | None:
+        snapshot = await self._session.get(DeviceSnapshot, report_id)
+
+        if not snapshot:
+            return None
+
+        return DeviceReadModel(
+            device_id=snapshot.device_id,
+            device_name=snapshot.device_name,
+            device_inventory_number=snapshot.device_inventory_number,
+            device_serial_number=snapshot.device_serial_number,
+            payload=snapshot.payload,
+        )
+
+    def _snapshot(self, report_id: ReportId, device: DeviceReadModel) -> DeviceSnapshot:
+        return DeviceSnapshot(
+            report_id=report_id,
+            device_id=device.device_id,
+            device_name=device.device_name,
+            device_inventory_number=device.device_inventory_number,
+            device_serial_number=device.device_serial_number,
+            payload=device.payload,
+            captured_at=self._time_provider.current(),
+        )
@@ -1,7 +1,11 @@
 from sqlalchemy import Row, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from reports.application.models.media import MediaReadModel, build_file_name
+from reports.application.models.media import (
+    MediaReadModel,
+    PresignedUrl,
+    build_file_name,
+)
 from reports.application.ports.media_gateway import MediaGateway, ObjectMediaGateway
 from reports.domain.media.value_objects import MediaMetadata
 from reports.domain.types import ReportId
@@ -25,9 +29,14 @@ class SqlMediaGateway(MediaGateway):
         if not cursor_row:
             return None
 
-        return await self._load(cursor_row)
+        file_name = build_file_name(
+            content_type=cursor_row.content_type, media_id=cursor_row.media_id
+        )
+        presigned_urls = await self._object_media_gateway.get_many([file_name])
+
+        return self._load(cursor_row, presigned_urls[file_name])
 
-    async def _load(self, cursor_row: Row) -> MediaReadModel:
+    def _load(self, cursor_row: Row, presigned_url: PresignedUrl) -> MediaReadModel:
         return MediaReadModel(
             media_id=cursor_row.media_id,
             report_id=cursor_row.report_id,
@@ -37,10 +46,5 @@ class SqlMediaGateway(MediaGateway):
                 file_size=cursor_row.file_size,
                 content_type=cursor_row.content_type,
             ),
-            presigned_url=await self._object_media_gateway.get(
-                build_file_name(
-                    content_type=cursor_row.content_type,
-                    media_id=cursor_row.media_id,
-                )
-            ),
+            presigned_url=presigned_url,
         )
@@ -19,6 +19,9 @@ class SqlMediaRepository(MediaRepository):
 
     async def with_report_id(self, report_id: ReportId) -> ReportMedia | None:
         stmt = select(ReportMedia).where(REPORT_MEDIA_TABLE.c.report_id == report_id)
-        media = (await self._session.execute(stmt)).scalar_one_or_none()
+
+        # A pending delete of the report must not be flushed ahead of its media.
+        with self._session.no_autoflush:
+            media = (await self._session.execute(stmt)).scalar_one_or_none()
 
         return media
@@ -1,17 +1,27 @@
-from sqlalchemy import Row, select
+from collections.abc import AsyncIterator, Sequence
+from datetime import datetime, timedelta
+from typing import Final
+from uuid import UUID
+
+from sqlalchemy import ColumnElement, Row, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from uuid_extensions import uuid7
 
-from reports.application.models.media import MediaReadModel, build_file_name
-from reports.application.models.pagination import Pagination
-from reports.application.models.report import ReportReadModel
+from reports.application.models.media import (
+    FileName,
+    MediaReadModel,
+    PresignedUrl,
+)
+from reports.application.models.pagination import Pagination, decode_cursor
+from reports.application.models.report import ReportFilters, ReportReadModel
 from reports.application.ports.media_gateway import ObjectMediaGateway
 from reports.application.ports.report_gateway import ReportGateway
 from reports.domain.media.value_objects import MediaMetadata
 from reports.domain.types import ReportId
-from reports.infrastructure.persistence.sql_tables import (
-    DEVICE_REPORT_TABLE,
-    REPORT_MEDIA_TABLE,
-)
+from reports.infrastructure.persistence.sql_tables import REPORT_VIEW_TABLE
+
+# Report ids are uuid7 minted just before created_at is read from the clock.
+_REPORT_ID_CLOCK_SKEW: Final[timedelta] = timedelta(seconds=1)
 
 
 class SqlReportGateway(ReportGateway):
@@ -21,54 +31,118 @@ class SqlReportGateway(ReportGateway):
         self._session = session
         self._object_media_gateway = object_media_gateway
 
-    async def load_many(self, pagination: Pagination) -> list[ReportReadModel]:
+    async def load_many(
+        self, pagination: Pagination, filters: ReportFilters
+    ) -> list[ReportReadModel]:
         stmt = (
-            select(DEVICE_REPORT_TABLE, REPORT_MEDIA_TABLE)
-            .join(
-                REPORT_MEDIA_TABLE,
-                REPORT_MEDIA_TABLE.c.report_id == DEVICE_REPORT_TABLE.c.report_id,
-                isouter=True,
-            )
-            .offset(pagination.offset)
+            select(REPORT_VIEW_TABLE)
+            .where(*self._filter_clauses(filters))
+            .order_by(REPORT_VIEW_TABLE.c.report_id.desc())
             .limit(pagination.limit)
         )
+
+        if pagination.cursor is not None:
+            stmt = stmt.where(
+                REPORT_VIEW_TABLE.c.report_id < decode_cursor(pagination.cursor)
+            )
+        else:
+            stmt = stmt.offset(pagination.offset)
+
         result = (await self._session.execute(stmt)).all()
-        return [await self._load(row) for row in result]
+        return await self._load_many(result)
 
-    async def with_id(self, report_id: ReportId) -> ReportReadModel | None:
+    async def stream(
+        self, filters: ReportFilters, batch_size: int, with_media_urls: bool
+    ) -> AsyncIterator[list[ReportReadModel]]:
         stmt = (
-            select(DEVICE_REPORT_TABLE, REPORT_MEDIA_TABLE)
-            .join(
-                REPORT_MEDIA_TABLE,
-                REPORT_MEDIA_TABLE.c.report_id == DEVICE_REPORT_TABLE.c.report_id,
-                isouter=True,
-            )
-            .where(DEVICE_REPORT_TABLE.c.report_id == report_id)
+            select(REPORT_VIEW_TABLE)
+            .where(*self._filter_clauses(filters))
+            .order_by(REPORT_VIEW_TABLE.c.report_id)
+            .execution_options(yield_per=batch_size)
         )
+        result = await self._session.stream(stmt)
+
+        async for rows in result.partitions():
+            if with_media_urls:
+                yield await self._load_many(rows)
+            else:
+                yield [self._load(row, presigned_urls=None) for row in rows]
+
+    async def with_id(self, report_id: ReportId) -> ReportReadModel | None:
+        stmt = select(REPORT_VIEW_TABLE).where(REPORT_VIEW_TABLE.c.report_id == report_id)
         row = (await self._session.execute(stmt)).one_or_none()
 
         if not row:
             return None
 
-        return await self._load(row)
+        [report] = await self._load_many([row])
+        return report
+
+    def _filter_clauses(self, filters: ReportFilters) -> list[ColumnElement[bool]]:
+        clauses: list[ColumnElement[bool]] = []
 
-    async def _load(self, row: Row) -> ReportReadModel:
+        if filters.device_id is not None:
+            clauses.append(REPORT_VIEW_TABLE.c.device_id == filters.device_id)
+
+        if filters.device_type is not None:
+            clauses.append(REPORT_VIEW_TABLE.c.device_type == filters.device_type)
+
+        if filters.creator_id is not None:
+            clauses.append(REPORT_VIEW_TABLE.c.creator_id == filters.creator_id)
+
+        # Bounding report_id as well lets a date range walk the primary key in
+        # listing order instead of sorting every matching row.
+        if filters.created_from is not None:
+            clauses.append(REPORT_VIEW_TABLE.c.created_at >= filters.created_from)
+            clauses.append(
+                REPORT_VIEW_TABLE.c.report_id
+                >= self._report_id_bound(filters.created_from - _REPORT_ID_CLOCK_SKEW)
+            )
+
+        if filters.created_to is not None:
+            clauses.append(REPORT_VIEW_TABLE.c.created_at < filters.created_to)
+            clauses.append(
+                REPORT_VIEW_TABLE.c.report_id
+                < self._report_id_bound(filters.created_to + _REPORT_ID_CLOCK_SKEW)
+            )
+
+        return clauses
+
+    def _report_id_bound(self, moment: datetime) -> UUID:
+        # Relies on every report_id being a UUIDv7 issued by UUID7IdGenerator,
+        # so its leading bits are the time it was minted. The timestamp fills
+        # the high 64 bits. The all-ones tail sorts just below the moment and
+        # keeps SQLite from reading the hex digits as a number.
+        timestamp = uuid7(ns=int(moment.timestamp() * 1_000_000_000), as_type="int")
+        return UUID(int=((timestamp >> 64) - 1) << 64 | (1 << 64) - 1)
+
+    async def _load_many(self, rows: Sequence[Row]) -> list[ReportReadModel]:
+        presigned_urls = await self._object_media_gateway.get_many(
+            row.media_file_name for row in rows if row.media_id
+        )
+
+        return [self._load(row, presigned_urls) for row in rows]
+
+    def _load(
+        self, row: Row, presigned_urls: dict[FileName, PresignedUrl] | None
+    ) -> ReportReadModel:
         media: MediaReadModel | None = None
 
         if row.media_id:
-            file_name = build_file_name(
-                content_type=row.content_type, media_id=row.media_id
-            )
             media = MediaReadModel(
                 media_id=row.media_id,
                 report_id=row.report_id,
-                uploaded_at=row.uploaded_at,
-                uploaded_by=row.uploaded_by,
+                uploaded_at=row.media_uploaded_at,
+                uploaded_by=row.media_uploaded_by,
                 metadata=MediaMetadata(
-                    file_size=row.file_size,
-                    content_type=row.content_type,
+                    file_size=row.media_file_size,
+                    content_type=row.media_content_type,
+                ),
+                presigned_url=(
+                    presigned_urls[row.media_file_name]
+                    if presigned_urls is not None
+                    else None
                 ),
-                presigned_url=await self._object_media_gateway.get(file_name),
             )
 
         return ReportReadModel(
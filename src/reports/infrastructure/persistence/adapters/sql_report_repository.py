@@ -1,3 +1,4 @@
+from collections.abc import Iterable
 from typing import cast
 
 from sqlalchemy import select
@@ -6,7 +7,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from reports.application.ports.events import EventAdder
 from reports.domain.report.report import DeviceReport
 from reports.domain.report.repository import ReportRepository
-from reports.domain.types import ReportId
+from reports.domain.types import DeviceId, ReportId
 from reports.infrastructure.persistence.sql_tables import DEVICE_REPORT_TABLE
 from reports.infrastructure.report_proxy import DeviceReportProxy
 
@@ -20,11 +21,16 @@ class SqlReportRepository(ReportRepository):
         proxy = cast("DeviceReportProxy", report)
         self._session.add(proxy.device_report)
 
+    def add_many(self, reports: Iterable[DeviceReport]) -> None:
+        self._session.add_all(
+            cast("DeviceReportProxy", report).device_report for report in reports
+        )
+
     async def delete(self, report: DeviceReport) -> None:
         proxy = cast("DeviceReportProxy", report)
         await self._session.delete(proxy.device_report)
 
-    async def with_device_id(self, device_id: ReportId) -> list[DeviceReport]:
+    async def with_device_id(self, device_id: DeviceId) -> list[DeviceReport]:
         stmt = select(DeviceReport).where(DEVICE_REPORT_TABLE.c.device_id == device_id)
         reports = (await self._session.execute(stmt)).scalars().all()
 
@@ -0,0 +1,42 @@
+"""broadcast message
+
+Revision ID: 0d8e4b7c2a61
+Revises: 5f0c2a7d91e3
+Create Date: 2026-10-18 21:06:43.318402
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0d8e4b7c2a61"
+down_revision: str | None = "5f0c2a7d91e3"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "broadcast_message",
+        sa.Column("message_id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("origin", sa.Text(), nullable=False),
+        sa.Column("topic", sa.Text(), nullable=False),
+        sa.Column("payload", sa.JSON(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("message_id"),
+        sqlite_autoincrement=True,
+    )
+    op.create_index(
+        "ix_broadcast_message_created_at",
+        "broadcast_message",
+        ["created_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_broadcast_message_created_at", table_name="broadcast_message")
+    op.drop_table("broadcast_message")
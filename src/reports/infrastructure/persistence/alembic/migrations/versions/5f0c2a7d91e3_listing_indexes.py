@@ -0,0 +1,87 @@
+"""listing indexes
+
+Revision ID: 5f0c2a7d91e3
+Revises: b6d2e9f04a17
+Create Date: 2026-10-18 19:24:07.552180
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5f0c2a7d91e3"
+down_revision: str | None = "b6d2e9f04a17"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.drop_index("ix_device_report_device_type_created_at", table_name="device_report")
+    op.drop_index("ix_device_report_creator_id_created_at", table_name="device_report")
+    op.drop_index("ix_device_report_created_at", table_name="device_report")
+    op.drop_index("ix_report_view_device_type_created_at", table_name="report_view")
+    op.drop_index("ix_report_view_creator_id_created_at", table_name="report_view")
+    op.drop_index("ix_report_view_device_id_device_type", table_name="report_view")
+    op.drop_index("ix_report_view_created_at", table_name="report_view")
+    op.create_index(
+        "ix_report_view_device_id_report_id",
+        "report_view",
+        ["device_id", "report_id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_report_view_creator_id_report_id",
+        "report_view",
+        ["creator_id", "report_id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_report_view_device_type_report_id",
+        "report_view",
+        ["device_type", "report_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_report_view_device_type_report_id", table_name="report_view")
+    op.drop_index("ix_report_view_creator_id_report_id", table_name="report_view")
+    op.drop_index("ix_report_view_device_id_report_id", table_name="report_view")
+    op.create_index(
+        "ix_report_view_created_at", "report_view", ["created_at"], unique=False
+    )
+    op.create_index(
+        "ix_report_view_device_id_device_type",
+        "report_view",
+        ["device_id", "device_type"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_report_view_creator_id_created_at",
+        "report_view",
+        ["creator_id", "created_at"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_report_view_device_type_created_at",
+        "report_view",
+        ["device_type", "created_at"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_device_report_created_at", "device_report", ["created_at"], unique=False
+    )
+    op.create_index(
+        "ix_device_report_creator_id_created_at",
+        "device_report",
+        ["creator_id", "created_at"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_device_report_device_type_created_at",
+        "device_report",
+        ["device_type", "created_at"],
+        unique=False,
+    )
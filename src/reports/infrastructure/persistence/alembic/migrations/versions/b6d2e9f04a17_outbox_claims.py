@@ -0,0 +1,38 @@
+"""outbox claims
+
+Revision ID: b6d2e9f04a17
+Revises: 7a3c95e1d2f6
+Create Date: 2026-10-18 18:02:41.318207
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b6d2e9f04a17"
+down_revision: str | None = "7a3c95e1d2f6"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("outbox_message") as batch_op:
+        batch_op.add_column(sa.Column("claimed_by", sa.Text(), nullable=True))
+        batch_op.add_column(
+            sa.Column("claimed_at", sa.DateTime(timezone=True), nullable=True)
+        )
+        batch_op.add_column(
+            sa.Column("failed_at", sa.DateTime(timezone=True), nullable=True)
+        )
+        batch_op.add_column(sa.Column("error", sa.Text(), nullable=True))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("outbox_message") as batch_op:
+        batch_op.drop_column("error")
+        batch_op.drop_column("failed_at")
+        batch_op.drop_column("claimed_at")
+        batch_op.drop_column("claimed_by")
@@ -0,0 +1,126 @@
+"""report view
+
+Revision ID: e4b18d6a0c39
+Revises: c27d5e8a4f10
+Create Date: 2026-10-18 16:02:41.906317
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e4b18d6a0c39"
+down_revision: str | None = "c27d5e8a4f10"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    report_view = op.create_table(
+        "report_view",
+        sa.Column("report_id", sa.UUID(), nullable=False),
+        sa.Column("report_name", sa.Text(), nullable=False),
+        sa.Column("creator_id", sa.UUID(), nullable=False),
+        sa.Column("comment", sa.Text(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("device_id", sa.Integer(), nullable=False),
+        sa.Column("device_type", sa.Text(), nullable=False),
+        sa.Column("media_id", sa.UUID(), nullable=True),
+        sa.Column("media_uploaded_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("media_uploaded_by", sa.UUID(), nullable=True),
+        sa.Column("media_file_size", sa.Integer(), nullable=True),
+        sa.Column("media_content_type", sa.Text(), nullable=True),
+        sa.Column("media_file_name", sa.Text(), nullable=True),
+        sa.PrimaryKeyConstraint("report_id"),
+    )
+    op.create_index(
+        "ix_report_view_created_at", "report_view", ["created_at"], unique=False
+    )
+    op.create_index(
+        "ix_report_view_creator_id_created_at",
+        "report_view",
+        ["creator_id", "created_at"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_report_view_device_id_device_type",
+        "report_view",
+        ["device_id", "device_type"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_report_view_device_type_created_at",
+        "report_view",
+        ["device_type", "created_at"],
+        unique=False,
+    )
+
+    device_report = sa.table(
+        "device_report",
+        sa.column("report_id", sa.UUID()),
+        sa.column("report_name", sa.Text()),
+        sa.column("creator_id", sa.UUID()),
+        sa.column("comment", sa.Text()),
+        sa.column("created_at", sa.DateTime(timezone=True)),
+        sa.column("device_id", sa.Integer()),
+        sa.column("device_type", sa.Text()),
+    )
+    report_media = sa.table(
+        "report_media",
+        sa.column("media_id", sa.UUID()),
+        sa.column("report_id", sa.UUID()),
+        sa.column("uploaded_at", sa.DateTime(timezone=True)),
+        sa.column("uploaded_by", sa.UUID()),
+        sa.column("file_size", sa.Integer()),
+        sa.column("content_type", sa.Text()),
+    )
+    rows = op.get_bind().execute(
+        sa.select(
+            device_report,
+            report_media.c.media_id,
+            report_media.c.uploaded_at,
+            report_media.c.uploaded_by,
+            report_media.c.file_size,
+            report_media.c.content_type,
+        ).join(
+            report_media,
+            report_media.c.report_id == device_report.c.report_id,
+            isouter=True,
+        )
+    )
+    # The file name matches build_file_name and is computed here rather than
+    # in SQL because UUIDs are not rendered the same way by every backend.
+    values = [
+        {
+            "report_id": row.report_id,
+            "report_name": row.report_name,
+            "creator_id": row.creator_id,
+            "comment": row.comment,
+            "created_at": row.created_at,
+            "device_id": row.device_id,
+            "device_type": row.device_type,
+            "media_id": row.media_id,
+            "media_uploaded_at": row.uploaded_at,
+            "media_uploaded_by": row.uploaded_by,
+            "media_file_size": row.file_size,
+            "media_content_type": row.content_type,
+            "media_file_name": (
+                f"{row.media_id}.{row.content_type}" if row.media_id else None
+            ),
+        }
+        for row in rows
+    ]
+
+    if values:
+        op.bulk_insert(report_view, values)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_report_view_device_type_created_at", table_name="report_view")
+    op.drop_index("ix_report_view_device_id_device_type", table_name="report_view")
+    op.drop_index("ix_report_view_creator_id_created_at", table_name="report_view")
+    op.drop_index("ix_report_view_created_at", table_name="report_view")
+    op.drop_table("report_view")
@@ -0,0 +1,78 @@
+from dataclasses import dataclass
+from functools import partial
+from typing import Any
+
+from sqlalchemy import event, make_url
+from sqlalchemy.engine import URL
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+
+@dataclass(frozen=True)
+class EngineOptions:
+    pool_size: int
+    max_overflow: int
+    pool_timeout: float
+    pool_recycle: float
+    pool_pre_ping: bool
+    query_cache_size: int
+    statement_cache_size: int
+
+
+@dataclass(frozen=True)
+class SqlitePragmas:
+    journal_mode: str
+    synchronous: str
+    busy_timeout: int
+    mmap_size: int
+
+
+def _is_sqlite_memory(url: URL) -> bool:
+    return url.get_backend_name() == "sqlite" and url.database in {None, "", ":memory:"}
+
+
+def _set_sqlite_pragmas(
+    pragmas: SqlitePragmas, dbapi_connection: Any, _connection_record: object
+) -> None:
+    cursor = dbapi_connection.cursor()
+
+    try:
+        cursor.execute(f"PRAGMA journal_mode={pragmas.journal_mode}")
+        cursor.execute(f"PRAGMA synchronous={pragmas.synchronous}")
+        cursor.execute(f"PRAGMA busy_timeout={pragmas.busy_timeout:d}")
+        cursor.execute(f"PRAGMA mmap_size={pragmas.mmap_size:d}")
+        cursor.execute("PRAGMA foreign_keys=ON")
+    finally:
+        cursor.close()
+
+
+def build_engine(
+    uri: str, options: EngineOptions, sqlite_pragmas: SqlitePragmas
+) -> AsyncEngine:
+    url = make_url(uri)
+    engine_options: dict[str, Any] = {
+        "pool_pre_ping": options.pool_pre_ping,
+        "query_cache_size": options.query_cache_size,
+    }
+
+    # In-memory SQLite uses a single static connection without a queue pool.
+    if not _is_sqlite_memory(url):
+        engine_options.update(
+            pool_size=options.pool_size,
+            max_overflow=options.max_overflow,
+            pool_timeout=options.pool_timeout,
+            pool_recycle=options.pool_recycle,
+        )
+
+    if url.get_driver_name() == "asyncpg":
+        engine_options["connect_args"] = {
+            "prepared_statement_cache_size": options.statement_cache_size
+        }
+
+    engine = create_async_engine(url, **engine_options)
+
+    if url.get_backend_name() == "sqlite":
+        event.listen(
+            engine.sync_engine, "connect", partial(_set_sqlite_pragmas, sqlite_pragmas)
+        )
+
+    return engine
@@ -0,0 +1,88 @@
+import asyncio
+from dataclasses import dataclass
+from time import perf_counter
+from typing import Final
+
+from sqlalchemy import (
+    Column,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    func,
+    insert,
+    select,
+)
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+_BENCHMARK_TABLE: Final[Table] = Table(
+    "engine_benchmark",
+    MetaData(),
+    Column("id", Integer, primary_key=True, autoincrement=True),
+    Column("writer", Integer, nullable=False, index=True),
+    Column("payload", String(64), nullable=False),
+)
+
+
+@dataclass(frozen=True)
+class EngineBenchmarkResult:
+    name: str
+    transactions: int
+    failures: int
+    seconds: float
+
+    @property
+    def throughput(self) -> float:
+        return self.transactions / self.seconds if self.seconds else 0.0
+
+
+class EngineBenchmark:
+    """Runs concurrent short write transactions, each followed by a read."""
+
+    def __init__(self, concurrency: int, transactions: int) -> None:
+        self._concurrency = concurrency
+        self._transactions = transactions
+
+    async def run(self, name: str, engine: AsyncEngine) -> EngineBenchmarkResult:
+        async with engine.begin() as connection:
+            await connection.run_sync(_BENCHMARK_TABLE.create, checkfirst=True)
+
+        try:
+            started = perf_counter()
+            failures = await asyncio.gather(
+                *(self._write(engine, writer) for writer in range(self._concurrency))
+            )
+            seconds = perf_counter() - started
+        finally:
+            async with engine.begin() as connection:
+                await connection.run_sync(_BENCHMARK_TABLE.drop, checkfirst=True)
+
+        return EngineBenchmarkResult(
+            name=name,
+            transactions=self._concurrency * self._transactions - sum(failures),
+            failures=sum(failures),
+            seconds=seconds,
+        )
+
+    async def _write(self, engine: AsyncEngine, writer: int) -> int:
+        failures = 0
+        count = (
+            select(func.count())
+            .select_from(_BENCHMARK_TABLE)
+            .where(_BENCHMARK_TABLE.c.writer == writer)
+        )
+
+        for number in range(self._transactions):
+            try:
+                async with engine.begin() as connection:
+                    await connection.execute(
+                        insert(_BENCHMARK_TABLE).values(
+                            writer=writer, payload=f"{writer}:{number}"
+                        )
+                    )
+                    await connection.scalar(count)
+            except DBAPIError:
+                failures += 1
+
+        return failures
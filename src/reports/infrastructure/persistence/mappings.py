@@ -3,8 +3,12 @@ from sqlalchemy.orm import composite
 from reports.domain.media.media import ReportMedia
 from reports.domain.media.value_objects import MediaMetadata
 from reports.domain.report.report import DeviceReport
+from reports.infrastructure.persistence.adapters.sql_device_snapshot_gateway import (
+    DeviceSnapshot,
+)
 from reports.infrastructure.persistence.sql_tables import (
     DEVICE_REPORT_TABLE,
+    DEVICE_SNAPSHOT_TABLE,
     MAPPER_REGISTRY,
     REPORT_MEDIA_TABLE,
 )
@@ -44,6 +48,11 @@ def map_report_media_table() -> None:
     )
 
 
+def map_device_snapshot_table() -> None:
+    MAPPER_REGISTRY.map_imperatively(DeviceSnapshot, DEVICE_SNAPSHOT_TABLE)
+
+
 def map_tables() -> None:
     map_device_report_table()
     map_report_media_table()
+    map_device_snapshot_table()
@@ -0,0 +1,231 @@
+import re
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from typing import Any, Final
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, AsyncSession
+from uuid_extensions import uuid7
+
+from reports.application.models.media import FileName, PresignedUrl
+from reports.application.models.pagination import Pagination, encode_cursor
+from reports.application.models.report import ReportFilters
+from reports.application.ports.media_gateway import ObjectMediaGateway
+from reports.domain.types import DeviceId, DeviceType, ReportId, UserId
+from reports.infrastructure.events import DomainEvents
+from reports.infrastructure.persistence.adapters.sql_device_snapshot_gateway import (
+    SqlDeviceSnapshotGateway,
+)
+from reports.infrastructure.persistence.adapters.sql_media_gateway import (
+    SqlMediaGateway,
+)
+from reports.infrastructure.persistence.adapters.sql_media_repository import (
+    SqlMediaRepository,
+)
+from reports.infrastructure.persistence.adapters.sql_report_gateway import (
+    SqlReportGateway,
+)
+from reports.infrastructure.persistence.adapters.sql_report_repository import (
+    SqlReportRepository,
+)
+from reports.infrastructure.utc_time_provider import UtcTimeProvider
+
+type _Probe = Callable[[AsyncSession], Awaitable[object]]
+
+_SQLITE_FULL_SCAN: Final[re.Pattern[str]] = re.compile(r"^SCAN \w+|\bUSE TEMP B-TREE\b")
+_POSTGRES_FULL_SCAN: Final[re.Pattern[str]] = re.compile(r"\bSeq Scan on\b|\bSort  \(")
+# Unfiltered listings walk the primary key in order and stop at the page size,
+# any other scan or sort in their plans is still flagged.
+_PRIMARY_KEY_SCAN_PROBES: Final[frozenset[str]] = frozenset(
+    {"SqlReportGateway.load_many", "SqlReportGateway.stream"}
+)
+_SQLITE_PRIMARY_KEY_SCAN: Final[re.Pattern[str]] = re.compile(
+    r"^SCAN report_view USING (?:COVERING )?INDEX sqlite_autoindex_report_view_1$"
+)
+_POSTGRES_PRIMARY_KEY_SCAN: Final[re.Pattern[str]] = re.compile(
+    r"\bIndex (?:Only )?Scan (?:Backward )?using report_view_pkey on report_view\b"
+)
+
+
+@dataclass(frozen=True)
+class QueryPlan:
+    probe: str
+    statement: str
+    plan: list[str]
+    full_scans: list[str] = field(default_factory=list)
+
+
+class _UnsignedObjectMediaGateway(ObjectMediaGateway):
+    async def save(self, file_name: FileName, file: bytes) -> None:
+        pass
+
+    async def get(self, file_name: FileName) -> PresignedUrl:
+        return PresignedUrl("")
+
+    async def delete(self, file_name: FileName) -> None:
+        pass
+
+    async def get_many(
+        self, file_names: Iterable[FileName]
+    ) -> dict[FileName, PresignedUrl]:
+        return dict.fromkeys(file_names, PresignedUrl(""))
+
+
+class QueryPlanChecker:
+    def __init__(self, engine: AsyncEngine) -> None:
+        self._engine = engine
+
+    async def check(self) -> list[QueryPlan]:
+        plans: list[QueryPlan] = []
+
+        async with self._engine.connect() as connection:
+            if self._is_postgres:
+                # Tiny tables always plan as sequential scans, so only flag
+                # statements that have no index path at all.
+                await connection.exec_driver_sql("SET enable_seqscan = off")
+
+            for probe_name, probe in self._probes():
+                for statement, parameters in await self._capture(connection, probe):
+                    plans.append(
+                        await self._explain(connection, probe_name, statement, parameters)
+                    )
+
+            await connection.rollback()
+
+        return plans
+
+    @property
+    def _is_postgres(self) -> bool:
+        return self._engine.dialect.name == "postgresql"
+
+    def _probes(self) -> list[tuple[str, _Probe]]:
+        report_id = ReportId(uuid7())
+        device_id = DeviceId(1)
+        month_ago = datetime.now(UTC) - timedelta(days=30)
+        object_media_gateway = _UnsignedObjectMediaGateway()
+
+        def load_many(pagination: Pagination, filters: ReportFilters) -> _Probe:
+            return lambda session: SqlReportGateway(
+                session, object_media_gateway
+            ).load_many(pagination, filters)
+
+        async def stream(session: AsyncSession) -> None:
+            gateway = SqlReportGateway(session, object_media_gateway)
+
+            async for _ in gateway.stream(
+                ReportFilters(), batch_size=100, with_media_urls=False
+            ):
+                pass
+
+        return [
+            ("SqlReportGateway.load_many", load_many(Pagination(), ReportFilters())),
+            (
+                "SqlReportGateway.load_many(cursor)",
+                load_many(Pagination(cursor=encode_cursor(report_id)), ReportFilters()),
+            ),
+            (
+                "SqlReportGateway.load_many(device)",
+                load_many(Pagination(), ReportFilters(device_id=device_id)),
+            ),
+            (
+                "SqlReportGateway.load_many(device_type)",
+                load_many(
+                    Pagination(), ReportFilters(device_type=DeviceType("Computer"))
+                ),
+            ),
+            (
+                "SqlReportGateway.load_many(creator)",
+                load_many(
+                    Pagination(),
+                    ReportFilters(creator_id=UserId(uuid7()), created_from=month_ago),
+                ),
+            ),
+            (
+                "SqlReportGateway.load_many(created_at)",
+                load_many(Pagination(), ReportFilters(created_from=month_ago)),
+            ),
+            ("SqlReportGateway.stream", stream),
+            (
+                "SqlReportGateway.with_id",
+                lambda session: SqlReportGateway(session, object_media_gateway).with_id(
+                    report_id
+                ),
+            ),
+            (
+                "SqlMediaGateway.with_report_id",
+                lambda session: SqlMediaGateway(
+                    session, object_media_gateway
+                ).with_report_id(report_id),
+            ),
+            (
+                "SqlMediaRepository.with_report_id",
+                lambda session: SqlMediaRepository(session).with_report_id(report_id),
+            ),
+            (
+                "SqlReportRepository.with_device_id",
+                lambda session: SqlReportRepository(
+                    session, DomainEvents()
+                ).with_device_id(device_id),
+            ),
+            (
+                "SqlReportRepository.device_report_with_id",
+                lambda session: SqlReportRepository(
+                    session, DomainEvents()
+                ).device_report_with_id(report_id),
+            ),
+            (
+                "SqlDeviceSnapshotGateway.with_report_id",
+                lambda session: SqlDeviceSnapshotGateway(
+                    session, UtcTimeProvider()
+                ).with_report_id(report_id),
+            ),
+        ]
+
+    async def _capture(
+        self, connection: AsyncConnection, probe: _Probe
+    ) -> list[tuple[str, Any]]:
+        statements: list[tuple[str, Any]] = []
+
+        def capture(*args: Any) -> None:
+            _, _, statement, parameters, _, _ = args
+            statements.append((statement, parameters))
+
+        event.listen(connection.sync_connection, "before_cursor_execute", capture)
+
+        try:
+            async with AsyncSession(bind=connection) as session:
+                await probe(session)
+        finally:
+            event.remove(connection.sync_connection, "before_cursor_execute", capture)
+
+        return statements
+
+    async def _explain(
+        self,
+        connection: AsyncConnection,
+        probe_name: str,
+        statement: str,
+        parameters: Any,
+    ) -> QueryPlan:
+        if self._is_postgres:
+            result = await connection.exec_driver_sql(f"EXPLAIN {statement}", parameters)
+            plan = [row[0] for row in result]
+            full_scans = [line for line in plan if _POSTGRES_FULL_SCAN.search(line)]
+            primary_key_scan = _POSTGRES_PRIMARY_KEY_SCAN
+        else:
+            result = await connection.exec_driver_sql(
+                f"EXPLAIN QUERY PLAN {statement}", parameters
+            )
+            plan = [row[-1] for row in result]
+            full_scans = [line for line in plan if _SQLITE_FULL_SCAN.search(line)]
+            primary_key_scan = _SQLITE_PRIMARY_KEY_SCAN
+
+        if probe_name in _PRIMARY_KEY_SCAN_PROBES:
+            full_scans = [
+                line for line in full_scans if not primary_key_scan.search(line)
+            ]
+
+        return QueryPlan(
+            probe=probe_name, statement=statement, plan=plan, full_scans=full_scans
+        )
@@ -0,0 +1,161 @@
+from typing import Any, Final
+
+from bazario.asyncio import NotificationHandler
+from sqlalchemy import Row, delete, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+
+from reports.application.models.media import build_file_name
+from reports.domain.media.events import ReportMediaDeleted, ReportMediaGenerated
+from reports.domain.report.events import (
+    DeviceReportCreated,
+    ReportCommentChanged,
+    ReportDeleted,
+    ReportNameChanged,
+)
+from reports.domain.types import ReportId
+from reports.infrastructure.persistence.sql_tables import (
+    DEVICE_REPORT_TABLE,
+    REPORT_MEDIA_TABLE,
+    REPORT_VIEW_TABLE,
+)
+
+_FILL_BATCH_SIZE: Final[int] = 1000
+_NO_MEDIA: dict[str, Any] = {
+    "media_id": None,
+    "media_uploaded_at": None,
+    "media_uploaded_by": None,
+    "media_file_size": None,
+    "media_content_type": None,
+    "media_file_name": None,
+}
+
+
+class ProjectReportViewHandler[
+    E: (
+        DeviceReportCreated,
+        ReportNameChanged,
+        ReportCommentChanged,
+        ReportDeleted,
+        ReportMediaGenerated,
+        ReportMediaDeleted,
+    )
+](NotificationHandler[E]):
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def handle(self, notification: E) -> None:
+        view = REPORT_VIEW_TABLE
+
+        match notification:
+            case DeviceReportCreated():
+                await self._session.execute(
+                    insert(view).values(
+                        report_id=notification.report_id,
+                        report_name=notification.report_name,
+                        creator_id=notification.creator_id,
+                        comment=notification.comment,
+                        created_at=notification.created_at,
+                        device_id=notification.device_id,
+                        device_type=notification.device_type,
+                        **_NO_MEDIA,
+                    )
+                )
+            case ReportNameChanged():
+                await self._update(
+                    notification.report_id, report_name=notification.report_name
+                )
+            case ReportCommentChanged():
+                await self._update(notification.report_id, comment=notification.comment)
+            case ReportDeleted():
+                await self._session.execute(
+                    delete(view).where(view.c.report_id == notification.report_id)
+                )
+            case ReportMediaGenerated():
+                await self._update(
+                    notification.report_id,
+                    media_id=notification.media_id,
+                    media_uploaded_at=notification.uploaded_at,
+                    media_uploaded_by=notification.uploaded_by,
+                    media_file_size=notification.metadata.file_size,
+                    media_content_type=notification.metadata.content_type,
+                    media_file_name=build_file_name(
+                        content_type=notification.metadata.content_type,
+                        media_id=notification.media_id,
+                    ),
+                )
+            case ReportMediaDeleted():
+                await self._session.execute(
+                    update(view)
+                    .where(
+                        view.c.report_id == notification.report_id,
+                        view.c.media_id == notification.media_id,
+                    )
+                    .values(**_NO_MEDIA)
+                )
+
+    async def _update(self, report_id: ReportId, **values: Any) -> None:
+        await self._session.execute(
+            update(REPORT_VIEW_TABLE)
+            .where(REPORT_VIEW_TABLE.c.report_id == report_id)
+            .values(**values)
+        )
+
+
+def _view_row(row: Row) -> dict[str, Any]:
+    values = {
+        "report_id": row.report_id,
+        "report_name": row.report_name,
+        "creator_id": row.creator_id,
+        "comment": row.comment,
+        "created_at": row.created_at,
+        "device_id": row.device_id,
+        "device_type": row.device_type,
+        **_NO_MEDIA,
+    }
+
+    if row.media_id:
+        values.update(
+            media_id=row.media_id,
+            media_uploaded_at=row.uploaded_at,
+            media_uploaded_by=row.uploaded_by,
+            media_file_size=row.file_size,
+            media_content_type=row.content_type,
+            media_file_name=build_file_name(
+                content_type=row.content_type, media_id=row.media_id
+            ),
+        )
+
+    return values
+
+
+async def fill_report_view(connection: AsyncConnection) -> int:
+    stmt = (
+        select(
+            DEVICE_REPORT_TABLE,
+            REPORT_MEDIA_TABLE.c.media_id,
+            REPORT_MEDIA_TABLE.c.uploaded_at,
+            REPORT_MEDIA_TABLE.c.uploaded_by,
+            REPORT_MEDIA_TABLE.c.file_size,
+            REPORT_MEDIA_TABLE.c.content_type,
+        )
+        .join(
+            REPORT_MEDIA_TABLE,
+            REPORT_MEDIA_TABLE.c.report_id == DEVICE_REPORT_TABLE.c.report_id,
+            isouter=True,
+        )
+        .execution_options(yield_per=_FILL_BATCH_SIZE)
+    )
+    count = 0
+
+    await connection.execute(delete(REPORT_VIEW_TABLE))
+
+    # The source is streamed, so only one batch of reports is held at a time.
+    result = await connection.stream(stmt)
+
+    async for rows in result.partitions():
+        await connection.execute(
+            insert(REPORT_VIEW_TABLE), [_view_row(row) for row in rows]
+        )
+        count += len(rows)
+
+    return count
@@ -1,4 +1,15 @@
-from sqlalchemy import UUID, Column, DateTime, ForeignKey, Integer, MetaData, Table, Text
+from sqlalchemy import (
+    JSON,
+    UUID,
+    Column,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    MetaData,
+    Table,
+    Text,
+)
 from sqlalchemy.orm import registry
 
 METADATA = MetaData()
@@ -15,6 +26,7 @@ DEVICE_REPORT_TABLE = Table(
     Column("created_at", DateTime(timezone=True), nullable=False),
     Column("device_id", Integer, nullable=False),
     Column("device_type", Text, nullable=False),
+    Index("ix_device_report_device_id_device_type", "device_id", "device_type"),
 )
 
 
@@ -27,4 +39,86 @@ REPORT_MEDIA_TABLE = Table(
     Column("content_type", Text, nullable=False),
     Column("report_id", ForeignKey("device_report.report_id"), nullable=False),
     Column("uploaded_by", UUID, nullable=False),
+    Index("ix_report_media_report_id", "report_id", unique=True),
+)
+
+
+DEVICE_SNAPSHOT_TABLE = Table(
+    "device_snapshot",
+    METADATA,
+    Column(
+        "report_id",
+        ForeignKey("device_report.report_id", ondelete="CASCADE"),
+        primary_key=True,
+    ),
+    Column("device_id", Integer, nullable=False),
+    Column("device_name", Text, nullable=True),
+    Column("device_inventory_number", Text, nullable=False),
+    Column("device_serial_number", Text, nullable=False),
+    Column("payload", JSON, nullable=False),
+    Column("captured_at", DateTime(timezone=True), nullable=False),
+)
+
+
+PDF_RENDER_REQUEST_TABLE = Table(
+    "pdf_render_request",
+    METADATA,
+    Column(
+        "report_id",
+        ForeignKey("device_report.report_id", ondelete="CASCADE"),
+        primary_key=True,
+    ),
+    Column("requested_at", DateTime(timezone=True), nullable=False),
+)
+
+
+REPORT_VIEW_TABLE = Table(
+    "report_view",
+    METADATA,
+    Column("report_id", UUID, primary_key=True),
+    Column("report_name", Text, nullable=False),
+    Column("creator_id", UUID, nullable=False),
+    Column("comment", Text, nullable=False),
+    Column("created_at", DateTime(timezone=True), nullable=False),
+    Column("device_id", Integer, nullable=False),
+    Column("device_type", Text, nullable=False),
+    Column("media_id", UUID, nullable=True),
+    Column("media_uploaded_at", DateTime(timezone=True), nullable=True),
+    Column("media_uploaded_by", UUID, nullable=True),
+    Column("media_file_size", Integer, nullable=True),
+    Column("media_content_type", Text, nullable=True),
+    Column("media_file_name", Text, nullable=True),
+    # Listings order by report_id, so filtered columns lead and report_id follows.
+    Index("ix_report_view_device_id_report_id", "device_id", "report_id"),
+    Index("ix_report_view_creator_id_report_id", "creator_id", "report_id"),
+    Index("ix_report_view_device_type_report_id", "device_type", "report_id"),
+)
+
+
+OUTBOX_MESSAGE_TABLE = Table(
+    "outbox_message",
+    METADATA,
+    Column("message_id", UUID, primary_key=True),
+    Column("message_kind", Text, nullable=False),
+    Column("message_name", Text, nullable=False),
+    Column("payload", JSON, nullable=False),
+    Column("created_at", DateTime(timezone=True), nullable=False),
+    Column("claimed_by", Text, nullable=True),
+    Column("claimed_at", DateTime(timezone=True), nullable=True),
+    Column("failed_at", DateTime(timezone=True), nullable=True),
+    Column("error", Text, nullable=True),
+)
+
+
+BROADCAST_MESSAGE_TABLE = Table(
+    "broadcast_message",
+    METADATA,
+    Column("message_id", Integer, primary_key=True, autoincrement=True),
+    Column("origin", Text, nullable=False),
+    Column("topic", Text, nullable=False),
+    Column("payload", JSON, nullable=False),
+    Column("created_at", DateTime(timezone=True), nullable=False),
+    Index("ix_broadcast_message_created_at", "created_at"),
+    # Pruning empties the table, and reused ids would be taken as already seen.
+    sqlite_autoincrement=True,
 )
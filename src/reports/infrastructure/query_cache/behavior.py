@@ -0,0 +1,157 @@
+from collections import Counter
+from collections.abc import Mapping
+from dataclasses import dataclass
+from hashlib import blake2b
+from types import get_original_bases
+from typing import Any, get_args
+
+from bazario.asyncio import HandleNext, PipelineBehavior
+from pydantic import TypeAdapter, ValidationError
+from structlog.stdlib import BoundLogger as Logger
+
+from reports.application.common.markers import CachedQuery, Query
+from reports.infrastructure.query_cache.cache import (
+    QueryCache,
+    QueryCacheUnavailableError,
+)
+
+
+@dataclass(frozen=True)
+class QueryCacheStatistics:
+    hits: int
+    misses: int
+    errors: int
+
+
+class QueryCacheMetrics:
+    def __init__(self) -> None:
+        self._hits: Counter[str] = Counter()
+        self._misses: Counter[str] = Counter()
+        self._errors: Counter[str] = Counter()
+
+    def hit(self, query_name: str) -> None:
+        self._hits[query_name] += 1
+
+    def miss(self, query_name: str) -> None:
+        self._misses[query_name] += 1
+
+    def error(self, query_name: str) -> None:
+        self._errors[query_name] += 1
+
+    def statistics(self) -> dict[str, QueryCacheStatistics]:
+        return {
+            query_name: QueryCacheStatistics(
+                hits=self._hits[query_name],
+                misses=self._misses[query_name],
+                errors=self._errors[query_name],
+            )
+            for query_name in self._hits | self._misses | self._errors
+        }
+
+
+class QueryCachePolicy:
+    def __init__(self, default_ttl: float, ttls: Mapping[str, float]) -> None:
+        self._default_ttl = default_ttl
+        self._ttls = ttls
+
+    def ttl(self, query_name: str) -> float:
+        return self._ttls.get(query_name, self._default_ttl)
+
+
+_QUERY_ADAPTERS: dict[type[Any], TypeAdapter[Any]] = {}
+_RESULT_ADAPTERS: dict[type[Any], TypeAdapter[Any]] = {}
+
+
+def _query_adapter(query_type: type[Any]) -> TypeAdapter[Any]:
+    if query_type not in _QUERY_ADAPTERS:
+        _QUERY_ADAPTERS[query_type] = TypeAdapter(query_type)
+
+    return _QUERY_ADAPTERS[query_type]
+
+
+def query_key(request: Query[Any]) -> str:
+    query_type = type(request)
+    digest = blake2b(
+        _query_adapter(query_type).dump_json(request), digest_size=16
+    ).hexdigest()
+
+    return f"{query_type.__name__}:{digest}"
+
+
+def _result_adapter(query_type: type[Any]) -> TypeAdapter[Any]:
+    if query_type not in _RESULT_ADAPTERS:
+        result_types = [
+            args[0] for base in get_original_bases(query_type) if (args := get_args(base))
+        ]
+        _RESULT_ADAPTERS[query_type] = TypeAdapter(result_types[0])
+
+    return _RESULT_ADAPTERS[query_type]
+
+
+class QueryCachingBehavior[Q: CachedQuery[Any], R](PipelineBehavior[Q, R]):
+    def __init__(
+        self,
+        cache: QueryCache,
+        policy: QueryCachePolicy,
+        metrics: QueryCacheMetrics,
+        logger: Logger,
+    ) -> None:
+        self._cache = cache
+        self._policy = policy
+        self._metrics = metrics
+        self._logger = logger
+
+    async def handle(self, request: Q, handle_next: HandleNext[Q, R]) -> R:
+        query_type = type(request)
+        query_name = query_type.__name__
+        ttl = self._policy.ttl(query_name)
+
+        if ttl <= 0:
+            return await handle_next(request)
+
+        result_adapter = _result_adapter(query_type)
+        key = query_key(request)
+
+        try:
+            cached = await self._cache.get(key)
+        except QueryCacheUnavailableError:
+            self._metrics.error(query_name)
+            self._logger.warning(event="query_cache_unavailable", query=query_name)
+            return await handle_next(request)
+
+        if cached is not None:
+            try:
+                result: R = result_adapter.validate_json(cached)
+            except ValidationError:
+                pass
+            else:
+                self._metrics.hit(query_name)
+                return result
+
+        self._metrics.miss(query_name)
+        tags = sorted(request.cache_tags())
+
+        try:
+            # Taken before the query runs, so that rows loaded ahead of a
+            # concurrent invalidation are not stored after it.
+            version = await self._cache.version(tags)
+        except QueryCacheUnavailableError:
+            self._metrics.error(query_name)
+            self._logger.warning(event="query_cache_unavailable", query=query_name)
+            return await handle_next(request)
+
+        result = await handle_next(request)
+
+        try:
+            await self._cache.set(
+                key=key,
+                value=result_adapter.dump_json(result),
+                ttl=ttl,
+                tags=tags,
+                version=version,
+            )
+        except QueryCacheUnavailableError:
+            self._metrics.error(query_name)
+            self._logger.warning(event="query_cache_unavailable", query=query_name)
+
+        return result
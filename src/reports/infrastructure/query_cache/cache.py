@@ -0,0 +1,135 @@
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from time import monotonic
+
+
+class QueryCacheUnavailableError(Exception): ...
+
+
+# Taken before a query runs and only compared by the cache that issued it.
+type QueryCacheVersion = tuple[int, ...]
+
+
+class QueryCache(ABC):
+    # A shared cache is invalidated once for every process that reads it.
+    shared: bool = False
+
+    @abstractmethod
+    async def get(self, key: str) -> bytes | None: ...
+    @abstractmethod
+    async def version(self, tags: Sequence[str]) -> QueryCacheVersion: ...
+    @abstractmethod
+    async def set(
+        self,
+        key: str,
+        value: bytes,
+        ttl: float,
+        tags: Sequence[str],
+        version: QueryCacheVersion,
+    ) -> None: ...
+    @abstractmethod
+    async def invalidate(self, tags: Iterable[str]) -> None: ...
+    @abstractmethod
+    async def close(self) -> None: ...
+
+
+@dataclass(frozen=True, slots=True)
+class _CachedQuery:
+    value: bytes
+    expires_at: float
+    tags: frozenset[str]
+
+
+class MemoryQueryCache(QueryCache):
+    def __init__(self, max_size: int) -> None:
+        self._max_size = max_size
+        self._entries: OrderedDict[str, _CachedQuery] = OrderedDict()
+        self._tagged: dict[str, set[str]] = {}
+        self._invalidations = 0
+        # The last invalidation of each tag, oldest first.
+        self._invalidated: OrderedDict[str, int] = OrderedDict()
+        self._forgotten = 0
+
+    async def get(self, key: str) -> bytes | None:
+        entry = self._entries.get(key)
+
+        if not entry:
+            return None
+
+        if monotonic() >= entry.expires_at:
+            self._remove(key)
+            return None
+
+        self._entries.move_to_end(key)
+
+        return entry.value
+
+    async def version(self, tags: Sequence[str]) -> QueryCacheVersion:
+        return (self._invalidations,)
+
+    async def set(
+        self,
+        key: str,
+        value: bytes,
+        ttl: float,
+        tags: Sequence[str],
+        version: QueryCacheVersion,
+    ) -> None:
+        (invalidations,) = version
+
+        # The value was loaded before one of its tags was invalidated.
+        if invalidations < self._forgotten or any(
+            self._invalidated.get(tag, 0) > invalidations for tag in tags
+        ):
+            return
+
+        self._remove(key)
+
+        entry = _CachedQuery(
+            value=value, expires_at=monotonic() + ttl, tags=frozenset(tags)
+        )
+        self._entries[key] = entry
+
+        for tag in entry.tags:
+            self._tagged.setdefault(tag, set()).add(key)
+
+        while len(self._entries) > self._max_size:
+            self._remove(next(iter(self._entries)))
+
+    async def invalidate(self, tags: Iterable[str]) -> None:
+        self._invalidations += 1
+
+        for tag in tags:
+            self._invalidated[tag] = self._invalidations
+            self._invalidated.move_to_end(tag)
+
+            for key in self._tagged.pop(tag, set()):
+                self._remove(key)
+
+        # Values loaded before a forgotten invalidation are no longer stored.
+        while len(self._invalidated) > self._max_size:
+            _, self._forgotten = self._invalidated.popitem(last=False)
+
+    async def close(self) -> None:
+        self._entries.clear()
+        self._tagged.clear()
+        self._invalidated.clear()
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+
+        if not entry:
+            return
+
+        for tag in entry.tags:
+            keys = self._tagged.get(tag)
+
+            if keys is None:
+                continue
+
+            keys.discard(key)
+
+            if not keys:
+                del self._tagged[tag]
@@ -0,0 +1,66 @@
+import asyncio
+from typing import Any
+
+from bazario.asyncio import HandleNext, PipelineBehavior
+
+from reports.application.common.markers import Query
+from reports.infrastructure.query_cache.behavior import query_key
+
+
+class _LeaderCancelledError(Exception): ...
+
+
+class QueryCoalescer:
+    def __init__(self) -> None:
+        self._in_flight: dict[str, asyncio.Future[Any]] = {}
+
+    def join(self, key: str) -> asyncio.Future[Any] | None:
+        return self._in_flight.get(key)
+
+    def lead(self, key: str) -> asyncio.Future[Any]:
+        future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+
+        return future
+
+    def finish(self, key: str, future: asyncio.Future[Any]) -> None:
+        if self._in_flight.get(key) is future:
+            del self._in_flight[key]
+
+        # Mark the exception as retrieved when nobody joined the flight.
+        if future.done() and not future.cancelled():
+            future.exception()
+
+
+class QueryCoalescingBehavior[Q: Query[Any], R](PipelineBehavior[Q, R]):
+    def __init__(self, coalescer: QueryCoalescer) -> None:
+        self._coalescer = coalescer
+
+    async def handle(self, request: Q, handle_next: HandleNext[Q, R]) -> R:
+        key = query_key(request)
+
+        while future := self._coalescer.join(key):
+            try:
+                result: R = await asyncio.shield(future)
+            except _LeaderCancelledError:
+                continue
+
+            return result
+
+        future = self._coalescer.lead(key)
+
+        try:
+            result = await handle_next(request)
+        except asyncio.CancelledError:
+            # Waiters retry with a new leader instead of being cancelled.
+            future.set_exception(_LeaderCancelledError())
+            raise
+        except Exception as error:
+            future.set_exception(error)
+            raise
+        else:
+            future.set_result(result)
+        finally:
+            self._coalescer.finish(key, future)
+
+        return result
@@ -0,0 +1,83 @@
+from typing import Final
+
+from bazario.asyncio import HandleNext, NotificationHandler, PipelineBehavior
+from structlog.stdlib import BoundLogger as Logger
+
+from reports.application.common.cache_tags import REPORT_LIST_TAG, report_tag
+from reports.application.common.markers import Command
+from reports.domain.media.events import ReportMediaDeleted, ReportMediaGenerated
+from reports.domain.report.events import (
+    DeviceReportCreated,
+    ReportCommentChanged,
+    ReportDeleted,
+    ReportNameChanged,
+)
+from reports.infrastructure.broadcast.broadcast import (
+    Broadcast,
+    BroadcastUnavailableError,
+)
+from reports.infrastructure.query_cache.cache import (
+    QueryCache,
+    QueryCacheUnavailableError,
+)
+
+QUERY_CACHE_INVALIDATION_TOPIC: Final[str] = "query-cache-invalidation"
+
+
+class QueryCacheInvalidator:
+    def __init__(self, cache: QueryCache, broadcast: Broadcast, logger: Logger) -> None:
+        self._cache = cache
+        self._broadcast = broadcast
+        self._logger = logger
+        self._tags: set[str] = set()
+
+    def add(self, *tags: str) -> None:
+        self._tags.update(tags)
+
+    async def invalidate(self) -> None:
+        tags, self._tags = self._tags, set()
+
+        if not tags:
+            return
+
+        try:
+            if self._cache.shared:
+                await self._cache.invalidate(tags)
+            else:
+                # Every process holds its own copy, this one is invalidated first.
+                await self._broadcast.publish(
+                    QUERY_CACHE_INVALIDATION_TOPIC, sorted(tags)
+                )
+        except (QueryCacheUnavailableError, BroadcastUnavailableError):
+            self._logger.warning(event="query_cache_invalidation_failed", tags=tags)
+
+
+class QueryCacheInvalidationBehavior[C: Command, R](PipelineBehavior[C, R]):
+    def __init__(self, invalidator: QueryCacheInvalidator) -> None:
+        self._invalidator = invalidator
+
+    async def handle(self, request: C, handle_next: HandleNext[C, R]) -> R:
+        response = await handle_next(request)
+
+        # Runs after the commit, a read that loaded the old rows before it is kept
+        # out of the cache by the version it took (see QueryCache.version).
+        await self._invalidator.invalidate()
+
+        return response
+
+
+class InvalidateReportQueriesHandler[
+    E: (
+        DeviceReportCreated,
+        ReportNameChanged,
+        ReportCommentChanged,
+        ReportDeleted,
+        ReportMediaGenerated,
+        ReportMediaDeleted,
+    )
+](NotificationHandler[E]):
+    def __init__(self, invalidator: QueryCacheInvalidator) -> None:
+        self._invalidator = invalidator
+
+    async def handle(self, notification: E) -> None:
+        self._invalidator.add(REPORT_LIST_TAG, report_tag(notification.report_id))
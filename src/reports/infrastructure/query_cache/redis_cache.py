@@ -0,0 +1,131 @@
+from collections.abc import Iterable, Sequence
+from typing import Final
+
+from reports.infrastructure.query_cache.cache import (
+    QueryCache,
+    QueryCacheUnavailableError,
+    QueryCacheVersion,
+)
+from reports.infrastructure.redis.connection import (
+    RedisUnavailableError,
+    RespConnection,
+    RespValue,
+)
+
+
+class RedisQueryCache(QueryCache):
+    _KEY_PREFIX: Final[str] = "reports:query:"
+    _TAG_PREFIX: Final[str] = "reports:query-tag:"
+    _GENERATION_PREFIX: Final[str] = "reports:query-generation:"
+    # Only has to outlive the queries that are running when a tag is invalidated.
+    _GENERATION_TTL: Final[str] = str(24 * 60 * 60 * 1000)
+    # Stores the value only if no tag was invalidated since its version was taken.
+    # KEYS: value key, generation keys, tag keys. ARGV: value, ttl, key, version.
+    _SET_SCRIPT: Final[str] = """
+local count = (#KEYS - 1) / 2
+for i = 1, count do
+    if (redis.call('GET', KEYS[1 + i]) or '0') ~= ARGV[3 + i] then
+        return 0
+    end
+end
+redis.call('SET', KEYS[1], ARGV[1], 'PX', ARGV[2])
+for i = 1, count do
+    redis.call('SADD', KEYS[1 + count + i], ARGV[3])
+    redis.call('PEXPIRE', KEYS[1 + count + i], ARGV[2])
+end
+return 1
+"""
+
+    shared = True
+
+    def __init__(self, connection: RespConnection) -> None:
+        self._connection = connection
+
+    async def get(self, key: str) -> bytes | None:
+        (value,) = await self._execute(("GET", self._KEY_PREFIX + key))
+
+        return value if isinstance(value, bytes) else None
+
+    async def version(self, tags: Sequence[str]) -> QueryCacheVersion:
+        if not tags:
+            return ()
+
+        (generations,) = await self._execute(
+            ("MGET", *(self._GENERATION_PREFIX + tag for tag in tags))
+        )
+
+        if not isinstance(generations, list):
+            return ()
+
+        return tuple(
+            int(generation) if isinstance(generation, bytes) else 0
+            for generation in generations
+        )
+
+    async def set(
+        self,
+        key: str,
+        value: bytes,
+        ttl: float,
+        tags: Sequence[str],
+        version: QueryCacheVersion,
+    ) -> None:
+        milliseconds = str(max(int(ttl * 1000), 1))
+        keys = [
+            self._KEY_PREFIX + key,
+            *(self._GENERATION_PREFIX + tag for tag in tags),
+            *(self._TAG_PREFIX + tag for tag in tags),
+        ]
+
+        await self._execute(
+            (
+                "EVAL",
+                self._SET_SCRIPT,
+                str(len(keys)),
+                *keys,
+                value,
+                milliseconds,
+                key,
+                *(str(generation) for generation in version),
+            )
+        )
+
+    async def invalidate(self, tags: Iterable[str]) -> None:
+        tags = list(tags)
+
+        if not tags:
+            return
+
+        tag_keys = [self._TAG_PREFIX + tag for tag in tags]
+        generation_keys = [self._GENERATION_PREFIX + tag for tag in tags]
+
+        # Generations are bumped first, so a query running now cannot store its
+        # value after the keys below are deleted.
+        commands: list[tuple[str | bytes, ...]] = []
+
+        for generation_key in generation_keys:
+            commands.append(("INCR", generation_key))
+            commands.append(("PEXPIRE", generation_key, self._GENERATION_TTL))
+
+        replies = await self._execute(
+            *commands, *(("SMEMBERS", tag_key) for tag_key in tag_keys)
+        )
+        members = replies[len(commands) :]
+        keys = {
+            self._KEY_PREFIX + key.decode()
+            for tag_members in members
+            if isinstance(tag_members, list)
+            for key in tag_members
+            if isinstance(key, bytes)
+        }
+
+        await self._execute(("DEL", *keys, *tag_keys))
+
+    async def close(self) -> None:
+        await self._connection.close()
+
+    async def _execute(self, *commands: tuple[str | bytes, ...]) -> list[RespValue]:
+        try:
+            return await self._connection.execute(*commands)
+        except RedisUnavailableError as error:
+            raise QueryCacheUnavailableError from error
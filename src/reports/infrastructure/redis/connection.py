@@ -0,0 +1,138 @@
+import asyncio
+from collections.abc import AsyncIterator
+from typing import Final
+from urllib.parse import urlsplit
+
+type RespValue = bytes | int | list[RespValue] | None
+
+
+class RespError(Exception): ...
+
+
+class RedisUnavailableError(Exception): ...
+
+
+class RespConnection:
+    _CRLF: Final[bytes] = b"\r\n"
+
+    def __init__(self, uri: str, timeout: float) -> None:
+        parts = urlsplit(uri)
+
+        self._host = parts.hostname or "localhost"
+        self._port = parts.port or 6379
+        self._password = parts.password
+        self._db = int(parts.path.lstrip("/") or 0)
+        self._timeout = timeout
+        self._reader: asyncio.StreamReader | None = None
+        self._writer: asyncio.StreamWriter | None = None
+        self._lock = asyncio.Lock()
+
+    async def execute(self, *commands: tuple[str | bytes, ...]) -> list[RespValue]:
+        async with self._lock:
+            try:
+                return await asyncio.wait_for(
+                    self._execute(commands), timeout=self._timeout
+                )
+            except (OSError, EOFError, TimeoutError, RespError) as error:
+                self._disconnect()
+                raise RedisUnavailableError from error
+            except BaseException:
+                # A half-read reply would desynchronize the next command.
+                self._disconnect()
+                raise
+
+    async def close(self) -> None:
+        async with self._lock:
+            self._disconnect()
+
+    async def subscribe(self, channel: str) -> AsyncIterator[bytes]:
+        # The connection stays in subscriber mode until the iterator is closed,
+        # so it must not be shared with execute().
+        async with self._lock:
+            try:
+                reader, writer = await asyncio.wait_for(
+                    self._connect(), timeout=self._timeout
+                )
+                writer.write(self._encode(("SUBSCRIBE", channel)))
+                await writer.drain()
+                await self._read(reader)
+
+                while True:
+                    match await self._read(reader):
+                        case [b"message", _, bytes(payload)]:
+                            yield payload
+            except (OSError, EOFError, TimeoutError, RespError) as error:
+                raise RedisUnavailableError from error
+            finally:
+                self._disconnect()
+
+    async def _execute(
+        self, commands: tuple[tuple[str | bytes, ...], ...]
+    ) -> list[RespValue]:
+        reader, writer = await self._connect()
+
+        writer.write(b"".join(self._encode(command) for command in commands))
+        await writer.drain()
+
+        return [await self._read(reader) for _ in commands]
+
+    async def _connect(self) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        if self._reader and self._writer:
+            return self._reader, self._writer
+
+        reader, writer = await asyncio.open_connection(self._host, self._port)
+        handshake: list[tuple[str | bytes, ...]] = []
+
+        if self._password:
+            handshake.append(("AUTH", self._password))
+
+        if self._db:
+            handshake.append(("SELECT", str(self._db)))
+
+        writer.write(b"".join(self._encode(command) for command in handshake))
+        await writer.drain()
+
+        for _ in handshake:
+            await self._read(reader)
+
+        self._reader, self._writer = reader, writer
+
+        return reader, writer
+
+    def _disconnect(self) -> None:
+        writer, self._reader, self._writer = self._writer, None, None
+
+        if writer:
+            writer.close()
+
+    def _encode(self, command: tuple[str | bytes, ...]) -> bytes:
+        chunks = [b"*%d\r\n" % len(command)]
+
+        for argument in command:
+            data = argument.encode() if isinstance(argument, str) else argument
+            chunks.append(b"$%d\r\n%s\r\n" % (len(data), data))
+
+        return b"".join(chunks)
+
+    async def _read(self, reader: asyncio.StreamReader) -> RespValue:
+        line = await reader.readuntil(self._CRLF)
+        prefix, payload = line[:1], line[1:-2]
+
+        if prefix == b"+":
+            return payload
+        if prefix == b"-":
+            raise RespError(payload.decode())
+        if prefix == b":":
+            return int(payload)
+        if prefix == b"$":
+            length = int(payload)
+            if length < 0:
+                return None
+            return (await reader.readexactly(length + 2))[:-2]
+        if prefix == b"*":
+            length = int(payload)
+            if length < 0:
+                return None
+            return [await self._read(reader) for _ in range(length)]
+
+        raise RespError(f"Unexpected reply {line!r}")
@@ -0,0 +1,81 @@
+import asyncio
+from collections.abc import AsyncIterator, Iterable
+from typing import Any, Final, cast
+
+from pydantic import TypeAdapter
+from structlog.stdlib import BoundLogger as Logger
+
+from reports.application.models.report_change import ReportChange, ReportChangeFilters
+from reports.application.ports.report_changes import ReportChanges
+
+REPORT_CHANGES_TOPIC: Final[str] = "report-changes"
+_CHANGES_ADAPTER: Final = TypeAdapter(list[ReportChange])
+
+
+def dump_report_changes(changes: list[ReportChange]) -> list[Any]:
+    return cast("list[Any]", _CHANGES_ADAPTER.dump_python(changes, mode="json"))
+
+
+class _Subscriber:
+    def __init__(self, filters: ReportChangeFilters, queue_size: int) -> None:
+        self.filters = filters
+        self.queue: asyncio.Queue[ReportChange | None] = asyncio.Queue(queue_size)
+
+    def matches(self, change: ReportChange) -> bool:
+        filters = self.filters
+
+        return (
+            (filters.report_id is None or filters.report_id == change.report_id)
+            and (filters.device_id is None or filters.device_id == change.device_id)
+            and (filters.device_type is None or filters.device_type == change.device_type)
+            and (filters.creator_id is None or filters.creator_id == change.creator_id)
+        )
+
+    def end(self) -> None:
+        # Pending changes are discarded so the end marker always fits.
+        while not self.queue.empty():
+            self.queue.get_nowait()
+
+        self.queue.put_nowait(None)
+
+
+class ReportChangeHub(ReportChanges):
+    def __init__(self, queue_size: int, logger: Logger) -> None:
+        self._queue_size = queue_size
+        self._logger = logger
+        self._subscribers: set[_Subscriber] = set()
+
+    async def subscribe(
+        self, filters: ReportChangeFilters
+    ) -> AsyncIterator[ReportChange]:
+        subscriber = _Subscriber(filters, self._queue_size)
+        self._subscribers.add(subscriber)
+
+        try:
+            while (change := await subscriber.queue.get()) is not None:
+                yield change
+        finally:
+            self._subscribers.discard(subscriber)
+
+    def publish(self, changes: Iterable[ReportChange]) -> None:
+        changes = list(changes)
+
+        for subscriber in list(self._subscribers):
+            try:
+                for change in changes:
+                    if subscriber.matches(change):
+                        subscriber.queue.put_nowait(change)
+            except asyncio.QueueFull:
+                # A slow consumer is cut off instead of holding back the others.
+                self._subscribers.discard(subscriber)
+                subscriber.end()
+                self._logger.warning(event="report_changes_subscriber_dropped")
+
+    async def receive(self, messages: list[Any]) -> None:
+        self.publish(_CHANGES_ADAPTER.validate_python(messages))
+
+    def close(self) -> None:
+        for subscriber in self._subscribers:
+            subscriber.end()
+
+        self._subscribers.clear()
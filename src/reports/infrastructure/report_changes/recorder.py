@@ -0,0 +1,137 @@
+from dataclasses import asdict
+
+from bazario.asyncio import HandleNext, NotificationHandler, PipelineBehavior
+from pydantic_core import to_jsonable_python
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from structlog.stdlib import BoundLogger as Logger
+
+from reports.application.common.markers import Command
+from reports.application.models.report_change import ReportChange
+from reports.domain.media.events import ReportMediaDeleted, ReportMediaGenerated
+from reports.domain.report.events import (
+    DeviceReportCreated,
+    ReportCommentChanged,
+    ReportDeleted,
+    ReportNameChanged,
+)
+from reports.domain.shared.events import DomainEvent
+from reports.domain.types import DeviceId, DeviceType, ReportId, UserId
+from reports.infrastructure.broadcast.broadcast import (
+    Broadcast,
+    BroadcastUnavailableError,
+)
+from reports.infrastructure.persistence.sql_tables import REPORT_VIEW_TABLE
+from reports.infrastructure.report_changes.hub import (
+    REPORT_CHANGES_TOPIC,
+    dump_report_changes,
+)
+
+type _ReportOwner = tuple[DeviceId | None, DeviceType | None, UserId | None]
+
+
+class ReportChangeRecorder:
+    def __init__(
+        self, broadcast: Broadcast, session: AsyncSession, logger: Logger
+    ) -> None:
+        self._broadcast = broadcast
+        self._session = session
+        self._logger = logger
+        self._owners: dict[ReportId, _ReportOwner] = {}
+        self._changes: list[ReportChange] = []
+
+    async def add(self, report_id: ReportId, event: DomainEvent) -> None:
+        device_id, device_type, creator_id = await self._owner(report_id)
+        self._changes.append(
+            ReportChange(
+                report_id=report_id,
+                event_id=event.event_id,
+                event_type=event.event_type,
+                data=to_jsonable_python(asdict(event)),
+                device_id=device_id,
+                device_type=device_type,
+                creator_id=creator_id,
+            )
+        )
+
+    def remember(
+        self,
+        report_id: ReportId,
+        device_id: DeviceId,
+        device_type: DeviceType,
+        creator_id: UserId,
+    ) -> None:
+        self._owners[report_id] = (device_id, device_type, creator_id)
+
+    async def publish(self) -> None:
+        changes, self._changes = self._changes, []
+
+        if not changes:
+            return
+
+        # Subscribers may be connected to any API process.
+        try:
+            await self._broadcast.publish(
+                REPORT_CHANGES_TOPIC, dump_report_changes(changes)
+            )
+        except BroadcastUnavailableError:
+            self._logger.warning(
+                event="report_changes_publish_failed",
+                report_ids=[change.report_id for change in changes],
+            )
+
+    async def _owner(self, report_id: ReportId) -> _ReportOwner:
+        if owner := self._owners.get(report_id):
+            return owner
+
+        view = REPORT_VIEW_TABLE
+        stmt = select(view.c.device_id, view.c.device_type, view.c.creator_id).where(
+            view.c.report_id == report_id
+        )
+        row = (await self._session.execute(stmt)).one_or_none()
+        owner = (
+            (row.device_id, row.device_type, row.creator_id)
+            if row
+            else (None, None, None)
+        )
+        self._owners[report_id] = owner
+
+        return owner
+
+
+class ReportChangePublishingBehavior[C: Command, R](PipelineBehavior[C, R]):
+    def __init__(self, recorder: ReportChangeRecorder) -> None:
+        self._recorder = recorder
+
+    async def handle(self, request: C, handle_next: HandleNext[C, R]) -> R:
+        response = await handle_next(request)
+
+        # Subscribers only hear about changes that were committed.
+        await self._recorder.publish()
+
+        return response
+
+
+class RecordReportChangeHandler[
+    E: (
+        DeviceReportCreated,
+        ReportNameChanged,
+        ReportCommentChanged,
+        ReportDeleted,
+        ReportMediaGenerated,
+        ReportMediaDeleted,
+    )
+](NotificationHandler[E]):
+    def __init__(self, recorder: ReportChangeRecorder) -> None:
+        self._recorder = recorder
+
+    async def handle(self, notification: E) -> None:
+        if isinstance(notification, DeviceReportCreated):
+            self._recorder.remember(
+                notification.report_id,
+                notification.device_id,
+                notification.device_type,
+                notification.creator_id,
+            )
+
+        await self._recorder.add(notification.report_id, notification)
@@ -2,6 +2,7 @@ from typing import cast
 
 from reports.application.common.application_error import ApplicationError, ErrorType
 from reports.application.ports.device_gateway import DeviceGateway
+from reports.application.ports.device_snapshot_gateway import DeviceSnapshotGateway
 from reports.application.ports.events import EventAdder
 from reports.application.ports.id_generator import IdGenerator
 from reports.application.ports.time_provider import TimeProvider
@@ -18,11 +19,13 @@ class ReportFactoryImlp(ReportFactory):
         id_generator: IdGenerator,
         time_provider: TimeProvider,
         device_gateway: DeviceGateway,
+        device_snapshot_gateway: DeviceSnapshotGateway,
         event_adder: EventAdder,
     ) -> None:
         self._id_generator = id_generator
         self._time_provider = time_provider
         self._device_gateway = device_gateway
+        self._device_snapshot_gateway = device_snapshot_gateway
         self._event_adder = event_adder
 
     async def create_device_report(
@@ -53,6 +56,9 @@ class ReportFactoryImlp(ReportFactory):
             device_type=device_type,
         )
 
+        self._device_snapshot_gateway.add(
+            report_id=device_report.entity_id, device=device
+        )
         self._event_adder.add(
             event=DeviceReportCreated(
                 report_id=device_report.entity_id,
@@ -61,6 +67,7 @@ class ReportFactoryImlp(ReportFactory):
                 creator_id=device_report.creator_id,
                 device_id=device_report.device_id,
                 device_type=device_report.device_type,
+                created_at=device_report.created_at,
             )
         )
 
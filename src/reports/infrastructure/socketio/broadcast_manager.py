@@ -0,0 +1,66 @@
+import asyncio
+from collections.abc import AsyncIterator
+from typing import Any
+
+from pydantic_core import to_jsonable_python
+from socketio.async_pubsub_manager import AsyncPubSubManager
+
+from reports.infrastructure.broadcast.broadcast import (
+    Broadcast,
+    BroadcastUnavailableError,
+)
+
+
+class BroadcastPubSubManager(AsyncPubSubManager):  # type: ignore[misc]
+    """Shares Socket.IO emits and room changes between processes over the broadcast."""
+
+    name = "broadcastpubsub"
+
+    def __init__(self, channel: str, *, write_only: bool = False) -> None:
+        super().__init__(channel=channel, write_only=write_only)
+        self._broadcast: Broadcast | None = None
+        self._received: asyncio.Queue[dict[str, Any]] = asyncio.Queue()
+        self._pending: list[dict[str, Any]] = []
+        self._flush: asyncio.Future[None] | None = None
+
+    def bind(self, broadcast: Broadcast) -> None:
+        # The server is built before the container that owns the broadcast.
+        self._broadcast = broadcast
+
+        if not self.write_only:
+            broadcast.subscribe(self.channel, self._receive)
+
+    async def close(self) -> None:
+        if self._flush:
+            await asyncio.shield(self._flush)
+
+    async def _publish(self, data: dict[str, Any]) -> None:
+        # Emits issued in the same loop iteration share one broadcast message.
+        self._pending.append(to_jsonable_python(data))
+
+        if self._flush is None:
+            self._flush = asyncio.ensure_future(self._flush_pending())
+
+        await asyncio.shield(self._flush)
+
+    async def _flush_pending(self) -> None:
+        await asyncio.sleep(0)
+        messages, self._pending, self._flush = self._pending, [], None
+
+        if not self._broadcast:
+            raise RuntimeError("Socket.IO manager is not bound to a broadcast")
+
+        try:
+            await self._broadcast.publish(self.channel, messages)
+        except BroadcastUnavailableError:
+            self._get_logger().warning(
+                "Dropped %d Socket.IO messages, broadcast unavailable", len(messages)
+            )
+
+    async def _receive(self, messages: list[Any]) -> None:
+        for message in messages:
+            self._received.put_nowait(message)
+
+    async def _listen(self) -> AsyncIterator[dict[str, Any]]:
+        while True:
+            yield await self._received.get()
@@ -0,0 +1,74 @@
+import asyncio
+import json
+from collections.abc import AsyncIterator
+from typing import Any, Final
+
+from socketio.async_pubsub_manager import AsyncPubSubManager
+
+from reports.infrastructure.redis.connection import (
+    RedisUnavailableError,
+    RespConnection,
+)
+
+
+class RespPubSubManager(AsyncPubSubManager):  # type: ignore[misc]
+    """Shares Socket.IO emits and room changes between processes over Redis."""
+
+    name = "resppubsub"
+    _RECONNECT_DELAY: Final[float] = 1.0
+
+    def __init__(
+        self,
+        publisher: RespConnection,
+        subscriber: RespConnection,
+        channel: str,
+        *,
+        write_only: bool = False,
+    ) -> None:
+        super().__init__(channel=channel, write_only=write_only)
+        self._publisher = publisher
+        self._subscriber = subscriber
+        self._pending: list[str] = []
+        self._flush: asyncio.Future[None] | None = None
+
+    async def close(self) -> None:
+        if self._flush:
+            await asyncio.shield(self._flush)
+
+        await self._publisher.close()
+
+    async def _publish(self, data: dict[str, Any]) -> None:
+        # Emits issued in the same loop iteration share one round trip.
+        self._pending.append(json.dumps(data, default=str))
+
+        if self._flush is None:
+            self._flush = asyncio.ensure_future(self._flush_pending())
+
+        await asyncio.shield(self._flush)
+
+    async def _flush_pending(self) -> None:
+        await asyncio.sleep(0)
+        messages, self._pending, self._flush = self._pending, [], None
+
+        try:
+            await self._publisher.execute(
+                *(("PUBLISH", self.channel, message) for message in messages)
+            )
+        except RedisUnavailableError:
+            self._get_logger().warning(
+                "Dropped %d Socket.IO messages, pub/sub unavailable", len(messages)
+            )
+
+    async def _listen(self) -> AsyncIterator[dict[str, Any]]:
+        # Messages are decoded here so the base class never unpickles payloads.
+        while True:
+            try:
+                async for payload in self._subscriber.subscribe(self.channel):
+                    try:
+                        yield json.loads(payload)
+                    except ValueError:
+                        self._get_logger().warning("Skipped malformed Socket.IO message")
+            except RedisUnavailableError:
+                self._get_logger().warning("Socket.IO pub/sub subscription lost")
+
+            await asyncio.sleep(self._RECONNECT_DELAY)
@@ -1,10 +1,9 @@
-from dataclasses import asdict
-
 from fastapi import Request, Response
-from fastapi.responses import JSONResponse
 from starlette.status import (
     HTTP_401_UNAUTHORIZED,
+    HTTP_403_FORBIDDEN,
     HTTP_404_NOT_FOUND,
+    HTTP_409_CONFLICT,
     HTTP_422_UNPROCESSABLE_ENTITY,
     HTTP_500_INTERNAL_SERVER_ERROR,
 )
@@ -13,6 +12,7 @@ from reports.application.common.application_error import (
     ApplicationError,
     ErrorType,
 )
+from reports.presentation.api.fast_json_response import FastJSONResponse
 from reports.presentation.api.response_models import ErrorData, ErrorResponse
 
 STATUS_MAP = {
@@ -20,6 +20,8 @@ STATUS_MAP = {
     ErrorType.VALIDATION_ERROR: HTTP_422_UNPROCESSABLE_ENTITY,
     ErrorType.APPLICATION_ERROR: HTTP_500_INTERNAL_SERVER_ERROR,
     ErrorType.UNAUTHORIZED: HTTP_401_UNAUTHORIZED,
+    ErrorType.FORBIDDEN: HTTP_403_FORBIDDEN,
+    ErrorType.CONFLICT: HTTP_409_CONFLICT,
 }
 
 
@@ -28,7 +30,7 @@ async def application_error_handler(_: Request, exception: ApplicationError) ->
     status_code = STATUS_MAP[exception.error_type]
     response_content = ErrorResponse(status_code, error_data)
 
-    return JSONResponse(asdict(response_content), status_code)
+    return FastJSONResponse(response_content, status_code)
 
 
 async def internal_error_handler(_: Request, exception: Exception) -> Response:
@@ -36,4 +38,4 @@ async def internal_error_handler(_: Request, exception: Exception) -> Response:
     status_code = HTTP_500_INTERNAL_SERVER_ERROR
     response_content = ErrorResponse(status_code, error_data)
 
-    return JSONResponse(asdict(response_content), status_code)
+    return FastJSONResponse(response_content, status_code)
@@ -0,0 +1,11 @@
+from typing import Any
+
+from fastapi.responses import JSONResponse
+from pydantic_core import to_json
+
+
+class FastJSONResponse(JSONResponse):
+    """Serializes dataclass read models directly, skipping response validation."""
+
+    def render(self, content: Any) -> bytes:
+        return to_json(content)
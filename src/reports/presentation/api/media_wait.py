@@ -0,0 +1,8 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class MediaWaitConfig:
+    timeout: float
+    max_wait: float
+    retry_after: int
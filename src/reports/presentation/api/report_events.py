@@ -0,0 +1,62 @@
+import asyncio
+from collections.abc import AsyncGenerator, AsyncIterator
+from contextlib import suppress
+from dataclasses import dataclass
+from typing import Final
+
+from pydantic_core import to_json
+
+from reports.application.models.report_change import ReportChange
+
+_KEEPALIVE: Final[bytes] = b": keepalive\n\n"
+# Sent when the stream is cut off, so clients reload instead of missing changes.
+_RESET: Final[bytes] = b"event: reset\ndata: {}\n\n"
+
+
+@dataclass(frozen=True)
+class ReportEventsConfig:
+    keepalive: float
+
+
+def _encode(change: ReportChange) -> bytes:
+    return b"id: %s\nevent: %s\ndata: %s\n\n" % (
+        str(change.event_id or "").encode(),
+        change.event_type.encode(),
+        to_json(change.data),
+    )
+
+
+async def encode_report_changes(
+    changes: AsyncIterator[ReportChange], keepalive: float
+) -> AsyncIterator[bytes]:
+    next_change: asyncio.Future[ReportChange] | None = None
+
+    try:
+        while True:
+            if next_change is None:
+                next_change = asyncio.ensure_future(anext(changes))
+
+            done, _ = await asyncio.wait({next_change}, timeout=keepalive)
+
+            if not done:
+                yield _KEEPALIVE
+                continue
+
+            try:
+                change = next_change.result()
+            except StopAsyncIteration:
+                break
+
+            next_change = None
+            yield _encode(change)
+
+        yield _RESET
+    finally:
+        if next_change is not None:
+            next_change.cancel()
+
+            with suppress(asyncio.CancelledError, StopAsyncIteration):
+                await next_change
+
+        if isinstance(changes, AsyncGenerator):
+            await changes.aclose()
@@ -0,0 +1,91 @@
+import csv
+from collections.abc import AsyncIterator
+from enum import StrEnum
+from io import StringIO
+from typing import Final
+
+from pydantic import TypeAdapter
+
+from reports.application.models.report import ReportReadModel
+
+_REPORT_ADAPTER: Final = TypeAdapter(ReportReadModel)
+_CSV_HEADER: Final = (
+    "report_id",
+    "report_name",
+    "comment",
+    "creator_id",
+    "created_at",
+    "device_id",
+    "device_type",
+    "media_id",
+    "media_content_type",
+    "media_file_size",
+    "media_uploaded_at",
+    "media_uploaded_by",
+    "media_presigned_url",
+)
+
+
+class ExportFormat(StrEnum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+    @property
+    def media_type(self) -> str:
+        if self is ExportFormat.CSV:
+            return "text/csv"
+
+        return "application/x-ndjson"
+
+
+def encode_reports(
+    export_format: ExportFormat, batches: AsyncIterator[list[ReportReadModel]]
+) -> AsyncIterator[bytes]:
+    if export_format is ExportFormat.CSV:
+        return _encode_csv(batches)
+
+    return _encode_ndjson(batches)
+
+
+async def _encode_ndjson(
+    batches: AsyncIterator[list[ReportReadModel]],
+) -> AsyncIterator[bytes]:
+    async for reports in batches:
+        yield b"".join(_REPORT_ADAPTER.dump_json(report) + b"\n" for report in reports)
+
+
+async def _encode_csv(
+    batches: AsyncIterator[list[ReportReadModel]],
+) -> AsyncIterator[bytes]:
+    buffer = StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(_CSV_HEADER)
+
+    async for reports in batches:
+        writer.writerows(_csv_row(report) for report in reports)
+        yield buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+
+    if buffer.tell():
+        yield buffer.getvalue().encode()
+
+
+def _csv_row(report: ReportReadModel) -> tuple[object, ...]:
+    media = report.media
+
+    return (
+        report.report_id,
+        report.report_name,
+        report.comment,
+        report.creator_id,
+        report.created_at.isoformat(),
+        report.device_id,
+        report.device_type,
+        media.media_id if media else "",
+        media.metadata.content_type if media else "",
+        media.metadata.file_size if media else "",
+        media.uploaded_at.isoformat() if media else "",
+        media.uploaded_by if media else "",
+        (media.presigned_url or "") if media else "",
+    )
@@ -11,6 +11,11 @@ class SuccessResponse[T](Response):
     result: T | None = field(default=None)
 
 
+@dataclass(frozen=True)
+class PaginatedResponse[T](SuccessResponse[T]):
+    next_cursor: str | None = field(default=None)
+
+
 @dataclass(frozen=True)
 class ErrorData[T]:
     title: str = "Error occurred"
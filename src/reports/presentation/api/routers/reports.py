@@ -1,26 +1,60 @@
+import asyncio
+from contextlib import suppress
 from typing import Annotated
 
 from bazario.asyncio import Sender
 from dishka import FromDishka
 from dishka.integrations.fastapi import inject
-from fastapi import APIRouter, Body, Depends
+from fastapi import APIRouter, Body, Depends, Query
+from fastapi.responses import StreamingResponse
 from starlette.status import (
     HTTP_200_OK,
     HTTP_201_CREATED,
+    HTTP_202_ACCEPTED,
     HTTP_401_UNAUTHORIZED,
+    HTTP_403_FORBIDDEN,
     HTTP_404_NOT_FOUND,
+    HTTP_422_UNPROCESSABLE_ENTITY,
 )
 
 from reports.application.common.application_error import ApplicationError
+from reports.application.models.media import MediaReadModel
 from reports.application.models.pagination import Pagination
-from reports.application.models.report import ReportReadModel
+from reports.application.models.report import ReportFilters, ReportReadModel
+from reports.application.models.report_change import ReportChangeFilters
+from reports.application.operations.read.export_reports import ExportReports
 from reports.application.operations.read.load_report_by_id import LoadReportById
 from reports.application.operations.read.load_reports import LoadReports
+from reports.application.operations.read.subscribe_report_changes import (
+    SubscribeReportChanges,
+)
 from reports.application.operations.write.add_report import AddDeviceReport
+from reports.application.operations.write.add_reports import (
+    AddDeviceReportResult,
+    AddDeviceReports,
+)
 from reports.application.operations.write.change_report import ChangeDeviceReport
 from reports.application.operations.write.delete_report import DeleteDeviceReport
+from reports.application.operations.write.refresh_report_device import (
+    RefreshReportDevice,
+)
+from reports.application.operations.write.request_report_media import (
+    RequestReportMedia,
+)
+from reports.application.ports.media_waiters import MediaWaiters
 from reports.domain.types import ReportId
-from reports.presentation.api.response_models import ErrorResponse, SuccessResponse
+from reports.presentation.api.fast_json_response import FastJSONResponse
+from reports.presentation.api.media_wait import MediaWaitConfig
+from reports.presentation.api.report_events import (
+    ReportEventsConfig,
+    encode_report_changes,
+)
+from reports.presentation.api.report_export import ExportFormat, encode_reports
+from reports.presentation.api.response_models import (
+    ErrorResponse,
+    PaginatedResponse,
+    SuccessResponse,
+)
 
 REPORTS_ROUTER = APIRouter(prefix="/reports", tags=["Reports"])
 
@@ -42,11 +76,29 @@ async def add_report(
     return SuccessResponse(status=HTTP_201_CREATED, result=report_id)
 
 
+@REPORTS_ROUTER.post(
+    path="/batch",
+    responses={
+        HTTP_200_OK: {"model": SuccessResponse[list[AddDeviceReportResult]]},
+        HTTP_401_UNAUTHORIZED: {"model": ErrorResponse[ApplicationError]},
+        HTTP_422_UNPROCESSABLE_ENTITY: {"model": ErrorResponse[ApplicationError]},
+    },
+    status_code=HTTP_200_OK,
+)
+@inject
+async def add_reports(
+    request: AddDeviceReports, *, sender: FromDishka[Sender]
+) -> SuccessResponse[list[AddDeviceReportResult]]:
+    results = await sender.send(request=request)
+    return SuccessResponse(status=HTTP_200_OK, result=results)
+
+
 @REPORTS_ROUTER.put(
     path="/{report_id}",
     responses={
         HTTP_200_OK: {"model": SuccessResponse[None]},
         HTTP_401_UNAUTHORIZED: {"model": ErrorResponse[ApplicationError]},
+        HTTP_403_FORBIDDEN: {"model": ErrorResponse[ApplicationError]},
         HTTP_404_NOT_FOUND: {"model": ErrorResponse[ApplicationError]},
     },
     status_code=HTTP_200_OK,
@@ -67,11 +119,30 @@ async def change_report(
     return SuccessResponse(status=HTTP_200_OK, result=None)
 
 
+@REPORTS_ROUTER.put(
+    path="/{report_id}/device",
+    responses={
+        HTTP_200_OK: {"model": SuccessResponse[None]},
+        HTTP_401_UNAUTHORIZED: {"model": ErrorResponse[ApplicationError]},
+        HTTP_403_FORBIDDEN: {"model": ErrorResponse[ApplicationError]},
+        HTTP_404_NOT_FOUND: {"model": ErrorResponse[ApplicationError]},
+    },
+    status_code=HTTP_200_OK,
+)
+@inject
+async def refresh_report_device(
+    report_id: ReportId, *, sender: FromDishka[Sender]
+) -> SuccessResponse[None]:
+    await sender.send(request=RefreshReportDevice(report_id=report_id))
+    return SuccessResponse(status=HTTP_200_OK, result=None)
+
+
 @REPORTS_ROUTER.delete(
     path="/{report_id}",
     responses={
         HTTP_200_OK: {"model": SuccessResponse[None]},
         HTTP_401_UNAUTHORIZED: {"model": ErrorResponse[ApplicationError]},
+        HTTP_403_FORBIDDEN: {"model": ErrorResponse[ApplicationError]},
         HTTP_404_NOT_FOUND: {"model": ErrorResponse[ApplicationError]},
     },
     status_code=HTTP_201_CREATED,
@@ -87,17 +158,75 @@ async def delete_report(
 @REPORTS_ROUTER.get(
     path="/",
     responses={
-        HTTP_200_OK: {"model": SuccessResponse[list[ReportReadModel]]},
+        HTTP_200_OK: {"model": PaginatedResponse[list[ReportReadModel]]},
         HTTP_401_UNAUTHORIZED: {"model": ErrorResponse[ApplicationError]},
     },
     status_code=HTTP_200_OK,
 )
 @inject
 async def load_reports(
-    pagination: Annotated[Pagination, Depends()], *, sender: FromDishka[Sender]
-) -> SuccessResponse[list[ReportReadModel]]:
-    reports = await sender.send(request=LoadReports(pagination=pagination))
-    return SuccessResponse(status=HTTP_200_OK, result=reports)
+    pagination: Annotated[Pagination, Depends()],
+    filters: Annotated[ReportFilters, Depends()],
+    *,
+    sender: FromDishka[Sender],
+) -> FastJSONResponse:
+    page = await sender.send(request=LoadReports(pagination=pagination, filters=filters))
+    return FastJSONResponse(
+        PaginatedResponse(
+            status=HTTP_200_OK, result=page.reports, next_cursor=page.next_cursor
+        )
+    )
+
+
+@REPORTS_ROUTER.get(
+    path="/export",
+    responses={
+        HTTP_200_OK: {
+            "content": {"application/x-ndjson": {}, "text/csv": {}},
+        },
+        HTTP_401_UNAUTHORIZED: {"model": ErrorResponse[ApplicationError]},
+    },
+    response_class=StreamingResponse,
+    status_code=HTTP_200_OK,
+)
+@inject
+async def export_reports(
+    filters: Annotated[ReportFilters, Depends()],
+    export_format: Annotated[ExportFormat, Query(alias="format")] = ExportFormat.NDJSON,
+    with_media_urls: bool = False,
+    *,
+    sender: FromDishka[Sender],
+) -> StreamingResponse:
+    batches = await sender.send(
+        request=ExportReports(filters=filters, with_media_urls=with_media_urls)
+    )
+    return StreamingResponse(
+        encode_reports(export_format, batches), media_type=export_format.media_type
+    )
+
+
+@REPORTS_ROUTER.get(
+    path="/events",
+    responses={
+        HTTP_200_OK: {"content": {"text/event-stream": {}}},
+        HTTP_401_UNAUTHORIZED: {"model": ErrorResponse[ApplicationError]},
+    },
+    response_class=StreamingResponse,
+    status_code=HTTP_200_OK,
+)
+@inject
+async def stream_report_events(
+    filters: Annotated[ReportChangeFilters, Depends()],
+    *,
+    sender: FromDishka[Sender],
+    config: FromDishka[ReportEventsConfig],
+) -> StreamingResponse:
+    changes = await sender.send(request=SubscribeReportChanges(filters=filters))
+    return StreamingResponse(
+        encode_report_changes(changes, config.keepalive),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 @REPORTS_ROUTER.get(
@@ -112,6 +241,49 @@ async def load_reports(
 @inject
 async def load_report_by_id(
     report_id: ReportId, *, sender: FromDishka[Sender]
-) -> SuccessResponse[ReportReadModel]:
+) -> FastJSONResponse:
     report = await sender.send(request=LoadReportById(report_id=report_id))
-    return SuccessResponse(status=HTTP_200_OK, result=report)
+    return FastJSONResponse(SuccessResponse(status=HTTP_200_OK, result=report))
+
+
+@REPORTS_ROUTER.get(
+    path="/{report_id}/media",
+    responses={
+        HTTP_200_OK: {"model": SuccessResponse[MediaReadModel]},
+        HTTP_202_ACCEPTED: {"model": SuccessResponse[None]},
+        HTTP_401_UNAUTHORIZED: {"model": ErrorResponse[ApplicationError]},
+        HTTP_404_NOT_FOUND: {"model": ErrorResponse[ApplicationError]},
+    },
+    status_code=HTTP_200_OK,
+)
+@inject
+async def load_report_media(
+    report_id: ReportId,
+    wait: Annotated[float | None, Query(ge=0)] = None,
+    *,
+    sender: FromDishka[Sender],
+    media_waiters: FromDishka[MediaWaiters],
+    wait_config: FromDishka[MediaWaitConfig],
+) -> FastJSONResponse:
+    timeout = wait_config.timeout if wait is None else min(wait, wait_config.max_wait)
+    request = RequestReportMedia(report_id=report_id)
+
+    # Watching before the first check covers media committed in between.
+    with media_waiters.watch(report_id) as watch:
+        media = await sender.send(request)
+
+        if not media and timeout > 0:
+            with suppress(TimeoutError):
+                async with asyncio.timeout(timeout):
+                    await watch.wait()
+
+            media = await sender.send(request)
+
+    if not media:
+        return FastJSONResponse(
+            SuccessResponse(status=HTTP_202_ACCEPTED, result=None),
+            status_code=HTTP_202_ACCEPTED,
+            headers={"Retry-After": str(wait_config.retry_after)},
+        )
+
+    return FastJSONResponse(SuccessResponse(status=HTTP_200_OK, result=media))
@@ -0,0 +1,70 @@
+import asyncio
+from typing import Any
+
+from click import echo, option
+from dishka import FromDishka
+from dishka.integrations.click import inject
+from sqlalchemy import event, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from reports.bootstrap.config import DatabaseConfig, build_database_engine
+from reports.infrastructure.persistence.engine_benchmark import (
+    EngineBenchmark,
+    EngineBenchmarkResult,
+)
+
+
+def _use_rollback_journal(dbapi_connection: Any, _connection_record: object) -> None:
+    dbapi_connection.cursor().execute("PRAGMA journal_mode=DELETE")
+
+
+def _default_engine(uri: str) -> AsyncEngine:
+    engine = create_async_engine(uri)
+
+    # WAL is persistent in the database file, so the baseline switches it back.
+    if make_url(uri).get_backend_name() == "sqlite":
+        event.listen(engine.sync_engine, "connect", _use_rollback_journal)
+
+    return engine
+
+
+async def _benchmark(
+    database_config: DatabaseConfig, benchmark: EngineBenchmark
+) -> list[EngineBenchmarkResult]:
+    results = []
+
+    for name, engine in (
+        ("default", _default_engine(database_config.uri)),
+        ("configured", build_database_engine(database_config)),
+    ):
+        try:
+            results.append(await benchmark.run(name, engine))
+        finally:
+            await engine.dispose()
+
+    return results
+
+
+@option("--concurrency", default=16, show_default=True, help="Concurrent writers.")
+@option("--transactions", default=100, show_default=True, help="Transactions per writer.")
+@inject
+def benchmark_engine(
+    concurrency: int,
+    transactions: int,
+    *,
+    database_config: FromDishka[DatabaseConfig],
+) -> None:
+    """Compare write throughput of the default and the configured engine.
+
+    Creates and drops an engine_benchmark table, so point DATABASE_URI at a
+    scratch database.
+    """
+    benchmark = EngineBenchmark(concurrency=concurrency, transactions=transactions)
+    results = asyncio.run(_benchmark(database_config, benchmark))
+
+    for result in results:
+        echo(
+            f"{result.name:<12} {result.throughput:>10.1f} tx/s "
+            f"{result.transactions:>7} ok {result.failures:>5} failed "
+            f"{result.seconds:>7.2f}s"
+        )
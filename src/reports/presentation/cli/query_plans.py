@@ -0,0 +1,36 @@
+import asyncio
+
+from click import ClickException, echo
+from dishka import FromDishka
+from dishka.integrations.click import inject
+
+from reports.bootstrap.config import DatabaseConfig, build_database_engine
+from reports.infrastructure.persistence.mappings import map_tables
+from reports.infrastructure.persistence.query_plans import QueryPlan, QueryPlanChecker
+
+
+async def _query_plans(database_config: DatabaseConfig) -> list[QueryPlan]:
+    engine = build_database_engine(database_config)
+
+    try:
+        return await QueryPlanChecker(engine).check()
+    finally:
+        await engine.dispose()
+
+
+@inject
+def check_query_plans(*, database_config: FromDishka[DatabaseConfig]) -> None:
+    map_tables()
+    plans = asyncio.run(_query_plans(database_config))
+
+    for plan in plans:
+        status = "FULL SCAN" if plan.full_scans else "ok"
+        echo(f"[{status}] {plan.probe}")
+
+        for line in plan.plan:
+            echo(f"    {line}")
+
+    full_scans = [plan.probe for plan in plans if plan.full_scans]
+
+    if full_scans:
+        raise ClickException(f"Full scans in: {', '.join(full_scans)}")
@@ -0,0 +1,24 @@
+import asyncio
+
+from click import echo
+from dishka import FromDishka
+from dishka.integrations.click import inject
+
+from reports.bootstrap.config import DatabaseConfig, build_database_engine
+from reports.infrastructure.persistence.report_view import fill_report_view
+
+
+async def _rebuild_report_view(database_config: DatabaseConfig) -> int:
+    engine = build_database_engine(database_config)
+
+    try:
+        async with engine.begin() as connection:
+            return await fill_report_view(connection)
+    finally:
+        await engine.dispose()
+
+
+@inject
+def rebuild_report_view(*, database_config: FromDishka[DatabaseConfig]) -> None:
+    count = asyncio.run(_rebuild_report_view(database_config))
+    echo(f"Rebuilt report_view with {count} reports")
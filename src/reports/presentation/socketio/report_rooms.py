@@ -0,0 +1,74 @@
+from typing import Any, Final
+from uuid import UUID
+
+from dishka import AsyncContainer
+from socketio import AsyncServer
+from socketio.exceptions import ConnectionRefusedError as SioConnectionRefusedError
+
+from reports.application.ports.report_gateway import ReportGateway
+from reports.domain.types import ReportId, UserId
+
+# Browsers cannot set headers on a WebSocket handshake, so the auth payload
+# may carry the user id instead of the X-User-Id header the REST API reads.
+_USER_ID_HEADER: Final[str] = "HTTP_X_USER_ID"
+_USER_ID_AUTH_KEY: Final[str] = "user_id"
+
+
+def _uuid(value: Any) -> UUID | None:
+    try:
+        return UUID(str(value))
+    except ValueError:
+        return None
+
+
+def _report_id(data: Any) -> UUID | None:
+    if isinstance(data, dict):
+        data = data.get("report_id")
+
+    return _uuid(data)
+
+
+def _user_id(environ: dict[str, Any], auth: Any) -> UUID | None:
+    if isinstance(auth, dict) and auth.get(_USER_ID_AUTH_KEY):
+        return _uuid(auth[_USER_ID_AUTH_KEY])
+
+    return _uuid(environ.get(_USER_ID_HEADER))
+
+
+def add_report_rooms(server: AsyncServer, container: AsyncContainer) -> None:
+    async def connect(sid: str, environ: dict[str, Any], auth: Any = None) -> None:
+        if (user_id := _user_id(environ, auth)) is None:
+            raise SioConnectionRefusedError("User not provided")
+
+        await server.save_session(sid, {"user_id": UserId(user_id)})
+
+    async def is_creator(user_id: UserId, report_id: ReportId) -> bool:
+        async with container() as request_container:
+            report_gateway = await request_container.get(ReportGateway)
+            report = await report_gateway.with_id(report_id=report_id)
+
+        return report is not None and report.creator_id == user_id
+
+    # Rooms are named after the report id so any process can emit to them.
+    async def join_report(sid: str, data: Any) -> bool:
+        if (report_id := _report_id(data)) is None:
+            return False
+
+        session = await server.get_session(sid)
+
+        if not await is_creator(session["user_id"], ReportId(report_id)):
+            return False
+
+        await server.enter_room(sid, str(report_id))
+        return True
+
+    async def leave_report(sid: str, data: Any) -> bool:
+        if (report_id := _report_id(data)) is None:
+            return False
+
+        await server.leave_room(sid, str(report_id))
+        return True
+
+    server.on("connect", connect)
+    server.on("join_report", join_report)
+    server.on("leave_report", leave_report)